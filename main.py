@@ -39,6 +39,8 @@ def parse_arguments() -> argparse.Namespace:
             "  %(prog)s --headless --update-all\n"
             "  %(prog)s --headless --update-all --fetch-mode details --league-id 52\n"
             "  %(prog)s --headless --csv-export --data-dir ./data\n"
+            "  %(prog)s --headless --fetch-matches --league-id 52 --last-n 3\n"
+            "  %(prog)s --headless --match-ids 11352380,11352381\n"
             "Not: --web modu kendi ConfigManager örneğini kullanır; CLI --config/--data-dir yalnızca "
             "TUI ve headless için geçerlidir (.env / DATA_DIR ile web hizalanabilir)."
         ),
@@ -69,7 +71,36 @@ def parse_arguments() -> argparse.Namespace:
         type=int,
         default=None,
         metavar="ID",
-        help="--update-all ile yalnız bu SofaScore lig ID'si (config'de kayıtlı olmalı)",
+        help="--update-all / --fetch-matches ile yalnız bu SofaScore lig ID'si (config'de kayıtlı olmalı)",
+    )
+
+    parser.add_argument(
+        "--fetch-matches",
+        action="store_true",
+        help="--league-id ile verilen ligin maç listelerini girdi istemeden çeker",
+    )
+
+    parser.add_argument(
+        "--last-n",
+        type=int,
+        default=None,
+        metavar="N",
+        help="--fetch-matches ile yalnız son N sezon (varsayılan: tüm sezonlar)",
+    )
+
+    parser.add_argument(
+        "--season-id",
+        type=int,
+        default=None,
+        metavar="ID",
+        help="--fetch-matches ile yalnız bu sezon",
+    )
+
+    parser.add_argument(
+        "--match-ids",
+        default=None,
+        metavar="IDS",
+        help="Virgülle ayrılmış maç ID'lerinin detaylarını girdi istemeden çeker",
     )
 
     parser.add_argument(
@@ -142,33 +173,54 @@ def main() -> int:
 
         if args.headless:
             logger.info("Headless modda çalışılıyor")
-            ran = False
-
-            if args.update_all:
-                logger.info(
-                    "Headless güncelleme: league_id=%s mode=%s",
-                    args.league_id,
-                    args.fetch_mode,
-                )
-                ui.run_headless_fetch(league_id=args.league_id, mode=args.fetch_mode)
-                ran = True
-
-            if args.csv_export:
-                logger.info("CSV dışa aktarma işlemi başlatılıyor")
-                ui.export_all_to_csv()
-                ran = True
-
-            if not ran:
-                logger.error(
-                    "Headless için en az biri gerekli: --update-all ve/veya --csv-export"
-                )
-                print(
-                    "Örnek: python main.py --headless --update-all\n"
-                    "        python main.py --headless --update-all --fetch-mode details --league-id 52\n"
-                    "        python main.py --headless --csv-export --data-dir ./data",
-                    file=sys.stderr,
-                )
-                return 2
+            try:
+                ran = False
+
+                if args.update_all:
+                    logger.info(
+                        "Headless güncelleme: league_id=%s mode=%s",
+                        args.league_id,
+                        args.fetch_mode,
+                    )
+                    ui.run_headless_fetch(league_id=args.league_id, mode=args.fetch_mode)
+                    ran = True
+
+                if args.fetch_matches:
+                    if args.league_id is None:
+                        logger.error("--fetch-matches için --league-id gerekli")
+                        return 2
+                    ui.match_menu.fetch_matches_for_league(
+                        league_id=args.league_id,
+                        last_n=args.last_n,
+                        season_id=args.season_id,
+                    )
+                    ran = True
+
+                if args.match_ids:
+                    ui.match_data_menu.fetch_match_details(match_ids=args.match_ids.split(","))
+                    ran = True
+
+                if args.csv_export:
+                    logger.info("CSV dışa aktarma işlemi başlatılıyor")
+                    ui.export_all_to_csv()
+                    ran = True
+
+                if not ran:
+                    logger.error(
+                        "Headless için en az biri gerekli: --update-all, --fetch-matches, "
+                        "--match-ids ve/veya --csv-export"
+                    )
+                    print(
+                        "Örnek: python main.py --headless --update-all\n"
+                        "        python main.py --headless --update-all --fetch-mode details --league-id 52\n"
+                        "        python main.py --headless --csv-export --data-dir ./data\n"
+                        "        python main.py --headless --fetch-matches --league-id 52 --last-n 3",
+                        file=sys.stderr,
+                    )
+                    return 2
+            finally:
+                # Hata ya da erken çıkışta da HTTP oturumu ve olay döngüsü kapatılır
+                ui.close()
         else:
             # Normal interaktif mod
             logger.info("İnteraktif mod başlatılıyor")
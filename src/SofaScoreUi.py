@@ -176,6 +176,13 @@ class SimpleSofaScoreUI:
             logger.error(f"Kullanıcı arayüzünde hata: {str(e)}")
             print(f"\n{COLORS['ERROR']}Hata: {str(e)}")
             input("Devam etmek için Enter'a basın...")
+        finally:
+            self.close()
+    
+    def close(self) -> None:
+        """Bekleyen ayarları yazar ve süreç boyunca açık tutulan HTTP oturumunu kapatır."""
+        self.settings_menu.flush()
+        self.match_fetcher.close()
     
     def show_league_menu(self) -> None:
         """Lig yönetimi menüsünü görüntüler."""
@@ -286,6 +293,8 @@ class SimpleSofaScoreUI:
             choice = self._submenu_screen("submenu_settings_title", SETTINGS_MENU_ITEMS, "0-5")
             
             if choice == "0":
+                # Menüde yapılan ayar değişiklikleri tek seferde kaydedilir
+                self.settings_menu.flush()
                 break
             elif choice == "1":
                 self.settings_menu.edit_config()
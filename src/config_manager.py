@@ -4,10 +4,12 @@ Lig bilgilerini okur ve yönetir.
 """
 
 import os
+import shutil
+import tempfile
 import dotenv
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set, Any
+from typing import Dict, Iterator, List, Tuple, Optional, Set, Any
 from dataclasses import dataclass
 
 from src.exceptions import ConfigError
@@ -22,6 +24,54 @@ logger = get_logger("ConfigManager")
 # Yapılandırma dizini için çevre değişkeni
 CONFIG_DIR = os.getenv("CONFIG_DIR", "config")
 
+# Mantıksal çevre değişkenlerinde "açık" sayılan değerler
+_TRUE_VALUES = frozenset(("true", "1", "yes", "y", "e", "evet"))
+
+
+def _env_bool(key: str, default: bool = False) -> bool:
+    """
+    Mantıksal bir çevre değişkenini okur.
+    
+    Args:
+        key: Değişken adı
+        default: Değişken tanımlı değilse kullanılacak değer
+        
+    Returns:
+        bool: Değer açık sayılıyorsa True
+    """
+    value = os.getenv(key)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
+
+
+def _atomic_write_lines(path: str, lines: List[str]) -> None:
+    """
+    Satırları önce aynı dizindeki geçici dosyaya yazar, sonra os.replace ile
+    hedefin yerine koyar; yazım yarıda kesilirse mevcut dosya bozulmaz.
+    
+    Args:
+        path: Hedef dosya yolu
+        lines: Yazılacak satırlar (satır sonlarıyla birlikte)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        # Mevcut dosyanın izinlerini koru
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 @dataclass
 class League:
@@ -65,6 +115,10 @@ class ConfigManager:
         # Lig ve diğer yapılandırma verilerini tut
         self.leagues: Dict[int, str] = {}
         self.leagues_by_name: Dict[str, int] = {}
+        # Lig araması için küçük harfli adlar; lig listesi değişince sıfırlanır
+        self._league_search_index: Optional[List[Tuple[int, str, str]]] = None
+        # Ada göre sıralı lig ID'leri; lig listesi değişince sıfırlanır
+        self._sorted_league_ids: Optional[List[int]] = None
         
         # Yapılandırma dizinlerini kontrol et
         self._ensure_config_dir()
@@ -123,6 +177,8 @@ class ConfigManager:
             # Önce temizle
             self.leagues.clear()
             self.leagues_by_name.clear()
+            self._league_search_index = None
+            self._sorted_league_ids = None
             
             # Ligleri metin dosyasından yükle
             self._load_leagues_from_text()
@@ -213,9 +269,7 @@ class ConfigManager:
             env_vars["LANGUAGE"] = os.getenv("LANGUAGE", "tr")
             
             # .env dosyasını yeniden yaz
-            with open(env_path, 'w', encoding='utf-8') as f:
-                for key, value in env_vars.items():
-                    f.write(f"{key}={value}\n")
+            _atomic_write_lines(env_path, [f"{key}={value}\n" for key, value in env_vars.items()])
             
             logger.info(f"Çevre değişkenleri .env dosyasına kaydedildi")
             return True
@@ -232,6 +286,18 @@ class ConfigManager:
         """
         return self.leagues.copy()
     
+    def iter_leagues(self) -> Iterator[Tuple[int, str]]:
+        """
+        Ligleri (ID, ad) çiftleri halinde tek tek üretir.
+        
+        Çağrı anındaki lig listesinin anlık görüntüsü üzerinden ilerler;
+        yineleme sırasında lig eklenip silinmesi üretimi bozmaz.
+        
+        Yields:
+            Tuple[int, str]: Lig ID'si ve adı
+        """
+        yield from tuple(self.leagues.items())
+    
     def get_league_ids(self) -> Set[int]:
         """
         Tüm lig ID'lerini döndürür.
@@ -250,6 +316,40 @@ class ConfigManager:
         """
         return set(self.leagues.values())
     
+    def sorted_league_ids(self) -> List[int]:
+        """
+        Lig ID'lerini lig adına göre sıralı döndürür.
+        
+        Returns:
+            List[int]: Ada göre sıralı lig ID'leri
+        """
+        if self._sorted_league_ids is None:
+            self._sorted_league_ids = sorted(self.leagues, key=self.leagues.__getitem__)
+        return list(self._sorted_league_ids)
+    
+    def search_leagues(self, search_term: str) -> List[Tuple[int, str]]:
+        """
+        Adında arama terimi geçen ligleri döndürür (büyük/küçük harf duyarsız).
+        
+        Args:
+            search_term: Aranacak metin
+            
+        Returns:
+            List[Tuple[int, str]]: Eşleşen (lig ID'si, lig adı) çiftleri
+        """
+        if self._league_search_index is None:
+            self._league_search_index = [
+                (league_id, league_name, league_name.lower())
+                for league_id, league_name in self.leagues.items()
+            ]
+        
+        search_term = search_term.lower()
+        return [
+            (league_id, league_name)
+            for league_id, league_name, name_lower in self._league_search_index
+            if search_term in name_lower
+        ]
+    
     def get_league_by_name(self, league_name: str) -> Optional[int]:
         """
         İsme göre lig ID'sini döndürür.
@@ -333,7 +433,7 @@ class ConfigManager:
         Returns:
             bool: Proxy kullanılacaksa True, değilse False
         """
-        return os.getenv("USE_PROXY", "false").lower() == "true"
+        return _env_bool("USE_PROXY", False)
     
     def get_proxy_url(self) -> str:
         """
@@ -351,7 +451,7 @@ class ConfigManager:
         Returns:
             bool: Renk kullanılacaksa True, değilse False
         """
-        return os.getenv("USE_COLOR", "true").lower() == "true"
+        return _env_bool("USE_COLOR", True)
     
     def get_date_format(self) -> str:
         """
@@ -362,6 +462,16 @@ class ConfigManager:
         """
         return os.getenv("DATE_FORMAT", "%Y-%m-%d %H:%M:%S")
 
+    def get_save_seasons_json(self) -> bool:
+        """
+        Sezon verilerinin veritabanına ek olarak JSON dosyası olarak da
+        dışa aktarılıp aktarılmayacağını döndürür.
+        
+        Returns:
+            bool: JSON dışa aktarımı açıksa True, değilse False
+        """
+        return _env_bool("SAVE_SEASONS_JSON", True)
+
     def get_max_concurrent(self) -> int:
         """Maksimum paralel istek sayısını döndürür."""
         try:
@@ -370,6 +480,14 @@ class ConfigManager:
             logger.warning("MAX_CONCURRENT geçersiz, varsayılan 10 kullanılacak.")
             return 10
 
+    def get_copy_workers(self) -> int:
+        """Yedekleme, geri yükleme ve veri taşımada eşzamanlı dosya kopyalama sayısını döndürür."""
+        try:
+            return max(1, int(os.getenv("COPY_WORKERS", "16")))
+        except ValueError:
+            logger.warning("COPY_WORKERS geçersiz, varsayılan 16 kullanılacak.")
+            return 16
+
     def get_wait_time_min(self) -> float:
         """İstekler arası minimum bekleme süresini döndürür."""
         try:
@@ -502,6 +620,8 @@ class ConfigManager:
             # Lig bilgilerini sakla
             self.leagues[league_id] = league_name
             self.leagues_by_name[league_name] = league_id
+            self._league_search_index = None
+            self._sorted_league_ids = None
             
             # Metin dosyasına lig ekle
             try:
@@ -600,6 +720,8 @@ class ConfigManager:
                 # Lig bilgilerini kaldır
                 del self.leagues[league_id]
                 del self.leagues_by_name[league_name]
+                self._league_search_index = None
+                self._sorted_league_ids = None
                 
                 logger.info(f"Lig kaldırıldı: {league_name} (ID: {league_id})")
                 return True
@@ -612,46 +734,74 @@ class ConfigManager:
             logger.error(f"Lig kaldırılırken beklenmeyen hata: {str(e)}")
             return False
     
-    def update_env_variable(self, key: str, value: str) -> bool:
+    @staticmethod
+    def _rewrite_env(env_path: str, updates: Dict[str, str]) -> None:
         """
-        Çevre değişkenini günceller ve .env dosyasına kaydeder.
+        .env dosyasını tek okuma ve tek yazmayla günceller.
+        
+        Yorum ve boş satırlar ile anahtarların sırası korunur; mevcut
+        anahtarlar yerinde değiştirilir, yeni anahtarlar sona eklenir.
         
         Args:
-            key: Değişken adı
-            value: Yeni değer
+            env_path: .env dosyasının yolu
+            updates: Yazılacak anahtar/değer çiftleri
+        """
+        lines: List[str] = []
+        if os.path.exists(env_path):
+            with open(env_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        
+        pending = dict(updates)
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#') or '=' not in stripped:
+                continue
+            key = stripped.split('=', 1)[0].strip()
+            if key in updates:
+                lines[i] = f"{key}={updates[key]}\n"
+                pending.pop(key, None)
+        
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += '\n'
+        lines.extend(f"{k}={v}\n" for k, v in pending.items())
+        
+        _atomic_write_lines(env_path, lines)
+    
+    def update_env_variables(self, updates: Dict[str, str]) -> bool:
+        """
+        Birden çok çevre değişkenini günceller ve .env dosyasına tek seferde kaydeder.
+        
+        Args:
+            updates: Değişken adı -> yeni değer sözlüğü
             
         Returns:
             bool: Başarılı olursa True, değilse False
         """
         try:
-            # Çevre değişkenini güncelle
-            os.environ[key] = value
+            # Çevre değişkenlerini güncelle
+            os.environ.update(updates)
             
             # .env dosyasını güncelle
-            env_path = ".env"
-            env_vars = {}
+            self._rewrite_env(".env", updates)
             
-            # Mevcut .env dosyasını oku
-            if os.path.exists(env_path):
-                with open(env_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line or line.startswith('#'):
-                            continue
-                        if '=' in line:
-                            k, v = line.split('=', 1)
-                            env_vars[k.strip()] = v.strip()
-            
-            # Değişkeni güncelle
-            env_vars[key] = value
-            
-            # .env dosyasını yeniden yaz
-            with open(env_path, 'w', encoding='utf-8') as f:
-                for k, v in env_vars.items():
-                    f.write(f"{k}={v}\n")
-            
-            logger.info(f"Çevre değişkeni güncellendi: {key}={value}")
+            logger.info(
+                "Çevre değişkenleri güncellendi: "
+                + ", ".join(f"{k}={v}" for k, v in updates.items())
+            )
             return True
         except Exception as e:
-            logger.error(f"Çevre değişkeni güncellenirken hata: {str(e)}")
-            return False
\ No newline at end of file
+            logger.error(f"Çevre değişkenleri güncellenirken hata: {str(e)}")
+            return False
+    
+    def update_env_variable(self, key: str, value: str) -> bool:
+        """
+        Çevre değişkenini günceller ve .env dosyasına kaydeder.
+        
+        Args:
+            key: Değişken adı
+            value: Yeni değer
+            
+        Returns:
+            bool: Başarılı olursa True, değilse False
+        """
+        return self.update_env_variables({key: value})
\ No newline at end of file
@@ -23,10 +23,20 @@ class I18nManager:
         # Try to load from env var first (set by ConfigManager)
         self.current_lang = os.getenv("LANGUAGE", default_lang)
         self.translations: Dict[str, Dict[str, str]] = {}
+        # Anahtar -> çözümlenmiş şablon ve argümansız çağrılar için son metin;
+        # dil ya da çeviriler değişince temizlenir
+        self._template_cache: Dict[str, Optional[str]] = {}
+        self._text_cache: Dict[str, str] = {}
         self._load_locales()
 
+    def _clear_cache(self):
+        """Drops cached templates (language or translations changed)."""
+        self._template_cache.clear()
+        self._text_cache.clear()
+
     def _load_locales(self):
         """Loads all JSON files from the locales directory."""
+        self._clear_cache()
         if not os.path.exists(self.locale_dir):
             os.makedirs(self.locale_dir, exist_ok=True)
             logger.warning(f"Locale directory created: {self.locale_dir}")
@@ -46,6 +56,7 @@ class I18nManager:
         """Sets the current language."""
         if lang_code in self.translations:
             self.current_lang = lang_code
+            self._clear_cache()
             logger.info(f"Language set to: {lang_code}")
         else:
             logger.warning(f"Language {lang_code} not found, falling back to {self.current_lang}")
@@ -53,15 +64,16 @@ class I18nManager:
             self._load_locales()
             if lang_code in self.translations:
                 self.current_lang = lang_code
+                self._clear_cache()
 
-    def t(self, key: str, **kwargs) -> str:
-        """
-        Retrieves a translated string by key.
-        Supports formatting with kwargs.
-        """
-        lang_data = self.translations.get(self.current_lang, {})
-        text = lang_data.get(key)
+    def _template(self, key: str) -> Optional[str]:
+        """Resolves the raw template for key (with fallbacks), cached per key."""
+        try:
+            return self._template_cache[key]
+        except KeyError:
+            pass
 
+        text = self.translations.get(self.current_lang, {}).get(key)
         if text is None:
             for fb in ("en", "tr"):
                 if fb == self.current_lang:
@@ -70,15 +82,33 @@ class I18nManager:
                 if text is not None:
                     break
 
+        self._template_cache[key] = text
+        return text
+
+    def t(self, key: str, **kwargs) -> str:
+        """
+        Retrieves a translated string by key.
+        Supports formatting with kwargs.
+        """
+        if not kwargs:
+            cached = self._text_cache.get(key)
+            if cached is not None:
+                return cached
+
+        text = self._template(key)
         if text is None:
             return key # Return key if translation missing
 
         try:
-            return text.format(**kwargs)
+            result = text.format(**kwargs)
         except KeyError as e:
             logger.error(f"Missing format key for '{key}': {e}")
             return text
 
+        if not kwargs:
+            self._text_cache[key] = result
+        return result
+
 # Global instance
 _i18n_instance = None
 
@@ -11,7 +11,11 @@ import time
 import random
 import datetime
 import re
-from typing import Any, Callable, Dict, List, Optional, Union, Tuple
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union, Tuple
 from pathlib import Path
 import asyncio
 import aiohttp
@@ -20,6 +24,12 @@ from collections import Counter
 import pandas as pd
 from tqdm import tqdm
 
+# orjson opsiyonel; kuruluysa büyük raporlar C kodlayıcıyla yazılır
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.config_manager import ConfigManager
 from src.utils import make_api_request, ensure_directory
 from src.season_fetcher import SeasonFetcher
@@ -52,6 +62,33 @@ DETAIL_SLICE_KEYS = (
     "incidents",
 )
 
+# Alt süreçlerde CSV dönüştürme için yeniden kullanılan fetcher örneği
+_csv_worker_fetcher: Optional["MatchDataFetcher"] = None
+
+
+def _process_league_for_csv(
+    config_path: str, data_dir: str, match_infos: List[Tuple[str, str, str]]
+) -> List[Dict[str, Any]]:
+    """
+    Bir ligin maçlarını alt süreçte CSV satırlarına dönüştürür.
+    
+    Süreçler ana süreçteki ConfigManager örneğini paylaşmadığı için her alt
+    süreç yapılandırmayı kendisi açar ve fetcher'ı sonraki ligler için saklar.
+    
+    Args:
+        config_path: Lig yapılandırma dosyasının yolu
+        data_dir: Verilerin bulunduğu ana dizin
+        match_infos: (league_name, season_name, match_id) demetleri
+        
+    Returns:
+        List[Dict[str, Any]]: İşlenmiş maç verileri
+    """
+    global _csv_worker_fetcher
+    if _csv_worker_fetcher is None or _csv_worker_fetcher.data_dir != data_dir:
+        _csv_worker_fetcher = MatchDataFetcher(ConfigManager(config_path), data_dir)
+    return _csv_worker_fetcher._process_match_infos(match_infos)
+
+
 class MatchDataFetcher:
     """SofaScore API'sinden detaylı maç verilerini çeken ve işleyen sınıf."""
 
@@ -1084,19 +1121,12 @@ class MatchDataFetcher:
                 # Log summary of found matches
                 logger.info(f"Toplam {len(match_infos)} maç CSV'ye dönüştürülüyor...")
                 
-                # Process each match
-                for league_name, season_name, match_id in tqdm(match_infos, desc="Maçlar işleniyor"):
-                    # For league directory, we may need to use the folder name or league name from data
-                    league_dir = league_name if os.path.isdir(os.path.join(self.match_details_dir, league_name)) else None
-                    season_dir = season_name if league_dir and os.path.isdir(os.path.join(self.match_details_dir, league_dir, season_name)) else None
-                    
-                    # Process the match
-                    processed = self.process_match_for_csv(
-                        match_id=match_id,
-                        league_dir=league_dir,
-                        season_dir=season_dir
-                    )
-                    
+                # Maçları lig bazında grupla; her lig ayrı bir süreçte işlenir
+                league_groups: Dict[str, List[Tuple[str, str, str]]] = {}
+                for match_info in match_infos:
+                    league_groups.setdefault(match_info[0], []).append(match_info)
+                
+                for processed in self._process_league_groups(list(league_groups.values())):
                     if processed:
                         # Add the match to the combined list
                         all_processed_matches.append(processed)
@@ -1362,12 +1392,9 @@ class MatchDataFetcher:
                         if file.endswith('.json'):
                             # Dosya adından maç ID'sini çıkar
                             match_id = os.path.splitext(file)[0]
-                            try:
-                                # Sayısal ID ise ekle
-                                if match_id.isdigit():
-                                    existing_details.add(match_id)
-                            except:
-                                continue
+                            # Sayısal ID ise ekle
+                            if match_id.isdigit():
+                                existing_details.add(match_id)
             
             # Sadece eksik detayları çek
             missing_match_ids = [match_id for match_id in match_ids if match_id not in existing_details]
@@ -1893,6 +1920,71 @@ class MatchDataFetcher:
             logger.error(traceback.format_exc())
             return None
     
+    def _process_match_infos(self, match_infos: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """
+        Taranan maçları CSV satırlarına dönüştürür.
+        
+        Args:
+            match_infos: (league_name, season_name, match_id) demetleri
+            
+        Returns:
+            List[Dict[str, Any]]: İşlenmiş maç verileri (işlenemeyenler atlanır)
+        """
+        results = []
+        for league_name, season_name, match_id in match_infos:
+            # For league directory, we may need to use the folder name or league name from data
+            league_dir = league_name if os.path.isdir(os.path.join(self.match_details_dir, league_name)) else None
+            season_dir = season_name if league_dir and os.path.isdir(os.path.join(self.match_details_dir, league_dir, season_name)) else None
+            
+            processed = self.process_match_for_csv(
+                match_id=match_id,
+                league_dir=league_dir,
+                season_dir=season_dir
+            )
+            if processed:
+                results.append(processed)
+        return results
+    
+    def _process_league_groups(self, league_groups: List[List[Tuple[str, str, str]]]) -> List[Dict[str, Any]]:
+        """
+        Lig gruplarını süreç havuzunda paralel olarak CSV satırlarına dönüştürür.
+        
+        JSON ayrıştırma ve satır oluşturma GIL'i tutan CPU işi olduğundan
+        iş parçacıkları yerine süreçler kullanılır. Alt süreçler "spawn" ile
+        başlatılır: web sunucusu gibi çok iş parçacıklı bir süreçte fork,
+        başka bir iş parçacığının tuttuğu kilitleri (ör. logging) kopyalayıp
+        alt süreci kilitleyebilir. Havuz açılamazsa gruplar mevcut süreçte
+        sırayla işlenir.
+        
+        Args:
+            league_groups: Her biri bir lige ait (league_name, season_name, match_id) listeleri
+            
+        Returns:
+            List[Dict[str, Any]]: Lig sırasını koruyan işlenmiş maç verileri
+        """
+        if len(league_groups) > 1:
+            worker = partial(_process_league_for_csv, self.config_manager.league_config_path, self.data_dir)
+            max_workers = min(len(league_groups), os.cpu_count() or 1)
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as executor:
+                    league_results = list(tqdm(
+                        executor.map(worker, league_groups),
+                        total=len(league_groups),
+                        desc="Ligler işleniyor",
+                    ))
+                return [processed for results in league_results for processed in results]
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Süreç havuzu kullanılamadı, ligler sırayla işlenecek: {str(e)}")
+        
+        return [
+            processed
+            for group in tqdm(league_groups, desc="Ligler işleniyor")
+            for processed in self._process_match_infos(group)
+        ]
+    
     def convert_all_matches_to_csv(self, match_ids: Optional[List[str]] = None, separate_by_league: bool = False) -> Union[str, List[str]]:
         """
         Tüm maçları CSV formatına dönüştürür.
@@ -1969,19 +2061,12 @@ class MatchDataFetcher:
                 # Log summary of found matches
                 logger.info(f"Toplam {len(match_infos)} maç CSV'ye dönüştürülüyor...")
                 
-                # Process each match
-                for league_name, season_name, match_id in tqdm(match_infos, desc="Maçlar işleniyor"):
-                    # For league directory, we may need to use the folder name or league name from data
-                    league_dir = league_name if os.path.isdir(os.path.join(self.match_details_dir, league_name)) else None
-                    season_dir = season_name if league_dir and os.path.isdir(os.path.join(self.match_details_dir, league_dir, season_name)) else None
-                    
-                    # Process the match
-                    processed = self.process_match_for_csv(
-                        match_id=match_id,
-                        league_dir=league_dir,
-                        season_dir=season_dir
-                    )
-                    
+                # Maçları lig bazında grupla; her lig ayrı bir süreçte işlenir
+                league_groups: Dict[str, List[Tuple[str, str, str]]] = {}
+                for match_info in match_infos:
+                    league_groups.setdefault(match_info[0], []).append(match_info)
+                
+                for processed in self._process_league_groups(list(league_groups.values())):
                     if processed:
                         # Add the match to the combined list
                         all_processed_matches.append(processed)
@@ -2142,6 +2227,31 @@ class MatchDataFetcher:
             else:
                 return ""
 
+    @staticmethod
+    def _scan_dirs(path: Union[str, Path]) -> List[os.DirEntry]:
+        """Bir dizindeki alt dizinleri, dizin okumasının döndürdüğü tür bilgisiyle listeler."""
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    
+    def _iter_match_file_records(self, season_dir: Union[str, Path]) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Bir sezon dizinindeki maçları tek tek dolaşıp eksik dosyalarını üretir.
+        
+        Her maç dizini tek bir scandir ile okunur; gerekli dosyalar için
+        ayrı ayrı stat çağrısı yapılmaz.
+        
+        Args:
+            season_dir: Sezon dizini
+            
+        Yields:
+            Tuple[str, List[str]]: Maç ID'si ve eksik dosya adları
+        """
+        for match_entry in self._scan_dirs(season_dir):
+            with os.scandir(match_entry.path) as files:
+                present = {entry.name for entry in files if entry.is_file()}
+            missing_files = [req_file for req_file in REQUIRED_FILES if req_file not in present]
+            yield match_entry.name, missing_files
+    
     def generate_file_report(self, base_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Maç dosyalarının durumunu analiz eden ve rapor üreten fonksiyon.
@@ -2160,64 +2270,72 @@ class MatchDataFetcher:
         print(f"Maç dosyaları analiz ediliyor: {base_path}")
         
         # Sonuçları başlat
-        results = {}
         missing_files_counter = Counter()
         total_matches = 0
         matches_with_all_files = 0
         league_stats = {}
         
-        # Tüm ligleri döngüyle incele
-        for league_dir in tqdm(list(base_path.iterdir()), desc="Ligler işleniyor"):
-            if not league_dir.is_dir():
-                continue
-                
-            league_name = league_dir.name
-            league_stats[league_name] = {
-                "total_matches": 0,
-                "complete_matches": 0,
-                "missing_files": Counter(),
-                "seasons": {}
-            }
-            
-            # Tüm sezonları döngüyle incele
-            for season_dir in league_dir.glob("season_*"):
-                if not season_dir.is_dir():
-                    continue
-                    
-                season_name = season_dir.name
-                league_stats[league_name]["seasons"][season_name] = {
+        # Sezon satırları her sezon bittiğinde CSV raporuna yazılır;
+        # maç bazında hiçbir kayıt bellekte tutulmaz
+        csv_file_path = os.path.join(self.processed_dir, 'match_files_report.csv')
+        with open(csv_file_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['Lig', 'Sezon', 'Toplam Maç', 'Tam Maç', 'Tamamlanma Oranı', 'Eksik Dosyalar'])
+            
+            # Tüm ligleri döngüyle incele
+            for league_entry in tqdm(self._scan_dirs(base_path), desc="Ligler işleniyor"):
+                league_name = league_entry.name
+                league_data = league_stats[league_name] = {
                     "total_matches": 0,
                     "complete_matches": 0,
-                    "missing_files": Counter()
+                    "missing_files": Counter(),
+                    "seasons": {}
                 }
                 
-                # Tüm maçları döngüyle incele
-                for match_dir in season_dir.iterdir():
-                    if not match_dir.is_dir():
+                # Tüm sezonları döngüyle incele
+                for season_entry in self._scan_dirs(league_entry.path):
+                    if not season_entry.name.startswith("season_"):
                         continue
                         
-                    match_id = match_dir.name
-                    total_matches += 1
-                    league_stats[league_name]["total_matches"] += 1
-                    league_stats[league_name]["seasons"][season_name]["total_matches"] += 1
+                    season_name = season_entry.name
+                    season_data = league_data["seasons"][season_name] = {
+                        "total_matches": 0,
+                        "complete_matches": 0,
+                        "missing_files": Counter()
+                    }
                     
-                    # Gerekli dosyaları kontrol et
-                    missing_files = []
-                    for req_file in REQUIRED_FILES:
-                        file_path = match_dir / req_file
-                        if not file_path.exists():
-                            missing_files.append(req_file)
+                    # Tüm maçları döngüyle incele
+                    for match_id, missing_files in self._iter_match_file_records(season_entry.path):
+                        total_matches += 1
+                        league_data["total_matches"] += 1
+                        season_data["total_matches"] += 1
+                        
+                        # İstatistikleri güncelle
+                        if not missing_files:
+                            matches_with_all_files += 1
+                            league_data["complete_matches"] += 1
+                            season_data["complete_matches"] += 1
+                        else:
+                            for missing_file in missing_files:
+                                missing_files_counter[missing_file] += 1
+                                league_data["missing_files"][missing_file] += 1
+                                season_data["missing_files"][missing_file] += 1
                     
-                    # İstatistikleri güncelle
-                    if not missing_files:
-                        matches_with_all_files += 1
-                        league_stats[league_name]["complete_matches"] += 1
-                        league_stats[league_name]["seasons"][season_name]["complete_matches"] += 1
-                    else:
-                        for missing_file in missing_files:
-                            missing_files_counter[missing_file] += 1
-                            league_stats[league_name]["missing_files"][missing_file] += 1
-                            league_stats[league_name]["seasons"][season_name]["missing_files"][missing_file] += 1
+                    season_total = season_data["total_matches"]
+                    season_data["completion_rate"] = round(season_data["complete_matches"] / season_total * 100, 2) if season_total > 0 else 0
+                    
+                    missing_str = "; ".join([f"{file}: {count}" for file, count in season_data['missing_files'].items()])
+                    writer.writerow([
+                        league_name,
+                        season_name,
+                        season_data['total_matches'],
+                        season_data['complete_matches'],
+                        f"{season_data['completion_rate']}%",
+                        missing_str
+                    ])
+                
+                league_total = league_data["total_matches"]
+                league_data["completion_rate"] = round(league_data["complete_matches"] / league_total * 100, 2) if league_total > 0 else 0
         
         # Genel istatistikleri hesapla
         overall_stats = {
@@ -2227,18 +2345,6 @@ class MatchDataFetcher:
             "missing_files": dict(missing_files_counter),
         }
         
-        # Her lig için tamamlanma oranını hesapla
-        for league in league_stats:
-            total = league_stats[league]["total_matches"]
-            complete = league_stats[league]["complete_matches"]
-            league_stats[league]["completion_rate"] = round(complete / total * 100, 2) if total > 0 else 0
-            
-            # Her sezon için tamamlanma oranını hesapla
-            for season in league_stats[league]["seasons"]:
-                season_total = league_stats[league]["seasons"][season]["total_matches"]
-                season_complete = league_stats[league]["seasons"][season]["complete_matches"]
-                league_stats[league]["seasons"][season]["completion_rate"] = round(season_complete / season_total * 100, 2) if season_total > 0 else 0
-        
         # Raporu ekrana yazdır
         print("=" * 80)
         print("MAÇ DOSYALARI ANALİZ RAPORU")
@@ -2270,32 +2376,18 @@ class MatchDataFetcher:
         
         # Detaylı istatistikleri JSON olarak dışa aktar
         json_file_path = os.path.join(self.processed_dir, 'match_files_stats.json')
-        with open(json_file_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'league_stats': league_stats,
-                'overall_stats': overall_stats
-            }, f, ensure_ascii=False, indent=2)
+        report = {
+            'league_stats': league_stats,
+            'overall_stats': overall_stats
+        }
+        if orjson is not None:
+            with open(json_file_path, 'wb', buffering=1 << 20) as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(json_file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
         
         print(f"\nDetaylı istatistikler '{json_file_path}' dosyasına kaydedildi")
-        
-        # CSV raporu oluştur
-        csv_file_path = os.path.join(self.processed_dir, 'match_files_report.csv')
-        with open(csv_file_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Lig', 'Sezon', 'Toplam Maç', 'Tam Maç', 'Tamamlanma Oranı', 'Eksik Dosyalar'])
-            
-            for league, league_data in league_stats.items():
-                for season, season_data in league_data['seasons'].items():
-                    missing_str = "; ".join([f"{file}: {count}" for file, count in season_data['missing_files'].items()])
-                    writer.writerow([
-                        league,
-                        season,
-                        season_data['total_matches'],
-                        season_data['complete_matches'],
-                        f"{season_data['completion_rate']}%",
-                        missing_str
-                    ])
-        
         print(f"CSV raporu '{csv_file_path}' dosyasına kaydedildi")
         
         return {
@@ -12,7 +12,7 @@ import asyncio
 import aiohttp
 import aiohttp
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from src.exceptions import ResourceNotFoundError
@@ -42,10 +42,67 @@ class MatchFetcher:
         self.matches_dir = os.path.join(data_dir, "matches")
         self.base_url = "https://www.sofascore.com/api/v1"
         
+        # Menü çağrıları arasında TLS/TCP bağlantılarını sıcak tutmak için
+        # olay döngüsü ve HTTP oturumu süreç boyunca tek kez açılır
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Any = None
+        
         # Veri dizinlerinin var olduğundan emin ol
         ensure_directory(self.data_dir)
         ensure_directory(self.matches_dir)
 
+    def _run_with_session(self, coro_fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Bir eşzamansız fonksiyonu kalıcı olay döngüsünde, paylaşılan HTTP
+        oturumuyla çalıştırır.
+        
+        Çalışan bir event loop içinden (ör. FastAPI, Jupyter) çağrılamaz;
+        bu durumda eşzamansız fonksiyon doğrudan await edilmelidir.
+        
+        Args:
+            coro_fn: ``session`` anahtar argümanı kabul eden eşzamansız fonksiyon
+            *args: Fonksiyona iletilecek konumsal argümanlar
+            **kwargs: Fonksiyona iletilecek anahtar argümanlar
+            
+        Returns:
+            Any: Fonksiyonun dönüş değeri
+        """
+        from src.utils import create_session_async
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                f"{getattr(coro_fn, '__name__', 'coroutine')} çalışan bir event loop içinden "
+                "senkron olarak çağrıldı; bunun yerine eşzamansız sürümü await edin"
+            )
+        
+        async def _runner() -> Any:
+            if self._session is None:
+                self._session = create_session_async()
+            return await coro_fn(*args, session=self._session, **kwargs)
+        
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(_runner())
+    
+    def close(self) -> None:
+        """Paylaşılan HTTP oturumunu ve olay döngüsünü kapatır."""
+        if self._loop is None:
+            return
+        try:
+            if self._session is not None:
+                self._loop.run_until_complete(self._session.close())
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        except Exception as e:
+            logger.error(f"HTTP oturumu kapatılırken hata: {str(e)}")
+        finally:
+            self._session = None
+            self._loop.close()
+            self._loop = None
+
     def _format_timestamp_for_terminal(self, timestamp: int, default_format: str = "%Y-%m-%d %H:%M:%S") -> str:
         """Terminal çıktısı için timestamp'i yapılandırılmış formata çevirir."""
         if not timestamp:
@@ -176,7 +233,12 @@ class MatchFetcher:
         return None
     
     async def fetch_all_rounds_async(
-        self, league_id: int, season_id: int, output_dir: str
+        self,
+        league_id: int,
+        season_id: int,
+        output_dir: str,
+        session: Any = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> List[Dict[str, Any]]:
         """
         Asenkron olarak bir sezonun tüm turlarındaki maçları çeker.
@@ -185,12 +247,35 @@ class MatchFetcher:
             league_id: Lig kimliği
             season_id: Sezon kimliği
             output_dir: Maç verilerinin kaydedileceği dizin
+            session: Paylaşılan HTTP oturumu (None ise yeni oturum açılır ve
+                ilerleme çubuğu gösterilir)
+            semaphore: Birden çok sezon arasında paylaşılan istek sınırlayıcısı
+                (None ise MAX_CONCURRENT ile yeni bir tane oluşturulur)
 
         Returns:
             Tüm turların maç verilerini içeren liste
         """
         from src.utils import create_session_async
 
+        if session is None:
+            async with create_session_async() as own_session:
+                return await self._fetch_all_rounds_with_session(
+                    own_session, league_id, season_id, output_dir, semaphore, show_progress=True
+                )
+        return await self._fetch_all_rounds_with_session(
+            session, league_id, season_id, output_dir, semaphore, show_progress=False
+        )
+    
+    async def _fetch_all_rounds_with_session(
+        self,
+        session: Any,
+        league_id: int,
+        season_id: int,
+        output_dir: str,
+        semaphore: Optional[asyncio.Semaphore],
+        show_progress: bool,
+    ) -> List[Dict[str, Any]]:
+        """Verilen oturumla bir sezonun tüm turlarını çeker."""
         league_name = self.config_manager.get_leagues().get(league_id, f"Bilinmeyen Lig {league_id}")
         season_name = self.season_fetcher.get_season_name(league_id, season_id)
         logger.info(f"{league_name}: {season_name} için tüm turlar asenkron çekiliyor...")
@@ -201,27 +286,27 @@ class MatchFetcher:
         
         os.makedirs(output_dir, exist_ok=True)
         
-        # curl_cffi session oluştur
-        async with create_session_async() as session:
-            # Eşzamanlı istek sayısını çevre değişkeninden al
+        # Eşzamanlı istek sayısını çevre değişkeninden al
+        if semaphore is None:
             semaphore_limit = self.config_manager.get_max_concurrent()
+            semaphore = asyncio.BoundedSemaphore(semaphore_limit)
             logger.info(f"{league_name}: {season_name} için eşzamanlı istek limiti: {semaphore_limit}")
-            
-            # Her async task için bir liste oluştur
-            tasks = []
-            for round_num in range(1, max_rounds + 1):
-                # Semaphore'u doğrudan geçiriyoruz
-                task = asyncio.create_task(
-                    self._fetch_and_save_round(
-                        semaphore_limit, session, league_id, season_id, round_num, output_dir
-                    )
+        
+        # Her async task için bir liste oluştur
+        tasks = []
+        for round_num in range(1, max_rounds + 1):
+            task = asyncio.create_task(
+                self._fetch_and_save_round(
+                    semaphore, session, league_id, season_id, round_num, output_dir
                 )
-                tasks.append(task)
-            
+            )
+            tasks.append(task)
+        
+        results = []
+        
+        if show_progress:
             # Rich Progress kullanarak işlem takibi
             progress_desc = f"[bold cyan]{league_name}[/]: [yellow]{season_name}[/] için turlar çekiliyor"
-            results = []
-            
             try:
                 with Progress(
                     SpinnerColumn(),
@@ -245,15 +330,23 @@ class MatchFetcher:
 
             except Exception as e:
                 logger.error(f"Async işlem hatası: {e}")
-            
-            # Boş olmayan sonuçları filtrele
-            valid_results = [r for r in results if r is not None]
-            logger.info(f"{league_name}: {season_name} için toplam {len(valid_results)}/{len(tasks)} tur başarıyla çekildi")
-            return valid_results
+        else:
+            # Paylaşılan oturumda birden çok sezon aynı anda çekilebilir;
+            # Rich tek bir canlı ekran desteklediği için ilerleme çubuğu gösterilmez
+            for result in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Task hatası: {result}")
+                elif result:
+                    results.append(result)
+        
+        # Boş olmayan sonuçları filtrele
+        valid_results = [r for r in results if r is not None]
+        logger.info(f"{league_name}: {season_name} için toplam {len(valid_results)}/{len(tasks)} tur başarıyla çekildi")
+        return valid_results
     
     async def _fetch_and_save_round(
         self,
-        semaphore_limit: int,
+        semaphore: asyncio.Semaphore,
         session: Any,
         league_id: int,
         season_id: int,
@@ -264,7 +357,7 @@ class MatchFetcher:
         Belirli bir turdaki maçları çeker ve kaydeder.
 
         Args:
-            semaphore_limit: Eşzamanlı istekleri sınırlamak için semaphore limiti
+            semaphore: Eşzamanlı istekleri sınırlayan semaphore
             session: HTTP oturumu
             league_id: Lig kimliği
             season_id: Sezon kimliği
@@ -295,10 +388,12 @@ class MatchFetcher:
                 # Dosya bozuksa, silip yeniden çekelim
                 os.remove(file_path)
         
-        # Semaphore kullanmadan doğrudan işlemi gerçekleştir
+        # İstek, Retry-After beklemesi dahil semaphore içinde yapılır;
+        # böylece rate limit sırasında yeni bağlantı açılmaz
         try:
             from src.utils import make_api_request_async
-            data = await make_api_request_async(session, url)
+            async with semaphore:
+                data = await make_api_request_async(session, url)
             
             # Boş veri kontrolü
             if self._is_empty_round_data(data):
@@ -358,14 +453,19 @@ class MatchFetcher:
             logger.error(f"{league_name}: Tur {round_num} çekilirken hata: {str(e)}")
             return None
     
-    # Senkron wrapper
-    def fetch_all_rounds_parallel(self, league_id, season_id, max_round=50):
-        """Paralel istekler için senkron wrapper."""
-        # Sezon dizinini oluştur
+    def _prepare_rounds_output_dir(self, league_id: int, season_id: int) -> str:
+        """Bir sezonun tur dosyalarının yazılacağı dizini oluşturur ve döndürür."""
         league_name_safe = self.config_manager.get_leagues().get(league_id, f"League_{league_id}").replace(' ', '_')
         season_name_safe = self.season_fetcher.get_season_name(league_id, season_id).replace(' ', '_').replace('/', '_')
         output_dir = os.path.join(self.matches_dir, f"{league_id}_{league_name_safe}", f"{season_id}_{season_name_safe}")
         ensure_directory(output_dir)
+        return output_dir
+    
+    # Senkron wrapper
+    def fetch_all_rounds_parallel(self, league_id, season_id, max_round=50):
+        """Paralel istekler için senkron wrapper."""
+        # Sezon dizinini oluştur
+        output_dir = self._prepare_rounds_output_dir(league_id, season_id)
         
         # max_round parametresini artık doğrudan burada kullanıyoruz
         logger.info(get_i18n().t('fetching_data_up_to_max_rounds', max_round=max_round))
@@ -690,6 +790,33 @@ class MatchFetcher:
             max_round: Maksimum hafta sayısı
             retry_count: Deneme sayısı (iç kullanım için)
             
+        Returns:
+            bool: İşlem başarılı ise True, değilse False
+        """
+        return self._run_with_session(
+            self.fetch_all_matches_for_season_async, league_id, season_id, max_round, retry_count
+        )
+    
+    async def fetch_all_matches_for_season_async(
+        self,
+        league_id: int,
+        season_id: int,
+        max_round: int = 50,
+        retry_count: int = 0,
+        session: Any = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> bool:
+        """
+        fetch_all_matches_for_season'ın asenkron sürümü.
+        
+        Args:
+            league_id: Lig ID'si
+            season_id: Sezon ID'si
+            max_round: Maksimum hafta sayısı
+            retry_count: Deneme sayısı (iç kullanım için)
+            session: Paylaşılan HTTP oturumu (None ise yeni oturum açılır)
+            semaphore: Paylaşılan istek sınırlayıcısı
+            
         Returns:
             bool: İşlem başarılı ise True, değilse False
         """
@@ -706,7 +833,11 @@ class MatchFetcher:
             logger.info(get_i18n().t('fetching_all_matches_for_league_season', league_name=league_name, season_name=season_name))
             
             # Tüm haftaları asenkron çek
-            results = self.fetch_all_rounds_for_season(league_id, season_id, max_round)
+            output_dir = self._prepare_rounds_output_dir(league_id, season_id)
+            logger.info(get_i18n().t('fetching_data_up_to_max_rounds', max_round=max_round))
+            results = await self.fetch_all_rounds_async(
+                league_id, season_id, output_dir, session=session, semaphore=semaphore
+            )
             
             if not results:
                 # Hiç sonuç bulunamadı (hepsi boş veya hata)
@@ -766,11 +897,7 @@ class MatchFetcher:
                     seasons = self.season_fetcher.get_seasons_for_league(league_id)
                     
                     # Sezonları yıla göre sırala
-                    sorted_seasons = sorted(
-                        seasons,
-                        key=lambda s: self.season_fetcher._get_sortable_year_value(s.get("year", "0")),
-                        reverse=True  # En yeni ilk
-                    )
+                    sorted_seasons = self.season_fetcher.sort_seasons_by_year(seasons)  # En yeni ilk
                     
                     # Şu anki sezonun indeksini bul
                     current_index = -1
@@ -786,7 +913,10 @@ class MatchFetcher:
                         prev_season_name = prev_season.get("name", "")
                         
                         logger.info(f"Alternatif sezon deneniyor: {prev_season_name} (ID: {prev_season_id})")
-                        return self.fetch_all_matches_for_season(league_id, prev_season_id, max_round, retry_count + 1)
+                        return await self.fetch_all_matches_for_season_async(
+                            league_id, prev_season_id, max_round, retry_count + 1,
+                            session=session, semaphore=semaphore,
+                        )
                     else:
                         logger.warning(f"Alternatif sezon bulunamadı.")
                 elif results is not None and len(results) == 0:
@@ -891,6 +1021,105 @@ class MatchFetcher:
             league_id: Lig ID'si
             season_id: Sezon ID'si (Belirtilmezse güncel sezon kullanılır)
             
+        Returns:
+            bool: İşlem başarılı ise True, değilse False
+        """
+        return self._run_with_session(self.fetch_matches_for_season_async, league_id, season_id)
+    
+    def fetch_matches_for_seasons(
+        self,
+        league_id: int,
+        season_ids: List[int],
+        on_season_done: Optional[Callable[[int, bool], None]] = None,
+    ) -> Dict[int, bool]:
+        """
+        Bir ligin birden çok sezonunu tek bir HTTP oturumu üzerinden eşzamanlı çeker.
+        
+        Args:
+            league_id: Lig ID'si
+            season_ids: Çekilecek sezon ID'leri
+            on_season_done: Her sezon bittiğinde (season_id, success) ile çağrılır
+            
+        Returns:
+            Dict[int, bool]: Sezon ID'si -> işlem başarılı mı
+        """
+        return self._run_with_session(
+            self.fetch_matches_for_seasons_async, league_id, season_ids, on_season_done
+        )
+    
+    async def fetch_matches_for_seasons_async(
+        self,
+        league_id: int,
+        season_ids: List[int],
+        on_season_done: Optional[Callable[[int, bool], None]] = None,
+        session: Any = None,
+    ) -> Dict[int, bool]:
+        """fetch_matches_for_seasons'ın asenkron sürümü."""
+        from src.utils import create_session_async
+        
+        if session is None:
+            async with create_session_async() as own_session:
+                return await self._fetch_seasons_with_session(
+                    own_session, league_id, season_ids, on_season_done
+                )
+        return await self._fetch_seasons_with_session(
+            session, league_id, season_ids, on_season_done
+        )
+    
+    async def _fetch_seasons_with_session(
+        self,
+        session: Any,
+        league_id: int,
+        season_ids: List[int],
+        on_season_done: Optional[Callable[[int, bool], None]],
+    ) -> Dict[int, bool]:
+        """Sezonları verilen oturum üzerinden eşzamanlı çeker."""
+        def _report(season_id: int, task: "asyncio.Task") -> None:
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is not None:
+                logger.error(f"Lig {league_id}, Sezon {season_id} çekilirken hata: {str(error)}")
+            if on_season_done:
+                on_season_done(season_id, error is None and bool(task.result()))
+        
+        # Tüm sezonların tur istekleri tek bir sınır altında paylaşılır;
+        # aksi halde sezon sayısı kadar katlanan istekler 429 yanıtlarını tetikler
+        semaphore = asyncio.BoundedSemaphore(self.config_manager.get_max_concurrent())
+        
+        tasks = []
+        for season_id in season_ids:
+            task = asyncio.create_task(
+                self.fetch_matches_for_season_async(
+                    league_id, season_id, session=session, semaphore=semaphore
+                )
+            )
+            task.add_done_callback(lambda t, sid=season_id: _report(sid, t))
+            tasks.append(task)
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return {
+            season_id: result is True
+            for season_id, result in zip(season_ids, results)
+        }
+    
+    async def fetch_matches_for_season_async(
+        self,
+        league_id: int,
+        season_id: int = None,
+        session: Any = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> bool:
+        """
+        fetch_matches_for_season'ın asenkron sürümü.
+        
+        Args:
+            league_id: Lig ID'si
+            season_id: Sezon ID'si (Belirtilmezse güncel sezon kullanılır)
+            session: Paylaşılan HTTP oturumu (None ise yeni oturum açılır)
+            semaphore: Paylaşılan istek sınırlayıcısı
+            
         Returns:
             bool: İşlem başarılı ise True, değilse False
         """
@@ -950,7 +1179,9 @@ class MatchFetcher:
             logger.info(get_i18n().t('local_file_not_found_trying_fetch'))
                 
             # Maçları çek
-            success = self.fetch_all_matches_for_season(league_id, season_id)
+            success = await self.fetch_all_matches_for_season_async(
+                league_id, season_id, session=session, semaphore=semaphore
+            )
             return success
             
         except Exception as e:
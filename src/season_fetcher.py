@@ -6,12 +6,17 @@ SofaScore API'sinden lig sezonlarını çeken modül.
 import os
 import csv
 import json
+import sqlite3
 import logging
 import asyncio
+import threading
 import aiohttp
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+from contextlib import closing
+from functools import lru_cache
 import datetime
+import glob
 import re
 
 from src.config_manager import ConfigManager
@@ -21,6 +26,67 @@ from src.logger import get_logger
 
 logger = get_logger("SeasonFetcher")
 
+# Sezon veritabanı şeması: lig başına sezonlar, lig ID'sine göre indeksli
+SEASONS_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    league_id INTEGER NOT NULL,
+    season_id INTEGER NOT NULL,
+    name TEXT,
+    year TEXT,
+    sort_year REAL,
+    PRIMARY KEY (league_id, season_id)
+);
+CREATE INDEX IF NOT EXISTS idx_seasons_league_id ON seasons (league_id);
+"""
+
+
+@lru_cache(maxsize=1024)
+def _sortable_year_value(year_str: str) -> float:
+    """
+    Sezon yılı dizesini sıralanabilir bir sayısal değere dönüştürür.
+    Yıl dizeleri ligler arasında sık tekrarlandığı için sonuçlar önbelleğe alınır.
+    """
+    if not year_str or year_str == '0':
+        return 0.0
+
+    # Yıl aralıklarını işle (örn. "24/25" veya "2024/2025")
+    if '/' in year_str:
+        parts = year_str.split('/')
+        start_year = parts[0].strip()
+        end_year = parts[1].strip() if len(parts) > 1 else ""
+
+        # 2 basamaklı yılları işle
+        if len(start_year) == 2 and len(end_year) == 2:
+            start_int = int(start_year)
+            end_int = int(end_year)
+
+            # Eğer ilk yıl ikinci yıldan büyükse (örn. 99/00), bu bir yüzyıl geçişidir
+            if start_int > end_int:
+                # Yüzyıl geçişi: 99/00 -> 2000 (yeni yüzyılı kullan)
+                return 2000.0 + float(end_int)
+            elif start_int < 50:
+                # 2000'ler (örn: 20/21 -> 2020)
+                return 2000.0 + float(start_int)
+            else:
+                # 1900'ler (örn: 98/99 -> 1998)
+                return 1900.0 + float(start_int)
+        # 4 basamaklı yılları işle
+        elif len(start_year) == 4:
+            return float(start_year)
+        else:
+            try:
+                # Diğer formatlar
+                return float(start_year)
+            except ValueError:
+                return 0.0
+
+    # Tek yılları işle (örn. "2024")
+    try:
+        return float(year_str)
+    except ValueError:
+        return 0.0
+
+
 class SeasonFetcher:
     """SofaScore API'sinden lig sezonlarını çeken ve yöneten sınıf."""
     
@@ -35,6 +101,7 @@ class SeasonFetcher:
         self.config_manager = config_manager
         self.data_dir = data_dir
         self.seasons_dir = os.path.join(data_dir, "seasons")
+        self.seasons_db_path = os.path.join(self.seasons_dir, "seasons.db")
         self.base_url = "https://www.sofascore.com/api/v1"
         
         # Veri dizinlerinin var olduğundan emin ol
@@ -44,6 +111,13 @@ class SeasonFetcher:
         # Sezon verilerini saklamak için sözlük
         self.league_seasons = {}
         
+        # Ligler paralel güncellenebildiğinden (ör. menüdeki iş parçacığı havuzu)
+        # veritabanı yazıları ve league_seasons güncellemesi tek yazıcıya indirilir
+        self._write_lock = threading.Lock()
+        
+        # Sezon veritabanını hazırla
+        self._init_seasons_db()
+        
         # Mevcut sezon verilerini otomatik olarak yükle
         self._load_existing_season_data()
         
@@ -71,11 +145,10 @@ class SeasonFetcher:
         
         seasons = data.get("seasons", [])
         
-        # Sezon verilerini kaydet
-        self._save_seasons_json(league_id, data)
-        
-        # Sezon verilerini global sözlüğe kaydet
-        self.league_seasons[league_id] = seasons
+        # Sezon verilerini kaydet ve global sözlüğe yaz (tek yazıcı)
+        with self._write_lock:
+            self._save_seasons_json(league_id, data)
+            self.league_seasons[league_id] = seasons
         
         logger.info(f"{league_name} için {len(seasons)} sezon bulundu")
         return seasons
@@ -96,11 +169,10 @@ class SeasonFetcher:
             
             seasons = data.get("seasons", [])
             
-            # Sezon verilerini kaydet
-            self._save_seasons_json(league_id, data)
-            
-            # Sezon verilerini global sözlüğe kaydet
-            self.league_seasons[league_id] = seasons
+            # Sezon verilerini kaydet ve global sözlüğe yaz (tek yazıcı)
+            with self._write_lock:
+                self._save_seasons_json(league_id, data)
+                self.league_seasons[league_id] = seasons
             
             logger.info(f"{league_name} için {len(seasons)} sezon bulundu")
             return league_id, seasons
@@ -145,8 +217,20 @@ class SeasonFetcher:
     
     # Senkron wrapper
     def fetch_seasons_batch(self, league_ids, max_concurrent=10):
-        """Paralel istekler için senkron wrapper."""
-        return asyncio.run(self.fetch_seasons_batch_async(league_ids, max_concurrent))
+        """
+        Paralel istekler için senkron wrapper.
+        
+        Çalışan bir event loop içinden (ör. FastAPI, Jupyter) çağrılamaz;
+        bu durumda fetch_seasons_batch_async doğrudan await edilmelidir.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_seasons_batch_async(league_ids, max_concurrent))
+        raise RuntimeError(
+            "fetch_seasons_batch çalışan bir event loop içinden çağrıldı; "
+            "bunun yerine 'await fetch_seasons_batch_async(...)' kullanın"
+        )
     
     def fetch_all_leagues_seasons(self) -> Dict[int, List[Dict[str, Any]]]:
         """
@@ -193,96 +277,65 @@ class SeasonFetcher:
         current_month = current_date.month
         
         # Sezonları yıl değerine göre sırala
-        sorted_seasons = sorted(
-            seasons, 
-            key=lambda s: self._get_sortable_year_value(s.get("year", "0")),
-            reverse=True  # En yeni sezon en üstte
-        )
+        sorted_seasons = self.sort_seasons_by_year(seasons)  # En yeni sezon en üstte
         
         # Kontrol için listeyi logla
         logger.debug(f"Lig ID {league_id} için sezonlar (sıralı): {[(s.get('id'), s.get('name', ''), s.get('year', '')) for s in sorted_seasons[:5]]}")
         
+        # Maç dizini sezondan bağımsızdır, döngü dışında bir kez hesapla
+        league_name = self.config_manager.get_league_by_id(league_id) or f"Unknown_League_{league_id}"
+        matches_dir = f"data/matches/{league_id}_{league_name.replace(' ', '_')}"
+        matches_dir_exists = os.path.isdir(matches_dir)
+        
         # Aktif veya geçmiş sezonları değerlendir
         active_seasons = []      # Aktif sezonlar (güncel yıl ve önceki yıl bazen)
         past_seasons = []        # Geçmiş sezonlar
-        future_seasons = []      # Gelecek sezonlar
         
-        # Önce tüm sezonları kategorize et
         for idx, season in enumerate(sorted_seasons):
             season_id = season.get("id")
             season_name = season.get("name", "")
-            season_year_str = season.get("year", "")
             
-            # Sezon yılını çıkar
-            season_year = None
-            if season_year_str:
-                if '/' in season_year_str:
-                    # "2024/25" veya "2024/2025" formatı
-                    start_year = season_year_str.split('/')[0].strip()
-                    if len(start_year) == 4:
-                        season_year = int(start_year)
-                    elif len(start_year) == 2:
-                        # 2 haneli yıl (örn. "24/25")
-                        season_year = 2000 + int(start_year)
-                else:
-                    # Tek yıl formatı: "2024"
-                    try:
-                        season_year = int(season_year_str)
-                    except (ValueError, TypeError):
-                        pass
-            
-            # Sezon adından yıl çıkarmaya çalış
-            if not season_year and season_name:
-                year_matches = re.findall(r'20\d\d', season_name)
-                if year_matches:
-                    try:
-                        season_year = int(year_matches[0])
-                    except (ValueError, TypeError):
-                        pass
+            # Sezon yılı, sıralamada kullanılan ayrıştırıcıyla bulunur
+            season_year = self._season_start_year(season)
             
             # Sezon tipi belirle (gelecek, aktif, geçmiş)
             if season_year:
                 if season_year > current_year:
-                    future_seasons.append(season)
+                    season_type = "future"
                 elif season_year == current_year:
-                    active_seasons.append(season)
-                elif season_year == current_year - 1:
-                    if current_month <= 6:  # Yılın ilk yarısındaysak, önceki sezon da aktif olabilir
-                        active_seasons.append(season)
-                    else:
-                        past_seasons.append(season)
+                    season_type = "active"
+                elif season_year == current_year - 1 and current_month <= 6:
+                    # Yılın ilk yarısındaysak, önceki sezon da aktif olabilir
+                    season_type = "active"
                 else:
-                    past_seasons.append(season)
+                    season_type = "past"
             else:
-                # Yıl belirlenemezse mevcut en yeni sezondur
-                if idx < 2:  # İlk iki sıradaki sezonları aktif kabul et
-                    active_seasons.append(season)
-                else:
-                    past_seasons.append(season)
+                # Yıl belirlenemezse ilk iki sıradaki sezonları aktif kabul et
+                season_type = "active" if idx < 2 else "past"
+            
+            is_active = season_type == "active"
+            if is_active:
+                active_seasons.append(season)
+            elif season_type == "past":
+                past_seasons.append(season)
             
-            logger.debug(f"Sezon {season_name} (ID: {season_id}, Yıl: {season_year_str}): Tür = {'active' if season in active_seasons else 'future' if season in future_seasons else 'past'}")
+            logger.debug(f"Sezon {season_name} (ID: {season_id}, Yıl: {season.get('year', '')}): Tür = {season_type}")
             
             # Maç dosyasının varlığını kontrol et
             season["has_matches"] = False
             season["match_count"] = 0
             
-            league_name = self.config_manager.get_league_by_id(league_id) or f"Unknown_League_{league_id}"
-            league_dir = f"{league_id}_{league_name.replace(' ', '_')}"
-            
-            # Matches dizini sabit olarak belirle
-            matches_dir = os.path.join("data/matches", league_dir)
-            match_file_pattern = f"{season_id}_{season_name.replace(' ', '_')}_round_*.json"
-            summary_json_path = os.path.join("data/matches", league_dir, f"{season_id}_{season_name.replace(' ', '_')}_summary.json")
-            
-            if os.path.exists(matches_dir):
-                import glob
-                match_files = glob.glob(os.path.join(matches_dir, match_file_pattern))
+            if matches_dir_exists:
+                season_name_safe = season_name.replace(' ', '_')
+                match_file_pattern = f"{matches_dir}/{season_id}_{season_name_safe}_round_*.json"
+                summary_json_path = f"{matches_dir}/{season_id}_{season_name_safe}_summary.json"
+                match_files = glob.glob(match_file_pattern)
                 season["match_count"] = len(match_files)
                 season["has_matches"] = season["match_count"] > 0 or os.path.exists(summary_json_path)
             
             if season["has_matches"]:
                 logger.info(f"Sezon {season_name} (ID: {season_id}) için {season['match_count']} maç dosyası bulundu")
-            elif season in active_seasons:
+            elif is_active:
                 logger.warning(f"Aktif sezon {season_name} (ID: {season_id}) için maç dosyası bulunamadı")
         
         # En iyi sezon seçimi kriterlerini uygula
@@ -311,6 +364,28 @@ class SeasonFetcher:
         logger.info(f"Aktif veya maç dosyası olan sezon bulunamadı, en yeni sezon seçildi: {selected_season.get('name')} (ID: {selected_season.get('id')})")
         return selected_season.get("id")
 
+    def _season_start_year(self, season: Dict[str, Any]) -> int:
+        """
+        Sezonun yılını sort_seasons_by_year ile aynı ayrıştırıcıyla bulur;
+        yıl alanı boş ya da anlaşılmazsa sezon adındaki ilk yıla bakar.
+        
+        Args:
+            season: Sezon verisi
+            
+        Returns:
+            int: Sezon yılı veya belirlenemezse 0
+        """
+        try:
+            season_year = int(_sortable_year_value(str(season.get("year") or "")))
+        except ValueError:
+            season_year = 0
+        if season_year:
+            return season_year
+        
+        # Sezon adından yıl çıkarmaya çalış
+        year_matches = re.findall(r'20\d\d', season.get("name", "") or "")
+        return int(year_matches[0]) if year_matches else 0
+
     def get_season_name(self, league_id: int, season_id: int) -> str:
         """
         Return season name for a specific league and season ID.
@@ -333,45 +408,168 @@ class SeasonFetcher:
                 logger.warning(f"get_season_name - Sezon ID integer değil: {season_id}")
                 season_id = int(season_id) if str(season_id).isdigit() else 0
             
-            # Lig ve sezon verilerini kontrol et
+            # Önce bellekteki sezon verilerini kontrol et (maç başına çağrılır)
             if league_id in self.league_seasons:
                 for season in self.league_seasons[league_id]:
                     if season and isinstance(season, dict) and season.get("id") == season_id:
                         return season.get("name", f"Season_{season_id}")
             
+            # Bellekte yoksa birincil anahtar üzerinden veritabanında ara
+            try:
+                with closing(self._connect_seasons_db()) as conn:
+                    row = conn.execute(
+                        "SELECT name FROM seasons WHERE league_id = ? AND season_id = ?",
+                        (league_id, season_id),
+                    ).fetchone()
+                if row and row[0]:
+                    return row[0]
+            except sqlite3.Error as e:
+                logger.warning(f"Sezon adı veritabanından okunamadı: {str(e)}")
+            
             return f"Season_{season_id}"
             
         except Exception as e:
             logger.warning(f"Sezon adı alınırken hata: {str(e)}")
             return f"Season_{season_id}"
     
+    def _init_seasons_db(self):
+        """Sezon veritabanı tablosunu ve indeksini oluşturur."""
+        try:
+            with closing(self._connect_seasons_db()) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SEASONS_DB_SCHEMA)
+        except sqlite3.Error as e:
+            logger.error(f"Sezon veritabanı oluşturulurken hata: {str(e)}")
+    
+    def _connect_seasons_db(self) -> sqlite3.Connection:
+        """
+        Sezon veritabanına yeni bir bağlantı açar. Veri dizini temizlenip
+        dosya silinmiş olabileceğinden dizin ve şema her bağlantıda doğrulanır.
+        """
+        os.makedirs(self.seasons_dir, exist_ok=True)
+        # Başka bir bağlantı yazarken hemen hata vermek yerine kilidi bekle
+        conn = sqlite3.connect(self.seasons_db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SEASONS_DB_SCHEMA)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+    
+    def _store_seasons_db(self, league_seasons: Dict[int, List[Dict[str, Any]]]):
+        """
+        Sezonları tek bir işlem içinde veritabanına yazar. Her lig için verilen
+        liste tam liste kabul edilir; ligin eski kayıtları önce silinir.
+        
+        Args:
+            league_seasons: Lig ID'leri ve sezon listeleri içeren sözlük
+        """
+        rows = [
+            (
+                league_id,
+                season.get("id"),
+                season.get("name", ""),
+                season.get("year", ""),
+                self._get_sortable_year_value(season.get("year", "")),
+            )
+            for league_id, seasons in league_seasons.items()
+            for season in seasons
+            if isinstance(season, dict) and season.get("id") is not None
+        ]
+        
+        try:
+            with closing(self._connect_seasons_db()) as conn:
+                with conn:
+                    conn.executemany(
+                        "DELETE FROM seasons WHERE league_id = ?",
+                        [(league_id,) for league_id in league_seasons],
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO seasons (league_id, season_id, name, year, sort_year) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+            logger.debug(f"{len(rows)} sezon veritabanına kaydedildi")
+        except sqlite3.Error as e:
+            logger.error(f"Sezon veritabanına yazılırken hata: {str(e)}")
+    
+    def _load_seasons_db(self) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Veritabanındaki tüm sezonları tek sorguyla yükler.
+        
+        Returns:
+            Dict[int, List[Dict[str, Any]]]: Lig ID'leri ve sezon listeleri (en yeni sezon en üstte)
+        """
+        league_seasons: Dict[int, List[Dict[str, Any]]] = {}
+        try:
+            with closing(self._connect_seasons_db()) as conn:
+                rows = conn.execute(
+                    "SELECT league_id, season_id, name, year FROM seasons "
+                    "ORDER BY league_id, sort_year DESC, season_id DESC"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Sezon veritabanı okunurken hata: {str(e)}")
+            return league_seasons
+        
+        for league_id, season_id, name, year in rows:
+            league_seasons.setdefault(league_id, []).append({"id": season_id, "name": name, "year": year})
+        return league_seasons
+    
+    def _seasons_db_mtime(self) -> float:
+        """
+        Sezon veritabanının son yazılma zamanını döndürür. WAL kipinde yazılar
+        önce -wal dosyasına gittiğinden iki dosyanın en yenisi alınır.
+        
+        Returns:
+            float: Son değişiklik zamanı; veritabanı yoksa 0
+        """
+        latest = 0.0
+        for path in (self.seasons_db_path, self.seasons_db_path + "-wal"):
+            try:
+                latest = max(latest, os.stat(path).st_mtime)
+            except OSError:
+                pass
+        return latest
+    
     def _load_existing_season_data(self):
         """Daha önce kaydedilmiş sezon verilerini yükler."""
         seasons_csv = os.path.join(self.data_dir, "league_seasons.csv")
         json_files = {}
         
-        # İlk olarak, her lig için JSON dosyalarını kontrol et
+        # Öncelikle sezon veritabanını kullan
+        db_seasons = self._load_seasons_db()
+        if db_seasons:
+            self.league_seasons = db_seasons
+            logger.info(f"{len(db_seasons)} lig için sezon verileri veritabanından yüklendi")
+        
+        # Veritabanında olmayan ya da veritabanından yeni olan JSON dosyaları
+        # (yedekten geri yüklenen, elle düzenlenen) yetkili kabul edilir
+        db_mtime = self._seasons_db_mtime()
         if os.path.exists(self.seasons_dir):
-            for file_name in os.listdir(self.seasons_dir):
-                if file_name.endswith('_seasons.json'):
+            with os.scandir(self.seasons_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('_seasons.json'):
+                        continue
                     try:
                         # Dosya adından lig ID'sini çıkar (örn: "17_Premier_League_seasons.json")
-                        league_id_str = file_name.split('_')[0]
-                        league_id = int(league_id_str)
+                        league_id = int(entry.name.split('_')[0])
+                        if league_id in db_seasons and entry.stat().st_mtime <= db_mtime:
+                            continue
                         
                         # JSON dosyasını oku
-                        file_path = os.path.join(self.seasons_dir, file_name)
-                        with open(file_path, 'r', encoding='utf-8') as f:
+                        with open(entry.path, 'r', encoding='utf-8') as f:
                             data = json.load(f)
                             
                         if "seasons" in data:
                             json_files[league_id] = data["seasons"]
-                    except (ValueError, KeyError, json.JSONDecodeError) as e:
-                        logger.warning(f"JSON sezon dosyası yüklenirken hata: {file_name} - {str(e)}")
+                    except (OSError, ValueError, KeyError, json.JSONDecodeError) as e:
+                        logger.warning(f"JSON sezon dosyası yüklenirken hata: {entry.name} - {str(e)}")
         
-        # JSON verilerinden league_seasons'ı doldur
+        # JSON verilerini league_seasons'a ve veritabanına aktar
         if json_files:
-            self.league_seasons = json_files
+            self.league_seasons.update(json_files)
+            self._store_seasons_db(json_files)
             logger.info(f"{len(json_files)} lig için JSON sezon verileri yüklendi")
         
         # Eğer JSON dosyaları yoksa veya eksikse, CSV dosyasını kontrol et
@@ -401,6 +599,7 @@ class SeasonFetcher:
                 # CSV verilerinden league_seasons'ı doldur
                 if csv_leagues:
                     self.league_seasons = csv_leagues
+                    self._store_seasons_db(csv_leagues)
                     logger.info(f"{len(csv_leagues)} lig için CSV sezon verileri yüklendi")
             
             except Exception as e:
@@ -415,7 +614,22 @@ class SeasonFetcher:
     
     def _save_seasons_json(self, league_id: int, data: Dict[str, Any]):
         """
-        Bir lig için çekilen sezon verilerini JSON dosyası olarak kaydeder.
+        Bir lig için çekilen sezon verilerini veritabanına, isteğe bağlı olarak
+        JSON dosyası olarak da kaydeder.
+        
+        Args:
+            league_id: Lig ID'si
+            data: API'den alınan sezon verileri
+        """
+        # JSON önce yazılır ki veritabanı ondan yeni kalsın ve açılışta
+        # aynı dosya yeniden içe aktarılmasın
+        if self.config_manager.get_save_seasons_json():
+            self._write_seasons_json_file(league_id, data)
+        self._store_seasons_db({league_id: data.get("seasons", [])})
+    
+    def _write_seasons_json_file(self, league_id: int, data: Dict[str, Any]):
+        """
+        Bir ligin sezon verilerini JSON dosyası olarak yazar.
         
         Args:
             league_id: Lig ID'si
@@ -438,24 +652,24 @@ class SeasonFetcher:
         file_path = os.path.join(self.data_dir, "league_seasons.csv")
         
         try:
-            with open(file_path, 'w', encoding='utf-8', newline='') as f:
-                fieldnames = ["Liga Adı", "Lig ID", "Sezon ID", "Sezon Adı", "Sezon Yılı"]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                leagues = self.config_manager.get_leagues()
-                
-                for league_id, seasons in self.league_seasons.items():
-                    league_name = leagues.get(league_id, f"Bilinmeyen Lig {league_id}")
-                    
-                    for season in seasons:
-                        writer.writerow({
-                            "Liga Adı": league_name,
-                            "Lig ID": league_id,
-                            "Sezon ID": season.get("id", ""),
-                            "Sezon Adı": season.get("name", ""),
-                            "Sezon Yılı": season.get("year", "")
-                        })
+            leagues = self.config_manager.get_leagues()
+            rows = (
+                (
+                    leagues.get(league_id, f"Bilinmeyen Lig {league_id}"),
+                    league_id,
+                    season.get("id", ""),
+                    season.get("name", ""),
+                    season.get("year", ""),
+                )
+                for league_id, seasons in self.league_seasons.items()
+                for season in seasons
+            )
+            
+            # Büyük tampon ile tek seferde yaz
+            with open(file_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(["Liga Adı", "Lig ID", "Sezon ID", "Sezon Adı", "Sezon Yılı"])
+                writer.writerows(rows)
             
             logger.info(f"Tüm ligler için sezon verileri CSV olarak kaydedildi: {file_path}")
         except Exception as e:
@@ -472,45 +686,27 @@ class SeasonFetcher:
         Returns:
             float: Yılı temsil eden sıralanabilir bir değer (yüksek = daha yeni)
         """
-        if not year_str or year_str == '0':
-            return 0.0
+        return _sortable_year_value(year_str)
+    
+    def sort_seasons_by_year(self, seasons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sezonları yıla göre en yeniden en eskiye sıralar.
         
-        # Yıl aralıklarını işle (örn. "24/25" veya "2024/2025")
-        if '/' in year_str:
-            parts = year_str.split('/')
-            start_year = parts[0].strip()
-            end_year = parts[1].strip() if len(parts) > 1 else ""
-            
-            # 2 basamaklı yılları işle
-            if len(start_year) == 2 and len(end_year) == 2:
-                start_int = int(start_year)
-                end_int = int(end_year)
-                
-                # Eğer ilk yıl ikinci yıldan büyükse (örn. 99/00), bu bir yüzyıl geçişidir
-                if start_int > end_int:
-                    # Yüzyıl geçişi: 99/00 -> 2000 (yeni yüzyılı kullan)
-                    return 2000.0 + float(end_int)
-                elif start_int < 50:
-                    # 2000'ler (örn: 20/21 -> 2020)
-                    return 2000.0 + float(start_int)
-                else:
-                    # 1900'ler (örn: 98/99 -> 1998)
-                    return 1900.0 + float(start_int)
-            # 4 basamaklı yılları işle
-            elif len(start_year) == 4:
-                return float(start_year)
-            else:
-                try:
-                    # Diğer formatlar
-                    return float(start_year)
-                except ValueError:
-                    return 0.0
+        Sıralama anahtarı her sezon için bir kez hesaplanır; eşit yıllı
+        sezonlar orijinal sıralarını korur.
         
-        # Tek yılları işle (örn. "2024")
-        try:
-            return float(year_str)
-        except ValueError:
-            return 0.0
+        Args:
+            seasons: Sezon verileri listesi
+            
+        Returns:
+            List[Dict[str, Any]]: Sıralanmış yeni liste
+        """
+        decorated = [
+            (_sortable_year_value(season.get("year", "")), -index, season)
+            for index, season in enumerate(seasons)
+        ]
+        decorated.sort(reverse=True)
+        return [season for _, _, season in decorated]
 
     def get_seasons_for_league(self, league_id: int) -> List[Dict[str, Any]]:
         """
@@ -522,7 +718,20 @@ class SeasonFetcher:
         Returns:
             List[Dict[str, Any]]: Sezon verileri listesi
         """
-        # Yüklenmiş veri varsa onu kullan
+        # Veritabanında kayıt varsa onu kullan
+        try:
+            with closing(self._connect_seasons_db()) as conn:
+                rows = conn.execute(
+                    "SELECT season_id, name, year FROM seasons WHERE league_id = ? "
+                    "ORDER BY sort_year DESC, season_id DESC",
+                    (league_id,),
+                ).fetchall()
+            if rows:
+                return [{"id": season_id, "name": name, "year": year} for season_id, name, year in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Sezon veritabanı okuma hatası: {str(e)}")
+        
+        # Eski JSON dosyalarına geri dön
         try:
             # Lig adını alıp güvenli dosya adı oluşturuyoruz
             league_name = self.config_manager.get_league_by_id(league_id)
@@ -567,6 +776,17 @@ class SeasonFetcher:
         Returns:
             Optional[Dict[str, Any]]: Sezon bilgisi veya None
         """
+        try:
+            with closing(self._connect_seasons_db()) as conn:
+                row = conn.execute(
+                    "SELECT name, year FROM seasons WHERE league_id = ? AND season_id = ?",
+                    (league_id, season_id),
+                ).fetchone()
+            if row:
+                return {"id": season_id, "name": row[0], "year": row[1]}
+        except sqlite3.Error as e:
+            logger.error(f"Sezon veritabanı okuma hatası: {str(e)}")
+        
         seasons = self.get_seasons_for_league(league_id)
         
         # Sezon ID'sine göre sezon bilgisini bul
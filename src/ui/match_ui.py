@@ -3,9 +3,13 @@ SofaScore Scraper için maç işlemleri modülü.
 Bu modül, maç ve maç detayları ile ilgili UI işlemlerini içerir.
 """
 
+import asyncio
 import os
-from typing import Any, Callable, Dict, List, Optional, Union
-from colorama import Fore, Style
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from src.config_manager import ConfigManager
 from src.season_fetcher import SeasonFetcher
@@ -19,6 +23,40 @@ from src.i18n import get_i18n
 # Logger'ı al
 logger = get_logger("MatchUI")
 
+# Tur dosyası adları: eski "X_matches.json" ve yeni "round_X.json" / "round_X_full.json"
+_ROUND_FILE_RE = re.compile(r'^(?:(\d+)_matches|round_(\d+)(?:_full)?)\.json$')
+
+# Klasör adlarında boşluk ve eğik çizgi alt çizgiye çevrilir
+_PATH_SANITIZE = str.maketrans({' ': '_', '/': '_'})
+
+
+def _parse_int(value: str, low: int = 0, high: Optional[int] = None) -> Optional[int]:
+    """
+    Menü girdisini istisna yoluna girmeden tam sayıya çevirir.
+    
+    Args:
+        value: Kullanıcı girdisi
+        low: İzin verilen en küçük değer
+        high: İzin verilen en büyük değer (None: üst sınır yok)
+        
+    Returns:
+        Optional[int]: Geçerli ve aralıktaysa sayı, değilse None
+    """
+    value = value.strip()
+    # isdigit() '²' gibi int()'in kabul etmediği Unicode rakamlarını da kabul eder
+    if not (value.isascii() and value.isdigit()):
+        return None
+    number = int(value)
+    if number < low or (high is not None and number > high):
+        return None
+    return number
+
+
+@lru_cache(maxsize=256)
+def _safe_path_name(name: str) -> str:
+    """Lig/sezon adını klasör adında kullanılacak biçime çevirir."""
+    return name.translate(_PATH_SANITIZE)
+
 
 class MatchMenuHandler:
     """Maç yönetimi menü işlemleri sınıfı."""
@@ -45,14 +83,33 @@ class MatchMenuHandler:
         self.colors = colors
         self.console = Console(no_color=not self.config_manager.get_use_color())
         self.i18n = get_i18n()
+    
+    def _get_local_seasons(self, league_id: int) -> List[Dict[str, Any]]:
+        """
+        Ligin yerel sezonlarını döndürür.
+        
+        SeasonFetcher başlangıçta tüm sezonları belleğe yükler ve her sezon
+        çekiminde league_seasons'ı günceller; bu yüzden ayrı bir önbellek
+        tutulmaz, bellekte olmayan ligler için kayıtlı veriye bakılır.
+        
+        Args:
+            league_id: Lig ID'si
+            
+        Returns:
+            List[Dict[str, Any]]: Sezon verileri listesi
+        """
+        seasons = self.season_fetcher.league_seasons.get(league_id)
+        if seasons:
+            return seasons
+        return self.season_fetcher.get_seasons_for_league(league_id)
 
-    def _print_leagues_table(self, leagues: Dict[int, str]) -> None:
+    def _print_leagues_table(self, league_items: Tuple[Tuple[int, str], ...]) -> None:
         table = Table(title=self.i18n.t("league_list_title"), show_header=True, header_style="bold magenta")
         table.add_column("#", style="dim", width=4)
         table.add_column(self.i18n.t("league_name"), style="cyan")
         table.add_column(self.i18n.t("id"), style="green")
 
-        for i, (league_id, league_name) in enumerate(leagues.items(), 1):
+        for i, (league_id, league_name) in enumerate(league_items, 1):
             table.add_row(str(i), league_name, str(league_id))
         
         self.console.print(table)
@@ -72,141 +129,218 @@ class MatchMenuHandler:
         
         self.console.print(table)
     
-    def fetch_matches_for_league(self) -> None:
-        """Belirli bir lig için maç verilerini çeker."""
+    def fetch_matches_for_league(
+        self,
+        league_id: Optional[int] = None,
+        last_n: Optional[int] = None,
+        season_id: Optional[int] = None,
+    ) -> None:
+        """
+        Belirli bir lig için maç verilerini çeker.
+        
+        league_id verilirse hiçbir girdi istenmez (betik/headless kullanım).
+        
+        Args:
+            league_id: Lig ID'si (None: kullanıcıya sorulur)
+            last_n: Son N sezon (None/0: tüm sezonlar)
+            season_id: Yalnızca bu sezon (last_n'den önceliklidir)
+        """
         try:
-            # Ligleri al
-            leagues = self.config_manager.get_leagues()
-            if not leagues:
-                print(self.i18n.t("no_leagues_found"))
-                return
-            
-            # Lig listesini görüntüle
-            self._print_leagues_table(leagues)
+            interactive = league_id is None
+            if interactive:
+                selection = self._prompt_league()
+                if selection is None:
+                    return
+                league_id, league_name = selection
+            else:
+                league_name = self.config_manager.get_league_by_id(league_id)
+                if not league_name:
+                    print(f"\nGeçersiz lig numarası!")
+                    return
             
-            # Lig seçimini al
-            league_choice = input(self.i18n.t("select_league_prompt")).strip()
+            # Sezonları al - Önce yerel veriyi kontrol et
+            seasons = self._get_local_seasons(league_id)
+            if not seasons:
+                print(self.i18n.t("checking_seasons"))
+                seasons = self.season_fetcher.fetch_seasons_for_league(league_id)
             
-            if league_choice == "0":
+            if not seasons:
+                print(self.i18n.t("no_seasons_found_for_league"))
                 return
-                
-            try:
-                league_index = int(league_choice) - 1
-                if league_index < 0 or league_index >= len(leagues):
-                    print(f"\nGeçersiz lig numarası!")
-                    return
-                    
-                # Seçilen ligi al
-                league_id = list(leagues.keys())[league_index]
-                league_name = leagues[league_id]
-                
-                # Sezonları al - Önce yerel veriyi kontrol et
-                seasons = self.season_fetcher.get_seasons_for_league(league_id)
-                if not seasons:
-                    print(self.i18n.t("checking_seasons"))
-                    seasons = self.season_fetcher.fetch_seasons_for_league(league_id)
-                
-                if not seasons:
-                    print(self.i18n.t("no_seasons_found_for_league"))
-                    return
-                
+            
+            if interactive:
                 print(self.i18n.t("viewing_seasons_for", league_name=league_name, league_id=league_id))
-                
-                # Sezonları tarihe göre sırala (en yeni en üstte)
-                sorted_seasons = sorted(seasons, key=lambda s: self.season_fetcher._get_sortable_year_value(s.get("year", "")), reverse=True)
-                
-                # Sezon filtreleme seçenekleri
-                print(self.i18n.t("season_filter_options"))
-                print("-" * 50)
-                print(self.i18n.t("all_seasons"))
-                print(self.i18n.t("last_n_seasons"))
-                print(self.i18n.t("specific_season"))
-                print(self.i18n.t("cancel"))
-                
-                filter_choice = input(self.i18n.t("selection_prompt")).strip()
-                
-                if filter_choice == "0":
-                    return
-                
-                selected_seasons = []
-                
-                # Tüm sezonlar
-                if filter_choice == "1":
-                    selected_seasons = sorted_seasons
-                    print(self.i18n.t("all_seasons_selected", count=len(selected_seasons)))
-                
-                # Son N sezon
-                elif filter_choice == "2":
-                    try:
-                        n_seasons = input(self.i18n.t("how_many_seasons_prompt")).strip()
-                        n_seasons = int(n_seasons)
-                        
-                        if n_seasons <= 0 or n_seasons > len(sorted_seasons):
-                            print(self.i18n.t("invalid_number_range", max=len(sorted_seasons)))
-                            return
-                        
-                        selected_seasons = sorted_seasons[:n_seasons]
-                        print(self.i18n.t("last_n_seasons_selected", count=n_seasons))
-                    except ValueError:
-                        print(self.i18n.t("invalid_number_format"))
-                        return
-                
-                # Belirli bir sezon
-                elif filter_choice == "3":
-                    # Sezon listesini göster
-                    self._print_seasons_table(sorted_seasons)
-                    
-                    # Sezon seçimini al
-                    season_choice = input(self.i18n.t("select_season_prompt")).strip()
-                    
-                    if season_choice == "0":
-                        return
-                    
-                    try:
-                        season_index = int(season_choice) - 1
-                        if season_index < 0 or season_index >= len(sorted_seasons):
-                            print(self.i18n.t("invalid_season_num"))
-                            return
-                        
-                        selected_seasons = [sorted_seasons[season_index]]
-                        print(self.i18n.t("season_selected", season_name=selected_seasons[0].get('name', 'Sezon')))
-                    except ValueError:
-                        print(self.i18n.t("invalid_number_format"))
-                        return
-                
+                selected_seasons = self._prompt_season_filter(seasons)
+            else:
+                selected_seasons = self._filter_seasons(seasons, last_n, season_id)
+            
+            if not selected_seasons:
+                return
+            
+            # Seçilen sezonlar için maç verilerini eşzamanlı çek
+            season_names = {s.get("id"): s.get("name", "Bilinmeyen Sezon") for s in selected_seasons}
+            for season_name in season_names.values():
+                print(self.i18n.t('fetching_match_data_for_league_season', league_name=league_name, season_name=season_name))
+            
+            def on_season_done(season_id: int, success: bool) -> None:
+                if success:
+                    print(f"  ✓ {season_names.get(season_id, season_id)}: Maç verileri başarıyla çekildi.")
                 else:
-                    print(self.i18n.t("invalid_selection"))
-                    return
-                
-                # Seçilen sezonlar için maç verilerini çek
-                total_matches = 0
-                for season in selected_seasons:
-                    season_id = season.get("id")
-                    season_name = season.get("name", "Bilinmeyen Sezon")
-                    
-                    print(self.i18n.t('fetching_match_data_for_league_season', league_name=league_name, season_name=season_name))
-                    
-                    success = self.match_fetcher.fetch_matches_for_season(league_id, season_id)
-                    
-                    if success:
-                        print(f"  ✓ Maç verileri başarıyla çekildi.")
-                        total_matches += 1
-                    else:
-                        print(f"  {self.i18n.t('matches_not_found')}")
-                
-                # Assuming 'results' and 'finished_matches' are not directly available here,
-                # but the instruction implies a summary.
-                # For now, we'll use total_matches as the 'total' and 'finished' count for simplicity
-                # as the original code only tracked total_matches.
-                print(self.i18n.t("matches_downloaded", league=league_name, season="selected seasons", total=total_matches, finished=total_matches))
-                    
-            except ValueError:
-                print(self.i18n.t("invalid_number_format_error"))
+                    print(f"  {season_names.get(season_id, season_id)}: {self.i18n.t('matches_not_found')}")
+            
+            results = self.match_fetcher.fetch_matches_for_seasons(
+                league_id, list(season_names), on_season_done=on_season_done
+            )
+            # Sonuçlar sezon bazındadır; özet maç değil sezon sayısı üzerinden verilir
+            succeeded = sum(1 for success in results.values() if success)
+            print(self.i18n.t(
+                "seasons_matches_downloaded",
+                league=league_name,
+                succeeded=succeeded,
+                total=len(season_names),
+            ))
                 
         except Exception as e:
             logger.error(f"Error fetching matches: {str(e)}")
             print(self.i18n.t("matches_fetch_error", error=str(e)))
     
+    def _prompt_league(self) -> Optional[Tuple[int, str]]:
+        """
+        Lig listesini gösterir ve kullanıcıdan lig seçimini alır.
+        
+        Returns:
+            Optional[Tuple[int, str]]: Seçilen (lig ID'si, lig adı) veya iptal/hata durumunda None
+        """
+        # Ligleri al
+        league_items = tuple(self.config_manager.get_leagues().items())
+        if not league_items:
+            print(self.i18n.t("no_leagues_found"))
+            return None
+        
+        # Lig listesini görüntüle
+        self._print_leagues_table(league_items)
+        
+        # Lig seçimini al
+        league_choice = input(self.i18n.t("select_league_prompt")).strip()
+        
+        if league_choice == "0":
+            return None
+        
+        league_number = _parse_int(league_choice, 1, len(league_items))
+        if league_number is None:
+            print(f"\nGeçersiz lig numarası!")
+            return None
+        
+        return league_items[league_number - 1]
+    
+    def _prompt_season_filter(self, seasons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sezon filtreleme seçeneklerini gösterir ve seçilen sezonları döndürür.
+        
+        Args:
+            seasons: Ligin sezonları
+            
+        Returns:
+            List[Dict[str, Any]]: Seçilen sezonlar (iptal/hata durumunda boş liste)
+        """
+        # Sezon filtreleme seçenekleri
+        print(self.i18n.t("season_filter_options"))
+        print("-" * 50)
+        print(self.i18n.t("all_seasons"))
+        print(self.i18n.t("last_n_seasons"))
+        print(self.i18n.t("specific_season"))
+        print(self.i18n.t("cancel"))
+        
+        filter_choice = input(self.i18n.t("selection_prompt")).strip()
+        
+        if filter_choice == "0":
+            return []
+        
+        # Sıralama yalnızca kullanıcıya sezon gösterilen seçeneklerde gerekir;
+        # tüm sezonlar çekilirken istek sırası önemsizdir
+        if filter_choice in ("2", "3"):
+            # Sezonları tarihe göre sırala (en yeni en üstte)
+            sorted_seasons = self.season_fetcher.sort_seasons_by_year(seasons)
+        
+        # Tüm sezonlar
+        if filter_choice == "1":
+            print(self.i18n.t("all_seasons_selected", count=len(seasons)))
+            return seasons
+        
+        # Son N sezon
+        if filter_choice == "2":
+            n_seasons = _parse_int(input(self.i18n.t("how_many_seasons_prompt")), 1, len(sorted_seasons))
+            if n_seasons is None:
+                print(self.i18n.t("invalid_number_range", max=len(sorted_seasons)))
+                return []
+            
+            print(self.i18n.t("last_n_seasons_selected", count=n_seasons))
+            return sorted_seasons[:n_seasons]
+        
+        # Belirli bir sezon
+        if filter_choice == "3":
+            # Sezon listesini göster
+            self._print_seasons_table(sorted_seasons)
+            
+            # Sezon seçimini al
+            season_choice = input(self.i18n.t("select_season_prompt")).strip()
+            
+            if season_choice == "0":
+                return []
+            
+            season_number = _parse_int(season_choice, 1, len(sorted_seasons))
+            if season_number is None:
+                print(self.i18n.t("invalid_season_num"))
+                return []
+            
+            selected_season = sorted_seasons[season_number - 1]
+            print(self.i18n.t("season_selected", season_name=selected_season.get('name', 'Sezon')))
+            return [selected_season]
+        
+        print(self.i18n.t("invalid_selection"))
+        return []
+    
+    def _filter_seasons(
+        self,
+        seasons: List[Dict[str, Any]],
+        last_n: Optional[int] = None,
+        season_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sezonları girdi istemeden parametrelere göre filtreler.
+        
+        Args:
+            seasons: Ligin sezonları
+            last_n: Son N sezon (None/0: tüm sezonlar)
+            season_id: Yalnızca bu sezon (last_n'den önceliklidir)
+            
+        Returns:
+            List[Dict[str, Any]]: Seçilen sezonlar
+        """
+        if season_id is not None:
+            selected = [season for season in seasons if season.get("id") == season_id]
+            if not selected:
+                logger.warning(f"Sezon ID {season_id} bulunamadı")
+                print(self.i18n.t("invalid_season_num"))
+            return selected
+        
+        if last_n:
+            return self.season_fetcher.sort_seasons_by_year(seasons)[:last_n]
+        
+        return seasons
+    
+    def _load_league_seasons(self, league_id: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Bir ligin sezonlarını önce yerel veriden, yoksa API'den yükler.
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: Sezonlar ve API'den çekilip çekilmediği
+        """
+        seasons = self.season_fetcher.get_seasons_for_league(league_id)
+        if seasons:
+            return seasons, False
+        return self.season_fetcher.fetch_seasons_for_league(league_id), True
+    
     def fetch_matches_for_all_leagues(
         self,
         max_seasons: Optional[int] = None,
@@ -219,29 +353,23 @@ class MatchMenuHandler:
         """
         try:
             # Ligleri al
-            leagues = self.config_manager.get_leagues()
+            league_items = tuple(self.config_manager.get_leagues().items())
             
-            if not leagues:
+            if not league_items:
                 print(f"\n{self.i18n.t('error_no_saved_league')}")
                 return
             
-            league_list = list(leagues.items())
-            n_leagues = len(league_list)
+            n_leagues = len(league_items)
             if progress_callback and n_leagues > 0:
                 progress_callback(0, n_leagues, f"Matches 0/{n_leagues} leagues (starting)")
             
             # Kaç sezon çekileceğini kullanıcıya sor (eğer parametre olarak gelmediyse)
             if max_seasons is None:
-                max_seasons = -1
-                while max_seasons < 0:
-                    try:
-                        print(f"\nKaç sezon çekmek istiyorsunuz?")
-                        print(f"{self.i18n.t('all_seasons_0_last_n')}")
-                        max_seasons_input = input(f"{self.i18n.t('season_count')} ")
-                        max_seasons = int(max_seasons_input)
-                        if max_seasons < 0:
-                            print(f"{self.i18n.t('enter_valid_number_greater_0')}")
-                    except ValueError:
+                while max_seasons is None:
+                    print(f"\nKaç sezon çekmek istiyorsunuz?")
+                    print(f"{self.i18n.t('all_seasons_0_last_n')}")
+                    max_seasons = _parse_int(input(f"{self.i18n.t('season_count')} "))
+                    if max_seasons is None:
                         print(f"{self.i18n.t('enter_valid_number')}")
             
             print(self.i18n.t('fetching_match_data_for_all_leagues'))
@@ -251,89 +379,92 @@ class MatchMenuHandler:
                 print(f"{self.i18n.t('info_all_seasons_fetched')}")
             
             total_matches = 0
-            for li, (league_id, league_name) in enumerate(league_list):
-                try:
-                    print(f"\n  🏆 {league_name} (ID: {league_id})")
-                    
-                    # Ligi çekmeden önce kontrol et
-                    print(f"  ○ Sezonlar kontrol ediliyor...")
-                    # Önce yerel veriyi kontrol et
-                    seasons = self.season_fetcher.get_seasons_for_league(league_id)
-                    
-                    # Yerelde yoksa API'den çek
-                    if not seasons:
-                        print(f"  ○ {self.i18n.t('no_season_data_found_locally')}")
-                        seasons = self.season_fetcher.fetch_seasons_for_league(league_id)
-                    
-                    if not seasons:
-                        print(f"  {self.i18n.t('no_match_found_skipping')}")
+            # Sezon listeleri bir ileriden okunur/çekilir; maç indirme ile örtüşür
+            with ThreadPoolExecutor(max_workers=1) as prefetch_pool:
+                next_seasons_future = prefetch_pool.submit(self._load_league_seasons, league_items[0][0])
+                for li, (league_id, league_name) in enumerate(league_items):
+                    try:
+                        print(f"\n  🏆 {league_name} (ID: {league_id})")
+                        
+                        # Ligi çekmeden önce kontrol et
+                        print(f"  ○ Sezonlar kontrol ediliyor...")
+                        seasons_future = next_seasons_future
+                        
+                        # Bu ligin maçları inerken bir sonraki ligin sezon listesini hazırla
+                        if li + 1 < n_leagues:
+                            next_seasons_future = prefetch_pool.submit(
+                                self._load_league_seasons, league_items[li + 1][0]
+                            )
+                        
+                        seasons, fetched_remotely = seasons_future.result()
+                        if fetched_remotely:
+                            print(f"  ○ {self.i18n.t('no_season_data_found_locally')}")
+                        
+                        if not seasons:
+                            print(f"  {self.i18n.t('no_match_found_skipping')}")
+                            if progress_callback and n_leagues > 0:
+                                progress_callback(
+                                    li + 1,
+                                    n_leagues,
+                                    f"Matches {li + 1}/{n_leagues}: {league_name} (no seasons)",
+                                )
+                            continue
+                        
+                        # Sezonları tarihe göre sırala (en yeni en üstte)
+                        sorted_seasons = self.season_fetcher.sort_seasons_by_year(seasons)
+                        if not sorted_seasons:
+                            print(f"  {self.i18n.t('season_data_not_sorted')}")
+                            if progress_callback and n_leagues > 0:
+                                progress_callback(
+                                    li + 1,
+                                    n_leagues,
+                                    f"Matches {li + 1}/{n_leagues}: {league_name} (skip)",
+                                )
+                            continue
+                        
+                        # Sezon sayısını sınırla
+                        if max_seasons > 0 and len(sorted_seasons) > max_seasons:
+                            seasons_to_fetch = sorted_seasons[:max_seasons]
+                            print(f"  ℹ️ Toplam {len(sorted_seasons)} sezon arasından son {max_seasons} {self.i18n.t('info_last_seasons_suffix')}")
+                        else:
+                            seasons_to_fetch = sorted_seasons
+                            print(f"  ℹ️ Toplam {len(sorted_seasons)} {self.i18n.t('info_last_seasons_suffix')}")
+                        
+                        # Ligin tüm sezonları için maç verilerini eşzamanlı çek
+                        season_names = {s.get("id"): s.get("name", "Bilinmeyen Sezon") for s in seasons_to_fetch}
+                        for season_name in season_names.values():
+                            print(f"  ○ {season_name} {self.i18n.t('fetching_matches_for_season')}")
+                        
+                        def on_season_done(season_id: int, success: bool) -> None:
+                            season_name = season_names.get(season_id, season_id)
+                            if success:
+                                print(f"    {season_name}: {self.i18n.t('matches_fetched_successfully')}")
+                            else:
+                                print(f"    {season_name}: Maç bulunamadı.")
+                        
+                        results = self.match_fetcher.fetch_matches_for_seasons(
+                            league_id, list(season_names), on_season_done=on_season_done
+                        )
+                        league_matches = sum(1 for success in results.values() if success)
+                        
+                        total_matches += league_matches
+                        print(f"  {league_name} {self.i18n.t('total_matches_fetched_for_league')} {league_matches} maç verisi çekildi.")
                         if progress_callback and n_leagues > 0:
                             progress_callback(
                                 li + 1,
                                 n_leagues,
-                                f"Matches {li + 1}/{n_leagues}: {league_name} (no seasons)",
+                                f"Matches {li + 1}/{n_leagues}: {league_name}",
                             )
-                        continue
-                    
-                    # Sezonları tarihe göre sırala (en yeni en üstte)
-                    sorted_seasons = sorted(seasons, key=lambda s: self.season_fetcher._get_sortable_year_value(s.get("year", "")), reverse=True)
-                    if not sorted_seasons:
-                        print(f"  {self.i18n.t('season_data_not_sorted')}")
+                        
+                    except Exception as e:
+                        logger.error(f"{league_name} için maç verisi çekilirken hata: {str(e)}")
+                        print(f"  Hata: {str(e)}")
                         if progress_callback and n_leagues > 0:
                             progress_callback(
                                 li + 1,
                                 n_leagues,
-                                f"Matches {li + 1}/{n_leagues}: {league_name} (skip)",
+                                f"Matches {li + 1}/{n_leagues}: {league_name} (error)",
                             )
-                        continue
-                    
-                    # Sezon sayısını sınırla
-                    if max_seasons > 0 and len(sorted_seasons) > max_seasons:
-                        seasons_to_fetch = sorted_seasons[:max_seasons]
-                        print(f"  ℹ️ Toplam {len(sorted_seasons)} sezon arasından son {max_seasons} {self.i18n.t('info_last_seasons_suffix')}")
-                    else:
-                        seasons_to_fetch = sorted_seasons
-                        print(f"  ℹ️ Toplam {len(sorted_seasons)} {self.i18n.t('info_last_seasons_suffix')}")
-                    
-                    league_matches = 0
-                    
-                    # Her sezon için maç verilerini çek
-                    for season in seasons_to_fetch:
-                        season_id = season.get("id")
-                        season_name = season.get("name", "Bilinmeyen Sezon")
-                        
-                        print(f"  ○ {season_name} {self.i18n.t('fetching_matches_for_season')}")
-                        
-                        try:
-                            success = self.match_fetcher.fetch_matches_for_season(league_id, season_id)
-                            
-                            if success:
-                                print(f"    {self.i18n.t('matches_fetched_successfully')}")
-                                league_matches += 1
-                            else:
-                                print(f"    Maç bulunamadı.")
-                        except Exception as e:
-                            logger.error(f"{league_name} - {season_name} için maç verisi çekilirken hata: {str(e)}")
-                            print(f"    Hata: {str(e)}")
-                    
-                    total_matches += league_matches
-                    print(f"  {league_name} {self.i18n.t('total_matches_fetched_for_league')} {league_matches} maç verisi çekildi.")
-                    if progress_callback and n_leagues > 0:
-                        progress_callback(
-                            li + 1,
-                            n_leagues,
-                            f"Matches {li + 1}/{n_leagues}: {league_name}",
-                        )
-                    
-                except Exception as e:
-                    logger.error(f"{league_name} için maç verisi çekilirken hata: {str(e)}")
-                    print(f"  Hata: {str(e)}")
-                    if progress_callback and n_leagues > 0:
-                        progress_callback(
-                            li + 1,
-                            n_leagues,
-                            f"Matches {li + 1}/{n_leagues}: {league_name} (error)",
-                        )
             
             print(f"\n{self.i18n.t('info_total_matches_fetched')} {total_matches} {self.i18n.t('info_total_matches_fetched_suffix')}")
             
@@ -341,6 +472,12 @@ class MatchMenuHandler:
             logger.error(f"Tüm ligler için maç verileri çekilirken hata: {str(e)}")
             print(f"\nHata: {str(e)}")
     
+    @staticmethod
+    def _scan_subdirs(path: str) -> Dict[str, str]:
+        """Bir dizindeki alt dizinleri tek geçişte ad -> yol sözlüğüne çevirir."""
+        with os.scandir(path) as entries:
+            return {entry.name: entry.path for entry in entries if entry.is_dir()}
+    
     def list_matches(self) -> None:
         """Çekilen maçları listeler."""
         try:
@@ -353,121 +490,100 @@ class MatchMenuHandler:
                 print(f"{self.i18n.t('matches_not_found')}")
                 return
                 
-            # Maç dosyalarını ara
-            if not os.listdir(match_dir):
+            # Maç dosyalarını ara - dizin tek bir kez okunur, indeks aşağıda yeniden kullanılır
+            league_dirs = self._scan_subdirs(match_dir)
+            if not league_dirs:
                 print(f"{self.i18n.t('matches_not_found')}")
                 return
                 
             # Ligi seç
-            leagues = self.config_manager.get_leagues()
+            league_items = tuple(self.config_manager.get_leagues().items())
             
             print(f"\nLigler:")
-            for i, (league_id, league_name) in enumerate(leagues.items(), 1):
-                print(f"{i}. {league_name} (ID: {league_id or '?'})")
+            sys.stdout.write("".join(
+                f"{i}. {league_name} (ID: {league_id or '?'})\n"
+                for i, (league_id, league_name) in enumerate(league_items, 1)
+            ))
             
             league_choice = input(f"\n{self.i18n.t('league_number_to_view_matches')} ").strip()
             
-            try:
-                league_index = int(league_choice) - 1
-                if league_index < 0 or league_index >= len(leagues):
-                    print(f"\nGeçersiz lig numarası!")
-                    return
-                    
-                league_id = list(leagues.keys())[league_index]
-                league_name = leagues[league_id]
-                
-                # Sezon seç
-                seasons = self.season_fetcher.get_seasons_for_league(league_id)
-                
-                if not seasons:
-                    print(f"\n{self.i18n.t('season_data_not_found_for_league')}")
-                    return
-                
-                print(f"\nSezonlar:")
-                for i, season in enumerate(seasons, 1):
-                    season_id = season.get("id", "?")
-                    season_name = season.get("name", "Bilinmeyen Sezon")
-                    print(f"{i}. {season_name} (ID: {season_id})")
-                
-                season_choice = input(f"\n{self.i18n.t('season_number_to_view_matches')} ").strip()
+            league_number = _parse_int(league_choice, 1, len(league_items))
+            if league_number is None:
+                print(f"\nGeçersiz lig numarası!")
+                return
                 
-                try:
-                    season_index = int(season_choice) - 1
-                    if season_index < 0 or season_index >= len(seasons):
-                        print(f"\n{self.i18n.t('invalid_season_number')}")
-                        return
-                        
-                    season = seasons[season_index]
-                    season_id = season.get("id")
-                    season_name = season.get("name", "Bilinmeyen Sezon")
-                    
-                    # Maç dizinini kontrol et - farklı klasör düzeni formatlarını dene
-                    possible_dirs = []
-                    
-                    # 1. Format: lig_id_lig_adı/sezon_id_sezon_adı
-                    league_name_safe = league_name.replace(' ', '_').replace('/', '_')
-                    season_name_safe = season_name.replace(' ', '_').replace('/', '_')
-                    
-                    # Olası dizin şekilleri
-                    league_dirs = [
-                        os.path.join(match_dir, f"{league_id}_{league_name_safe}"),  # ID ile
-                        os.path.join(match_dir, f"{league_name_safe}"),              # Sadece ad ile
-                        os.path.join(match_dir, str(league_id))                     # Sadece ID ile
-                    ]
-                    
-                    # Her olası lig dizinini kontrol et
-                    for league_dir in league_dirs:
-                        if os.path.exists(league_dir):
-                            # Olası sezon dizinlerini kontrol et
-                            season_dirs = [
-                                os.path.join(league_dir, f"{season_id}_{season_name_safe}"),  # ID ile
-                                os.path.join(league_dir, f"{season_name_safe}"),              # Sadece ad ile
-                                os.path.join(league_dir, str(season_id))                     # Sadece ID ile
-                            ]
-                            
-                            for season_dir in season_dirs:
-                                if os.path.exists(season_dir):
-                                    possible_dirs.append(season_dir)
-                    
-                    # Hiçbir dizin bulunamadıysa
-                    if not possible_dirs:
-                        print(f"\n{self.i18n.t('no_match_data_for_season')}")
-                        return
-                    
-                    # Bulunan ilk dizini kullan
-                    season_dir = possible_dirs[0]
-                    
-                    # Maç dosyalarını listele
-                    match_files = {}
-                    for file in os.listdir(season_dir):
-                        # 1. Eski format: X_matches.json
-                        if file.endswith("_matches.json"):
-                            try:
-                                round_num = file.split("_")[0]
-                                match_files[round_num] = file
-                            except:
-                                continue
-                        # 2. Yeni format: round_X.json
-                        elif file.startswith("round_") and file.endswith(".json"):
-                            try:
-                                round_num = file.split("_")[1].split(".")[0]
-                                match_files[round_num] = file
-                            except:
-                                continue
-                    
-                    if not match_files:
-                        print(f"\n{self.i18n.t('no_match_data_for_season')}")
-                        return
-                    
-                    print(f"\n{self.i18n.t('match_files')}")
-                    for i, (round_num, match_file) in enumerate(sorted(match_files.items(), key=lambda x: int(x[0]) if x[0].isdigit() else 0), 1):
-                        print(f"{i}. {round_num} {match_file}")
+            league_id, league_name = league_items[league_number - 1]
+            
+            # Sezon seç
+            seasons = self._get_local_seasons(league_id)
+            
+            if not seasons:
+                print(f"\n{self.i18n.t('season_data_not_found_for_league')}")
+                return
+            
+            print(f"\nSezonlar:")
+            sys.stdout.write("".join(
+                f"{i}. {season.get('name', 'Bilinmeyen Sezon')} (ID: {season.get('id', '?')})\n"
+                for i, season in enumerate(seasons, 1)
+            ))
+            
+            season_choice = input(f"\n{self.i18n.t('season_number_to_view_matches')} ").strip()
+            
+            season_number = _parse_int(season_choice, 1, len(seasons))
+            if season_number is None:
+                print(f"\n{self.i18n.t('invalid_season_number')}")
+                return
                 
-                except ValueError:
-                    print(f"\n{self.i18n.t('invalid_season_number')}")
-                    
-            except ValueError:
-                print(f"\nGeçersiz lig numarası!")
+            season = seasons[season_number - 1]
+            season_id = season.get("id")
+            season_name = season.get("name", "Bilinmeyen Sezon")
+            
+            # Maç dizinini kontrol et - farklı klasör düzeni formatlarını dene
+            # 1. Format: lig_id_lig_adı/sezon_id_sezon_adı
+            league_name_safe = _safe_path_name(league_name)
+            season_name_safe = _safe_path_name(season_name)
+            
+            # Olası dizin adları (öncelik sırasıyla): ID ile, sadece ad ile, sadece ID ile
+            league_keys = (f"{league_id}_{league_name_safe}", league_name_safe, str(league_id))
+            season_keys = (f"{season_id}_{season_name_safe}", season_name_safe, str(season_id))
+            
+            # Her seviye tek bir dizin okumasıyla indekslenir; adaylar ek
+            # stat çağrısı yapılmadan sözlükte aranır
+            candidate_league_dirs = [league_dirs[k] for k in league_keys if k in league_dirs]
+            if not candidate_league_dirs:
+                print(f"\n{self.i18n.t('no_match_data_for_season')}")
+                return
+            
+            season_dir = None
+            for league_dir in candidate_league_dirs:
+                season_dirs = self._scan_subdirs(league_dir)
+                season_dir = next((season_dirs[k] for k in season_keys if k in season_dirs), None)
+                if season_dir:
+                    break
+            
+            # Hiçbir dizin bulunamadıysa
+            if not season_dir:
+                print(f"\n{self.i18n.t('no_match_data_for_season')}")
+                return
+            
+            # Maç dosyalarını listele
+            match_files = {}
+            with os.scandir(season_dir) as entries:
+                for entry in entries:
+                    round_match = _ROUND_FILE_RE.match(entry.name)
+                    if round_match:
+                        match_files[round_match.group(1) or round_match.group(2)] = entry.name
+            
+            if not match_files:
+                print(f"\n{self.i18n.t('no_match_data_for_season')}")
+                return
+            
+            print(f"\n{self.i18n.t('match_files')}")
+            sorted_files = sorted(match_files.items(), key=lambda x: int(x[0]) if x[0].isdigit() else 0)
+            sys.stdout.write("".join(
+                f"{i}. {round_num} {match_file}\n"
+                for i, (round_num, match_file) in enumerate(sorted_files, 1)
+            ))
                 
         except Exception as e:
             logger.error(f"Maçları listelerken hata: {str(e)}")
@@ -496,34 +612,77 @@ class MatchDataMenuHandler:
         self.colors = colors
         self.i18n = get_i18n()
     
-    def fetch_match_details(self) -> None:
-        """Maç detaylarını çeker."""
+    async def _fetch_details_concurrently(self, match_ids: List[str]) -> List[Union[bool, BaseException]]:
+        """
+        Maç detaylarını MAX_CONCURRENT işçiden oluşan bir kuyruk üzerinden çeker.
+        
+        Her işçi bir maçı bitirir bitirmez kuyruktaki sıradaki maça geçer;
+        yavaş bir yanıt diğer maçları bekletmez.
+        
+        Args:
+            match_ids: Maç ID'leri
+            
+        Returns:
+            List[Union[bool, BaseException]]: Her maç için sonuç veya hata (girdi sırasıyla)
+        """
+        queue: "asyncio.Queue[Tuple[int, str]]" = asyncio.Queue()
+        for item in enumerate(match_ids):
+            queue.put_nowait(item)
+        
+        results: List[Union[bool, BaseException]] = [False] * len(match_ids)
+        
+        async def worker() -> None:
+            while True:
+                try:
+                    index, match_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[index] = await asyncio.to_thread(self.match_data_fetcher.fetch_match_details, match_id)
+                except Exception as e:
+                    results[index] = e
+                finally:
+                    queue.task_done()
+        
+        worker_count = min(self.config_manager.get_max_concurrent(), len(match_ids))
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        await queue.join()
+        await asyncio.gather(*workers)
+        return results
+    
+    def fetch_match_details(self, match_ids: Optional[List[str]] = None) -> None:
+        """
+        Maç detaylarını çeker.
+        
+        Args:
+            match_ids: Çekilecek maç ID'leri (None: kullanıcıya sorulur)
+        """
         try:
-            # Giriş yap
-            match_ids_str = input(f"\n{self.i18n.t('match_id_comma')} ").strip()
+            if match_ids is None:
+                # Giriş yap
+                match_ids_str = input(f"\n{self.i18n.t('match_id_comma')} ").strip()
+                match_ids = [id.strip() for id in match_ids_str.split(",") if id.strip()]
+            else:
+                match_ids = [str(match_id).strip() for match_id in match_ids if str(match_id).strip()]
             
-            if not match_ids_str:
+            if not match_ids:
                 print(f"\n{self.i18n.t('valid_match_id_not_found')}")
                 return
             
-            match_ids = [id.strip() for id in match_ids_str.split(",") if id.strip()]
-            
             print(f"\n{self.i18n.t('info_fetching_match_details')}")
             
+            results = asyncio.run(self._fetch_details_concurrently(match_ids))
+            
             success_count = 0
-            for match_id in match_ids:
-                try:
-                    result = self.match_data_fetcher.fetch_match_details(match_id)
-                    
-                    if result:
-                        print(f"✓ Maç ID {match_id}")
-                        success_count += 1
-                    else:
-                        print(f"{self.i18n.t('fetch_details_error')} {match_id}: Detaylar çekilemedi.")
-                        
-                except Exception as e:
-                    logger.error(f"Maç {match_id} için detay çekilirken hata: {str(e)}")
-                    print(f"{self.i18n.t('fetch_details_error')} {match_id}: Hata: {str(e)}")
+            for match_id, result in zip(match_ids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Maç {match_id} için detay çekilirken hata: {str(result)}")
+                    print(f"{self.i18n.t('fetch_details_error')} {match_id}: Hata: {str(result)}")
+                elif result:
+                    print(f"✓ Maç ID {match_id}")
+                    success_count += 1
+                else:
+                    print(f"{self.i18n.t('fetch_details_error')} {match_id}: Detaylar çekilemedi.")
             
             print(f"\n{self.i18n.t('info_match_details_completed')} {success_count}/{len(match_ids)} {self.i18n.t('info_match_successful')}")
             
@@ -548,8 +707,8 @@ class MatchDataMenuHandler:
             print(f"\n{self.i18n.t('title_fetching_details_all')}")
             
             # Ligleri al
-            leagues = self.config_manager.get_leagues()
-            if not leagues:
+            league_items = tuple(self.config_manager.get_leagues().items())
+            if not league_items:
                 print(f"\n{self.i18n.t('error_no_saved_league')}")
                 return
             
@@ -605,14 +764,8 @@ class MatchDataMenuHandler:
                 # Kaç sezon çekileceğini kullanıcıya sor
                 print(f"\n{self.i18n.t('seasons_to_fetch_details')}")
                 print(f"{self.i18n.t('all_seasons_0_last_n')}")
-                max_seasons_input = input(f"{self.i18n.t('season_count')} ")
-                
-                try:
-                    max_seasons = int(max_seasons_input)
-                    if max_seasons < 0:
-                        print(f"{self.i18n.t('enter_valid_number_greater_0')}")
-                        return
-                except ValueError:
+                max_seasons = _parse_int(input(f"{self.i18n.t('season_count')} "))
+                if max_seasons is None:
                     print(f"{self.i18n.t('enter_valid_number')}")
                     return
                 
@@ -634,7 +787,7 @@ class MatchDataMenuHandler:
             elif filter_choice == "2":
                 # Lig listesini görüntüle
                 print("\nLig Listesi:")
-                for i, (league_id, league_name) in enumerate(leagues.items(), 1):
+                for i, (league_id, league_name) in enumerate(league_items, 1):
                     print(f"{i}. {league_name} (ID: {league_id})")
                 
                 # Lig seçimini al
@@ -643,47 +796,35 @@ class MatchDataMenuHandler:
                 if league_choice == "0":
                     return
                     
-                try:
-                    league_index = int(league_choice) - 1
-                    if league_index < 0 or league_index >= len(leagues):
-                        print(f"\nGeçersiz lig numarası!")
-                        return
-                        
-                    # Seçilen ligi al
-                    league_id = list(leagues.keys())[league_index]
-                    league_name = leagues[league_id]
-                    
-                    # Kaç sezon çekileceğini kullanıcıya sor
-                    print(f"\n{self.i18n.t('seasons_to_fetch_details')}")
-                    print(f"{self.i18n.t('all_seasons_0_last_n')}")
-                    max_seasons_input = input(f"{self.i18n.t('season_count')} ")
-                    
-                    try:
-                        max_seasons = int(max_seasons_input)
-                        if max_seasons < 0:
-                            print(f"{self.i18n.t('enter_valid_number_greater_0')}")
-                            return
-                    except ValueError:
-                        print(f"{self.i18n.t('enter_valid_number')}")
-                        return
-                    
-                    print(f"\n{league_name} {self.i18n.t('fetching_match_details_for')}")
-                    if max_seasons > 0:
-                        print(f"Son {max_seasons} {self.i18n.t('info_last_seasons_suffix')}")
-                    else:
-                        print(f"Tüm sezonlar çekilecek")
-                    
-                    # Bu noktada fetch_all_match_details'ı çağır
-                    result = self.match_data_fetcher.fetch_all_match_details(league_id=league_id, max_seasons=max_seasons)
+                league_number = _parse_int(league_choice, 1, len(league_items))
+                if league_number is None:
+                    print(f"\nGeçersiz lig numarası!")
+                    return
                     
-                    if result:
-                        print(f"\n✅ {league_name} {self.i18n.t('match_details_success_for')}")
-                    else:
-                        print(f"\n{self.i18n.t('match_details_error')}")
-                        
-                except ValueError:
-                    print(f"\n{self.i18n.t('invalid_number_format')}")
+                # Seçilen ligi al
+                league_id, league_name = league_items[league_number - 1]
+                
+                # Kaç sezon çekileceğini kullanıcıya sor
+                print(f"\n{self.i18n.t('seasons_to_fetch_details')}")
+                print(f"{self.i18n.t('all_seasons_0_last_n')}")
+                max_seasons = _parse_int(input(f"{self.i18n.t('season_count')} "))
+                if max_seasons is None:
+                    print(f"{self.i18n.t('enter_valid_number')}")
                     return
+                
+                print(f"\n{league_name} {self.i18n.t('fetching_match_details_for')}")
+                if max_seasons > 0:
+                    print(f"Son {max_seasons} {self.i18n.t('info_last_seasons_suffix')}")
+                else:
+                    print(f"Tüm sezonlar çekilecek")
+                
+                # Bu noktada fetch_all_match_details'ı çağır
+                result = self.match_data_fetcher.fetch_all_match_details(league_id=league_id, max_seasons=max_seasons)
+                
+                if result:
+                    print(f"\n✅ {league_name} {self.i18n.t('match_details_success_for')}")
+                else:
+                    print(f"\n{self.i18n.t('match_details_error')}")
             else:
                 print(f"\n{self.i18n.t('invalid_selection')}")
                 return
@@ -736,13 +877,13 @@ class MatchDataMenuHandler:
             # Belirli bir lig için CSV
             elif option == "2":
                 # Ligleri al ve göster
-                leagues = self.config_manager.get_leagues()
-                if not leagues:
+                league_items = tuple(self.config_manager.get_leagues().items())
+                if not league_items:
                     print(f"\n❌ {self.i18n.t('error_no_saved_league')}")
                     return
                 
                 print("\nLig Listesi:")
-                for i, (league_id, league_name) in enumerate(leagues.items(), 1):
+                for i, (league_id, league_name) in enumerate(league_items, 1):
                     print(f"{i}. {league_name} (ID: {league_id})")
                 
                 # Lig seçimini al
@@ -751,31 +892,25 @@ class MatchDataMenuHandler:
                 if league_choice == "0":
                     return
                     
-                try:
-                    league_index = int(league_choice) - 1
-                    if league_index < 0 or league_index >= len(leagues):
-                        print(f"\n❌ Geçersiz lig numarası!")
-                        return
-                        
-                    # Seçilen ligi al
-                    league_id = list(leagues.keys())[league_index]
-                    league_name = leagues[league_id]
-                    
-                    print(f"\n'{league_name}' (ID: {league_id}) {self.i18n.t('creating_csv_for')}")
-                    
-                    result = self.match_data_fetcher.convert_league_matches_to_csv(league_id)
-                    
-                    if result:
-                        csv_paths = result
-                        print(f"\n{self.i18n.t('csv_files_created_success')}")
-                        for csv_path in csv_paths:
-                            print(f"  - {csv_path}")
-                    else:
-                        print(f"\n{self.i18n.t('csv_files_created_error')}")
-                        
-                except ValueError:
-                    print(f"\n❌ {self.i18n.t('invalid_number_format')}")
+                league_number = _parse_int(league_choice, 1, len(league_items))
+                if league_number is None:
+                    print(f"\n❌ Geçersiz lig numarası!")
                     return
+                    
+                # Seçilen ligi al
+                league_id, league_name = league_items[league_number - 1]
+                
+                print(f"\n'{league_name}' (ID: {league_id}) {self.i18n.t('creating_csv_for')}")
+                
+                result = self.match_data_fetcher.convert_league_matches_to_csv(league_id)
+                
+                if result:
+                    csv_paths = result
+                    print(f"\n{self.i18n.t('csv_files_created_success')}")
+                    for csv_path in csv_paths:
+                        print(f"  - {csv_path}")
+                else:
+                    print(f"\n{self.i18n.t('csv_files_created_error')}")
             
             # Tüm ligler için CSV
             elif option == "3":
@@ -783,8 +918,7 @@ class MatchDataMenuHandler:
                 
                 if isinstance(result, list):
                     print(f"\n✅ {len(result)} lig için CSV dosyaları başarıyla oluşturuldu:")
-                    for csv_path in result:
-                        print(f"  - {csv_path}")
+                    sys.stdout.write("".join(f"  - {csv_path}\n" for csv_path in result))
                 elif result:
                     print(f"\n{self.i18n.t('csv_created_success')} {result}")
                 else:
@@ -3,21 +3,23 @@ SofaScore Scraper için menü işlemleri modülü.
 Bu modül, lig ve sezon ile ilgili UI işlemlerini içerir.
 """
 
+import csv
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Callable, Dict, List, Optional
-from colorama import Fore, Style
 
 from src.config_manager import ConfigManager
 from src.season_fetcher import SeasonFetcher
 from src.logger import get_logger
-
-# Logger'ı al
-from src.logger import get_logger
 from src.i18n import get_i18n
 
 # Logger'ı al
 logger = get_logger("MenuUI")
 
+# Bu sayıdan fazla sezon ekrana basılmadan önce CSV'ye kaydetme önerilir
+SEASON_CSV_THRESHOLD = 200
+
 
 class LeagueMenuHandler:
     """Lig yönetimi menü işlemleri sınıfı."""
@@ -32,6 +34,11 @@ class LeagueMenuHandler:
         """
         self.config_manager = config_manager
         self.colors = colors
+        # Sık kullanılan renk önekleri bir kez çözülür
+        self._c_ok = colors['SUCCESS']
+        self._c_dim = colors['DIM']
+        self._c_warn = colors['WARNING']
+        self._c_sub = colors['SUBTITLE']
         self.i18n = get_i18n()
     
     def list_leagues(self) -> None:
@@ -39,17 +46,19 @@ class LeagueMenuHandler:
         try:
             leagues = self.config_manager.get_leagues()
             
-            print(f"\n{self.colors['SUBTITLE']}{self.i18n.t('configured_leagues_list')} ({len(leagues)}):")
+            print(f"\n{self._c_sub}{self.i18n.t('configured_leagues_list')} ({len(leagues)}):")
             print("-" * 50)
             
             if not leagues:
-                print(f"{self.colors['WARNING']}{self.i18n.t('no_configured_leagues')}")
+                print(f"{self._c_warn}{self.i18n.t('no_configured_leagues')}")
                 return
                 
             sorted_leagues = sorted(leagues.items(), key=lambda x: x[1])
             
-            for league_id, league_name in sorted_leagues:
-                print(f"{self.colors['SUCCESS']}{league_name} {self.colors['DIM']}(ID: {league_id})")
+            sys.stdout.write("".join(
+                f"{self._c_ok}{league_name} {self._c_dim}(ID: {league_id})\n"
+                for league_id, league_name in sorted_leagues
+            ))
                 
         except Exception as e:
             logger.error(f"Ligler listelenirken hata: {str(e)}")
@@ -57,55 +66,57 @@ class LeagueMenuHandler:
     def add_new_league(self) -> None:
         """Yeni bir lig ekler."""
         try:
-            print(f"\n{self.colors['SUBTITLE']}{self.i18n.t('add_new_league_title')}")
+            print(f"\n{self._c_sub}{self.i18n.t('add_new_league_title')}")
             print("-" * 50)
             
             # Lig adını al
             league_name = input(f"{self.i18n.t('league_name_prompt')} ").strip()
             if not league_name:
-                print(f"{self.colors['WARNING']}{self.i18n.t('league_name_empty_error')}")
+                print(f"{self._c_warn}{self.i18n.t('league_name_empty_error')}")
                 return
             
             # Lig ID'sini al
             league_id_str = input(f"{self.i18n.t('league_id_prompt')} ").strip()
-            if not league_id_str.isdigit():
-                print(f"{self.colors['WARNING']}{self.i18n.t('invalid_id_format')}")
+            try:
+                league_id = int(league_id_str)
+                # Negatif ID'ler de geçersiz
+                if league_id < 0:
+                    raise ValueError(league_id_str)
+            except ValueError:
+                print(f"{self._c_warn}{self.i18n.t('invalid_id_format')}")
                 return
-                
-            league_id = int(league_id_str)
             
             # Ligi ekle
             success = self.config_manager.add_league(league_name, league_id)
             
             if success:
-                print(f"\n{self.colors['SUCCESS']}✅ {self.i18n.t('league_added_success', league_name=league_name, league_id=league_id)}")
+                print(f"\n{self._c_ok}✅ {self.i18n.t('league_added_success', league_name=league_name, league_id=league_id)}")
             else:
-                print(f"\n{self.colors['WARNING']}❌ {self.i18n.t('league_add_error')}")
+                print(f"\n{self._c_warn}❌ {self.i18n.t('league_add_error')}")
                 
         except Exception as e:
             logger.error(f"Lig eklenirken hata: {str(e)}")
-            print(f"\n{self.colors['WARNING']}Hata: {str(e)}")
+            print(f"\n{self._c_warn}Hata: {str(e)}")
     
     def reload_leagues(self) -> None:
         """Lig yapılandırmasını yeniden yükler."""
         try:
             success = self.config_manager.reload_config()
-            leagues = self.config_manager.get_leagues()
-            leagues_count = len(leagues)
             
             if success:
-                print(f"\n{self.colors['SUCCESS']}✅ {self.i18n.t('league_config_reloaded')} ({len(leagues)} lig)")
+                leagues_count = len(self.config_manager.get_leagues())
+                print(f"\n{self._c_ok}✅ {self.i18n.t('league_config_reloaded')} ({leagues_count} lig)")
             else:
-                print(f"\n{self.colors['WARNING']}❌ {self.i18n.t('config_reload_error')}")
+                print(f"\n{self._c_warn}❌ {self.i18n.t('config_reload_error')}")
                 
         except Exception as e:
             logger.error(f"Ligler yeniden yüklenirken hata: {str(e)}")
-            print(f"\n{self.colors['WARNING']}Hata: {str(e)}")
+            print(f"\n{self._c_warn}Hata: {str(e)}")
     
     def search_leagues(self) -> None:
         """Ligleri arama işlemi."""
         try:
-            print(f"\n{self.colors['SUBTITLE']}{self.i18n.t('submenu_league_search').replace(' (Henüz Uygulanmadı)', '').replace(' (Not Implemented)', '')}")
+            print(f"\n{self._c_sub}{self.i18n.t('submenu_league_search').replace(' (Henüz Uygulanmadı)', '').replace(' (Not Implemented)', '')}")
             print("-" * 50)
             
             search_term = input(f"{self.i18n.t('search_prompt')} ").strip().lower()
@@ -113,23 +124,18 @@ class LeagueMenuHandler:
             if not search_term:
                 return
 
-            leagues = self.config_manager.get_leagues()
-            found_leagues = []
-            
-            for league_id, league_name in leagues.items():
-                if search_term in league_name.lower():
-                    found_leagues.append((league_id, league_name))
+            found_leagues = self.config_manager.search_leagues(search_term)
             
             if found_leagues:
-                print(f"\n{self.colors['SUCCESS']}{self.i18n.t('search_results_title', count=len(found_leagues))}")
+                print(f"\n{self._c_ok}{self.i18n.t('search_results_title', count=len(found_leagues))}")
                 for league_id, league_name in found_leagues:
-                     print(f"  {self.colors['SUCCESS']}● {league_name} {self.colors['DIM']}(ID: {league_id})")
+                     print(f"  {self._c_ok}● {league_name} {self._c_dim}(ID: {league_id})")
             else:
-                print(f"\n{self.colors['WARNING']}{self.i18n.t('no_matches_found')}")
+                print(f"\n{self._c_warn}{self.i18n.t('no_matches_found')}")
 
         except Exception as e:
             logger.error(f"Lig arama işlemi sırasında hata: {str(e)}")
-            print(f"\n{self.colors['WARNING']}Hata: {str(e)}")
+            print(f"\n{self._c_warn}Hata: {str(e)}")
 
 
 class SeasonMenuHandler:
@@ -147,8 +153,21 @@ class SeasonMenuHandler:
         self.config_manager = config_manager
         self.season_fetcher = season_fetcher
         self.colors = colors
-        self.league_menu = LeagueMenuHandler(config_manager, colors)
+        # Sık kullanılan renk önekleri bir kez çözülür
+        self._c_ok = colors['SUCCESS']
+        self._c_dim = colors['DIM']
+        self._c_warn = colors['WARNING']
+        self._c_info = colors['INFO']
+        self._c_sub = colors['SUBTITLE']
         self.i18n = get_i18n()
+        self._league_menu: Optional[LeagueMenuHandler] = None
+    
+    @property
+    def league_menu(self) -> LeagueMenuHandler:
+        """Lig menüsü işleyicisi; geriye dönük uyumluluk için ilk erişimde oluşturulur."""
+        if self._league_menu is None:
+            self._league_menu = LeagueMenuHandler(self.config_manager, self.colors)
+        return self._league_menu
     
     def update_all_seasons(
         self,
@@ -156,63 +175,70 @@ class SeasonMenuHandler:
     ) -> None:
         """Tüm ligler için sezon verilerini günceller."""
         try:
-            leagues = self.config_manager.get_leagues()
-            
-            if not leagues:
-                print(f"\n{self.colors['WARNING']}❌ {self.i18n.t('no_leagues_defined')}")
-                return
-                
-            print(f"\n{self.i18n.t('fetching_seasons_for_all')}")
-            
-            league_list = list(leagues.items())
-            n_leagues = len(league_list)
-            if progress_callback and n_leagues > 0:
-                progress_callback(0, n_leagues, f"Seasons 0/{n_leagues} (starting)")
-            
             total_seasons = 0
-            for idx, (league_id, league_name) in enumerate(league_list):
-                try:
+            # Ağ beklemesi ligler arasında örtüşsün diye istekler paralel gönderilir;
+            # ligler üretildikçe kuyruğa girer, sonuçlar tamamlanma sırasıyla raporlanır
+            with ThreadPoolExecutor(max_workers=max(1, self.config_manager.get_max_concurrent())) as executor:
+                futures = {}
+                for league_id, league_name in self.config_manager.iter_leagues():
+                    if not futures:
+                        print(f"\n{self.i18n.t('fetching_seasons_for_all')}")
+                    futures[executor.submit(self.season_fetcher.fetch_seasons_for_league, league_id)] = league_name
                     print(f"  - {self.i18n.t('fetching_seasons_for', league_name=league_name, league_id=league_id)}")
-                    
-                    # Tüm sezonları çek
-                    all_seasons = self.season_fetcher.fetch_seasons_for_league(league_id)
-                    total_seasons += len(all_seasons)
-                    
-                    print(f"    ✓ {self.i18n.t('seasons_found_count', count=len(all_seasons))}")
-                    if progress_callback and n_leagues > 0:
-                        progress_callback(
-                            idx + 1,
-                            n_leagues,
-                            f"Seasons {idx + 1}/{n_leagues}: {league_name}",
-                        )
-                except Exception as e:
-                    logger.error(f"{league_name} için sezon verisi çekilirken hata: {str(e)}")
-                    print(f"    ✗ Hata: {str(e)}")
-                    if progress_callback and n_leagues > 0:
-                        progress_callback(
-                            idx + 1,
-                            n_leagues,
-                            f"Seasons {idx + 1}/{n_leagues}: {league_name} (error)",
-                        )
+                
+                if not futures:
+                    print(f"\n{self._c_warn}❌ {self.i18n.t('no_leagues_defined')}")
+                    return
+                
+                n_leagues = len(futures)
+                if progress_callback:
+                    progress_callback(0, n_leagues, f"Seasons 0/{n_leagues} (starting)")
+                
+                for done, future in enumerate(as_completed(futures), 1):
+                    league_name = futures[future]
+                    try:
+                        # Tüm sezonları çek
+                        all_seasons = future.result()
+                        total_seasons += len(all_seasons)
+                        
+                        print(f"    ✓ {league_name}: {self.i18n.t('seasons_found_count', count=len(all_seasons))}")
+                        if progress_callback:
+                            progress_callback(
+                                done,
+                                n_leagues,
+                                f"Seasons {done}/{n_leagues}: {league_name}",
+                            )
+                    except Exception as e:
+                        logger.error(f"{league_name} için sezon verisi çekilirken hata: {str(e)}")
+                        print(f"    ✗ {league_name}: Hata: {str(e)}")
+                        if progress_callback:
+                            progress_callback(
+                                done,
+                                n_leagues,
+                                f"Seasons {done}/{n_leagues}: {league_name} (error)",
+                            )
             
-            print(f"\n{self.colors['SUCCESS']}✅ {self.i18n.t('all_seasons_fetched_success', count=total_seasons)}")
+            print(f"\n{self._c_ok}✅ {self.i18n.t('all_seasons_fetched_success', count=total_seasons)}")
             
         except Exception as e:
             logger.error(f"Tüm sezon verileri güncellenirken hata: {str(e)}")
-            print(f"\n{self.colors['WARNING']}❌ Hata: {str(e)}")
+            print(f"\n{self._c_warn}❌ Hata: {str(e)}")
     
     def update_league_seasons(self) -> None:
         """Belirli bir lig için sezon verilerini günceller."""
         try:
-            leagues = self.config_manager.get_leagues()
+            # Listeleme ve seçim aynı (ID, ad) çiftleri üzerinden yapılır
+            league_items = tuple(self.config_manager.get_leagues().items())
             
-            if not leagues:
-                print(f"\n{self.colors['WARNING']}❌ {self.i18n.t('no_leagues_defined')}")
+            if not league_items:
+                print(f"\n{self._c_warn}❌ {self.i18n.t('no_leagues_defined')}")
                 return
             
             print(f"\n{self.i18n.t('league_list')}")
-            for i, (league_id, league_name) in enumerate(leagues.items(), 1):
-                print(f"{i}. {league_name} (ID: {league_id})")
+            sys.stdout.write("".join(
+                f"{i}. {league_name} (ID: {league_id})\n"
+                for i, (league_id, league_name) in enumerate(league_items, 1)
+            ))
             
             league_choice = input(f"\n{self.i18n.t('select_league_to_update')} ").strip()
             
@@ -221,58 +247,99 @@ class SeasonMenuHandler:
                 
             try:
                 league_index = int(league_choice) - 1
-                if league_index < 0 or league_index >= len(leagues):
-                    print(f"\n{self.colors['WARNING']}{self.i18n.t('invalid_league_num')}")
+                if league_index < 0 or league_index >= len(league_items):
+                    print(f"\n{self._c_warn}{self.i18n.t('invalid_league_num')}")
                     return
                     
                 # Seçilen ligi al
-                league_id = list(leagues.keys())[league_index]
-                league_name = leagues[league_id]
+                league_id, league_name = league_items[league_index]
                 
-                print(f"\n{self.colors['SUBTITLE']}{self.i18n.t('fetching_seasons_title', league_name=league_name, league_id=league_id)}")
+                print(f"\n{self._c_sub}{self.i18n.t('fetching_seasons_title', league_name=league_name, league_id=league_id)}")
                 
                 # Tüm sezonları çek
                 all_seasons = self.season_fetcher.fetch_seasons_for_league(league_id)
                 
-                print(f"\n{self.colors['SUCCESS']}✅ {self.i18n.t('seasons_fetched_success', count=len(all_seasons))}")
-                for season in all_seasons:
-                    print(f"  - {season.get('name', self.i18n.t('unnamed_season'))} ({season.get('year', self.i18n.t('no_year_info'))})")
+                unnamed_season = self.i18n.t('unnamed_season')
+                no_year_info = self.i18n.t('no_year_info')
+                
+                # Çok sayıda sezon varsa terminal yerine dosyaya yazmayı öner
+                if len(all_seasons) > SEASON_CSV_THRESHOLD:
+                    save_csv = input(f"\n{self.i18n.t('save_seasons_csv_prompt', count=len(all_seasons))} ").strip().lower()
+                    if save_csv in ["e", "evet", "y", "yes", "true", "1"]:
+                        csv_path = os.path.join(self.season_fetcher.seasons_dir, f"league_{league_id}_seasons.csv")
+                        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                            writer = csv.writer(f)
+                            writer.writerow(['id', 'name', 'year'])
+                            writer.writerows(
+                                (season.get('id', '?'), season.get('name', unnamed_season), season.get('year', no_year_info))
+                                for season in all_seasons
+                            )
+                        print(f"\n{self._c_ok}✅ {self.i18n.t('seasons_saved_csv', path=csv_path)}")
+                        return
+                
+                print(f"\n{self._c_ok}✅ {self.i18n.t('seasons_fetched_success', count=len(all_seasons))}")
+                sys.stdout.write("".join(
+                    f"  - {season.get('name', unnamed_season)} ({season.get('year', no_year_info)})\n"
+                    for season in all_seasons
+                ))
                 
             except ValueError:
-                print(f"\n{self.colors['WARNING']}{self.i18n.t('invalid_number_format')}")
+                print(f"\n{self._c_warn}{self.i18n.t('invalid_number_format')}")
             except Exception as e:
                 logger.error(f"Lig sezonları güncellenirken hata: {str(e)}")
-                print(f"\n{self.colors['WARNING']}❌ Hata: {str(e)}")
+                print(f"\n{self._c_warn}❌ Hata: {str(e)}")
                 
         except Exception as e:
             logger.error(f"Lig sezonları güncellenirken hata: {str(e)}")
-            print(f"\n{self.colors['WARNING']}❌ Hata: {str(e)}")
+            print(f"\n{self._c_warn}❌ Hata: {str(e)}")
     
     def list_seasons(self) -> None:
         """Ligler ve sezonları listeler."""
         try:
-            print(f"\n{self.colors['SUBTITLE']}{self.i18n.t('league_season_list_title')}")
+            print(f"\n{self._c_sub}{self.i18n.t('league_season_list_title')}")
             print("-" * 50)
             
             seasons_data = self.season_fetcher.league_seasons
             leagues = self.config_manager.get_leagues()
+            unknown_league = self.i18n.t('unknown_league')
+            
+            # Yapılandırmadaki ligler önceden sıralı sırayla; yapılandırmada
+            # olmayan (bilinmeyen) ligler sonda, kendi aralarında ID'ye göre
+            ordered_ids = [
+                league_id for league_id in self.config_manager.sorted_league_ids()
+                if league_id in seasons_data
+            ]
+            ordered_ids.extend(sorted(
+                (league_id for league_id in seasons_data if league_id not in leagues),
+                key=str,
+            ))
+            
+            # Tüm liste tek bir tamponda toplanıp tek seferde yazılır
+            info, dim, success = self._c_info, self._c_dim, self._c_ok
+            unknown_season = self.i18n.t("unknown_season")
+            year_label = self.i18n.t('year')
+            lines = []
             
             # Lig bazında verileri görüntüle
-            for league_id, league_seasons in sorted(seasons_data.items(), key=lambda x: leagues.get(x[0], f"{self.i18n.t('unknown_league')} {x[0]}")):
-                league_name = leagues.get(league_id, f"{self.i18n.t('unknown_league')} {league_id}")
-                print(f"\n{self.colors['INFO']}● {league_name} {self.colors['DIM']}(ID: {league_id}):")
+            for league_id in ordered_ids:
+                league_seasons = seasons_data[league_id]
+                league_name = leagues.get(league_id, f"{unknown_league} {league_id}")
+                lines.append(f"\n{info}● {league_name} {dim}(ID: {league_id}):")
                 
                 # Sezonları listeye
                 if not league_seasons:
-                    print(f"  {self.colors['WARNING']}{self.i18n.t('no_seasons_found_for_league')}")
+                    lines.append(f"  {self._c_warn}{self.i18n.t('no_seasons_found_for_league')}")
                     continue
                     
                 for season in league_seasons:
                     season_id = season.get("id", "?")
-                    season_name = season.get("name", self.i18n.t("unknown_season"))
+                    season_name = season.get("name", unknown_season)
                     season_year = season.get("year", "?")
-                    print(f"  {self.colors['SUCCESS']}○ {season_name} {self.colors['DIM']}(ID: {season_id}{self.i18n.t('year')} {season_year})")
+                    lines.append(f"  {success}○ {season_name} {dim}(ID: {season_id}{year_label} {season_year})")
+            
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
             
         except Exception as e:
             logger.error(f"Sezonları listelerken hata: {str(e)}")
-            print(f"\n{self.colors['WARNING']}Hata: {str(e)}") 
\ No newline at end of file
+            print(f"\n{self._c_warn}Hata: {str(e)}") 
\ No newline at end of file
@@ -4,11 +4,20 @@ Bu modül, yapılandırma, renk teması ve sistem ayarları gibi işlemleri içe
 """
 
 import os
+import errno
 import json
 import shutil
-from typing import Dict, Any, Optional, List
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 from colorama import Fore, Style
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from src.config_manager import ConfigManager
 from src.logger import get_logger
 from src.i18n import get_i18n
@@ -16,10 +25,289 @@ from src.i18n import get_i18n
 # Logger'ı al
 logger = get_logger("SettingsUI")
 
+# Onay olarak kabul edilen yanıtlar
+_YES = frozenset(("e", "evet", "y", "yes", "true", "1"))
+
+# Çekirdek hızlı yolu yoksa büyük dosyalar bu blok boyutuyla kopyalanır
+_COPY_BUFSIZE = 8 * 1024 * 1024
+
+# Linux FICLONE ioctl: btrfs/xfs gibi dosya sistemlerinde dosyayı veri kopyalamadan klonlar
+_FICLONE = 0x40049409 if sys.platform.startswith("linux") and fcntl is not None else None
+
+
+def _fast_copy_file(src: str, dst: str) -> str:
+    """
+    Dosyayı önce FICLONE ile klonlamayı (reflink, veri bloğu kopyalanmaz),
+    olmazsa os.copy_file_range ile çekirdek içinde kopyalamayı dener;
+    ikisi de desteklenmezse büyük dosyaları 8 MiB bloklarla, küçükleri
+    shutil.copy2 ile kopyalar.
+    
+    Args:
+        src: Kaynak dosya yolu
+        dst: Hedef dosya yolu
+        
+    Returns:
+        str: Hedef dosya yolu
+    """
+    if _FICLONE is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            # Reflink desteklenmiyor ya da farklı dosya sistemi: çekirdek kopyasına geç
+            pass
+    
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                if hasattr(os, "posix_fadvise"):
+                    # Çekirdeğe sıralı okuma yapılacağını bildir (readahead)
+                    os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            # Farklı dosya sistemi, eski çekirdek vb.: klasik kopyaya dön
+            pass
+    
+    if os.path.getsize(src) > _COPY_BUFSIZE:
+        # Arabelleksiz açılır; tek arabellek copyfileobj'un kendi bloğudur
+        with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+        shutil.copystat(src, dst)
+        return dst
+    return shutil.copy2(src, dst)
+
+
+def _iter_copy_pairs(src_dir: str, dst_dir: str) -> Iterator[Tuple[str, str]]:
+    """
+    Kaynak ağacı gezer, hedefte dizinleri oluşturur ve kopyalanacak
+    (kaynak dosya, hedef dosya) çiftlerini üretir.
+    
+    Args:
+        src_dir: Kaynak dizin
+        dst_dir: Hedef dizin
+        
+    Yields:
+        Tuple[str, str]: Kaynak ve hedef dosya yolları
+    """
+    # Kök için ara dizinler de oluşturulur; os.walk yukarıdan aşağı gezdiği için
+    # alt dizinlerde üst dizin hazırdır ve tek mkdir yeterlidir
+    os.makedirs(dst_dir, exist_ok=True)
+    for dirpath, _dirnames, filenames in os.walk(src_dir, followlinks=True):
+        target_dir = os.path.join(dst_dir, os.path.relpath(dirpath, src_dir))
+        if dirpath != src_dir:
+            try:
+                os.mkdir(target_dir)
+            except FileExistsError:
+                pass
+        for filename in filenames:
+            yield os.path.join(dirpath, filename), os.path.join(target_dir, filename)
+
+
+def _scan_names(path: str) -> Tuple[set, set]:
+    """
+    Bir dizindeki alt dizin ve dosya adlarını tek os.scandir geçişiyle toplar.
+    
+    Args:
+        path: Taranacak dizin
+        
+    Returns:
+        Tuple[set, set]: (alt dizin adları, dosya adları); dizin yoksa boş kümeler
+    """
+    dirs, files = set(), set()
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.add(entry.name)
+                elif entry.is_file():
+                    files.add(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return dirs, files
+
+
+def _chmod_and_retry(func, path, _exc_info) -> None:
+    """
+    shutil.rmtree hata işleyicisi: salt okunur dosyaları (özellikle Windows'ta)
+    yazılabilir yapıp silme işlemini bir kez daha dener; yine olmazsa hata iletilir.
+    """
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _force_rmtree(path: str) -> None:
+    """
+    Dizin ağacını shutil.rmtree ile siler; salt okunur girdiler yazılabilir
+    yapılıp yeniden denenir. Kullanıcının verdiği yol hiçbir kabuk ya da dış
+    araca aktarılmaz.
+    
+    Args:
+        path: Silinecek dizin
+    """
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_chmod_and_retry)
+    else:
+        shutil.rmtree(path, onerror=_chmod_and_retry)
+
+
+def _remove_empty_tree(path: str) -> None:
+    """
+    Yalnızca boş dizinlerden oluşan bir ağacı aşağıdan yukarı os.rmdir ile
+    siler. İçinde dosya kalmışsa OSError yükselir; hiçbir dosya silinmez.
+    
+    Args:
+        path: Silinecek dizin
+    """
+    for dirpath, _dirnames, _filenames in os.walk(path, topdown=False):
+        os.rmdir(dirpath)
+
+
+def _verify_copied_tree(src_dir: str, dst_dir: str) -> None:
+    """
+    Kaynak ağaçtaki her dosyanın hedefte aynı boyutla bulunduğunu doğrular.
+    
+    Args:
+        src_dir: Kaynak dizin
+        dst_dir: Hedef dizin
+        
+    Raises:
+        OSError: Hedefte eksik ya da boyutu farklı dosya varsa
+    """
+    for dirpath, _dirnames, filenames in os.walk(src_dir, followlinks=True):
+        target_dir = os.path.join(dst_dir, os.path.relpath(dirpath, src_dir))
+        for filename in filenames:
+            src_path = os.path.join(dirpath, filename)
+            dst_path = os.path.join(target_dir, filename)
+            if os.stat(src_path).st_size != os.stat(dst_path).st_size:
+                raise OSError(errno.EIO, "Kopya doğrulanamadı, kaynak korunuyor", dst_path)
+
+
+def _same_path(first: str, second: str) -> bool:
+    """
+    İki yolun aynı dizini gösterip göstermediğini yazılışından bağımsız
+    (göreli/mutlak, sondaki ayraç, Windows'ta büyük/küçük harf, sembolik
+    bağlantı) denetler.
+    
+    Args:
+        first: Birinci yol
+        second: İkinci yol
+        
+    Returns:
+        bool: Aynı dizinse True
+    """
+    try:
+        if os.path.samefile(first, second):
+            return True
+    except OSError:
+        # Yollardan biri henüz yok
+        pass
+    return os.path.normcase(os.path.realpath(first)) == os.path.normcase(os.path.realpath(second))
+
+
+def _is_nested_path(first: str, second: str) -> bool:
+    """
+    Yollardan birinin diğerinin altında olup olmadığını denetler.
+    
+    Args:
+        first: Birinci yol
+        second: İkinci yol
+        
+    Returns:
+        bool: Biri diğerini içeriyorsa (ya da aynı dizinse) True
+    """
+    real_first = os.path.normcase(os.path.realpath(first))
+    real_second = os.path.normcase(os.path.realpath(second))
+    try:
+        common = os.path.commonpath([real_first, real_second])
+    except ValueError:
+        # Windows'ta farklı sürücüler
+        return False
+    return common in (real_first, real_second)
+
+
+def _rename_tree(src_dir: str, dst_dir: str) -> None:
+    """
+    Aynı dosya sistemindeki bir dizinin girdilerini hedefe yeniden adlandırarak
+    taşır; veri kopyalanmaz. Hedefte zaten var olan alt dizinler birleştirilir.
+    
+    Args:
+        src_dir: Kaynak dizin
+        dst_dir: Var olan hedef dizin
+    """
+    # Özyineleme yerine açık yığın: derin ağaçlarda çerçeve maliyeti ve RecursionError olmaz
+    stack = [(src_dir, dst_dir)]
+    while stack:
+        current_src, current_dst = stack.pop()
+        with os.scandir(current_src) as entries:
+            for entry in entries:
+                dest_path = os.path.join(current_dst, entry.name)
+                if entry.is_dir(follow_symlinks=False) and os.path.isdir(dest_path):
+                    stack.append((entry.path, dest_path))
+                else:
+                    os.replace(entry.path, dest_path)
+
+
+def _copy_if_changed(src: str, dst: str) -> str:
+    """
+    shutil.copytree için kopyalama fonksiyonu: hedefte boyutu ve değişiklik
+    zamanı aynı olan dosyaları atlar, diğerlerini _fast_copy_file ile kopyalar.
+    
+    Args:
+        src: Kaynak dosya yolu
+        dst: Hedef dosya yolu
+        
+    Returns:
+        str: Hedef dosya yolu
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+        if src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+            return dst
+    except OSError:
+        pass
+    return _fast_copy_file(src, dst)
+
 
 class SettingsMenuHandler:
     """Ayarlar menü işlemleri sınıfı."""
     
+    # Örnek özellikleri sabit; __dict__ yerine slot erişimi kullanılır
+    __slots__ = (
+        "config_manager", "data_dir", "colors", "i18n", "_data_subdirs",
+        "_env_path", "_env_cache", "_env_pending", "_msg_cache", "_about_cache",
+    )
+    
+    # Veri dizini altındaki veri türleri (temizleme menüsündeki sırayla)
+    DATA_TYPES = ("seasons", "matches", "match_details", "datasets", "reports")
+    
+    # Yedekleme/geri yükleme menüsündeki seçim -> (alt dizin, bilgi anahtarı, başarı anahtarı)
+    BACKUP_STEPS = {
+        2: ("seasons", "info_backing_up_season_data", "success_backup_season_data"),
+        3: ("matches", "info_backing_up_match_data", "success_backup_match_data"),
+        4: ("match_details", "info_backing_up_match_details", "success_backup_match_details"),
+    }
+    # API menüsündeki sayısal ayarlar: (çevre değişkeni, etiket anahtarı, varsayılan, en küçük değer)
+    API_INT_PROMPTS = (
+        ("REQUEST_TIMEOUT", "request_timeout", "30", 1),
+        ("MAX_RETRIES", "max_retries", "3", 0),
+        ("MAX_CONCURRENT", "max_concurrent", "25", 1),
+    )
+    RESTORE_STEPS = {
+        2: ("seasons", "info_restoring_league_season_data", "success_restore_season_data"),
+        3: ("matches", "info_restoring_match_data", "success_restore_match_data"),
+        4: ("match_details", "info_restoring_match_details", "success_restore_match_details"),
+    }
+    
     def __init__(
         self, 
         config_manager: ConfigManager,
@@ -38,6 +326,102 @@ class SettingsMenuHandler:
         self.data_dir = data_dir
         self.colors = colors
         self.i18n = get_i18n()
+        # Veri türü -> alt dizin yolu (yedekleme ve temizlemede tekrar kullanılır)
+        self._data_subdirs = {name: os.path.join(data_dir, name) for name in self.DATA_TYPES}
+        # .env bir kez okunur; değişmeyen değerler için dosya yeniden yazılmaz
+        self._env_path = os.path.join(os.getcwd(), ".env")
+        self._env_cache = self._load_env()
+        # Menüde yapılan değişiklikler biriktirilir ve flush() ile tek seferde yazılır
+        self._env_pending: Dict[str, str] = {}
+        # (dil, renk, anahtar) -> hazır renkli mesaj; dil değişirse yeni anahtar üretilir
+        self._msg_cache: Dict[Tuple[str, str, str], str] = {}
+        # Dil -> hazır "Hakkında" metni
+        self._about_cache: Dict[str, str] = {}
+    
+    def _msg(self, color: str, key: str) -> str:
+        """
+        Renkli ve çevrilmiş bir mesajı bir kez oluşturup önbellekten döndürür.
+        
+        Args:
+            color: Renk sözlüğü anahtarı (WARNING, INFO vb.)
+            key: Çeviri anahtarı
+            
+        Returns:
+            str: Başında satır sonu olan renkli mesaj
+        """
+        cache_key = (self.i18n.current_lang, color, key)
+        text = self._msg_cache.get(cache_key)
+        if text is None:
+            text = f"\n{self.colors[color]}{self.i18n.t(key)}"
+            self._msg_cache[cache_key] = text
+        return text
+    
+    def _load_env(self) -> Dict[str, str]:
+        """
+        .env dosyasındaki anahtar/değer çiftlerini okur.
+        
+        Returns:
+            Dict[str, str]: Dosyadaki sırayla anahtar/değer çiftleri
+        """
+        env_vars: Dict[str, str] = {}
+        try:
+            with open(self._env_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith('#') or '=' not in line:
+                        continue
+                    key, value = line.split('=', 1)
+                    env_vars[key.strip()] = value.strip()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f".env dosyası okunamadı: {str(e)}")
+        return env_vars
+    
+    def _update_env(self, updates: Dict[str, str]) -> None:
+        """
+        Değeri değişen çevre değişkenlerini hemen etkinleştirir; .env dosyasına
+        yazımı menüden çıkılana kadar (flush) erteler.
+        
+        Args:
+            updates: Değişken adı -> yeni değer sözlüğü
+        """
+        changed = {k: v for k, v in updates.items() if self._env_cache.get(k) != v}
+        if changed:
+            os.environ.update(changed)
+            self._env_cache.update(changed)
+            self._env_pending.update(changed)
+    
+    def _write_pending_env(self) -> bool:
+        """
+        Biriken .env değişikliklerini tek seferde dosyaya yazar. Yazılamazsa
+        değişiklikler bekletilir ve sonraki çağrıda yeniden denenir.
+        
+        Returns:
+            bool: Başarılı olursa (ya da bekleyen değişiklik yoksa) True
+        """
+        if not self._env_pending:
+            return True
+        if not self.config_manager.update_env_variables(self._env_pending):
+            return False
+        self._env_pending.clear()
+        return True
+    
+    def flush(self) -> bool:
+        """
+        Biriken .env değişikliklerini yazar ve sonucu kullanıcıya bildirir.
+        
+        Returns:
+            bool: Başarılı olursa (ya da bekleyen değişiklik yoksa) True
+        """
+        if not self._env_pending:
+            return True
+        
+        if not self._write_pending_env():
+            print(f"\n{self.colors['WARNING']}{self.i18n.t('error_saving_env_settings')}")
+            return False
+        print(f"\n{self.colors['SUCCESS']}✅ {self.i18n.t('settings_saved_to_env')}")
+        return True
     
     def edit_config(self) -> None:
         """Yapılandırma dosyasını düzenler."""
@@ -78,18 +462,20 @@ class SettingsMenuHandler:
             
             # Mevcut değerleri ConfigManager'dan al
             base_url = self.config_manager.get_api_base_url()
-            request_timeout = os.getenv("REQUEST_TIMEOUT", "30")
-            max_retries = os.getenv("MAX_RETRIES", "3")
             use_proxy = self.config_manager.get_use_proxy()
             proxy_url = self.config_manager.get_proxy_url()
-            max_concurrent = os.getenv("MAX_CONCURRENT", "25")
+            current = {"API_BASE_URL": base_url}
+            for env_key, _label_key, default, _minimum in self.API_INT_PROMPTS:
+                current[env_key] = os.getenv(env_key, default)
+            current["USE_PROXY"] = "true" if use_proxy else "false"
+            current["PROXY_URL"] = proxy_url if use_proxy else ""
             
             # Mevcut yapılandırmayı göster
             print(f"{COLORS['INFO']}{self.i18n.t('current_config')}")
             print(f"  {self.i18n.t('base_url')} {COLORS['SUCCESS']}{base_url}")
-            print(f"  {self.i18n.t('request_timeout')} {COLORS['SUCCESS']}{request_timeout} saniye")
-            print(f"  {self.i18n.t('max_retries')} {COLORS['SUCCESS']}{max_retries}")
-            print(f"  {self.i18n.t('max_concurrent')} {COLORS['SUCCESS']}{max_concurrent}")
+            print(f"  {self.i18n.t('request_timeout')} {COLORS['SUCCESS']}{current['REQUEST_TIMEOUT']} saniye")
+            print(f"  {self.i18n.t('max_retries')} {COLORS['SUCCESS']}{current['MAX_RETRIES']}")
+            print(f"  {self.i18n.t('max_concurrent')} {COLORS['SUCCESS']}{current['MAX_CONCURRENT']}")
             print(f"  {self.i18n.t('use_proxy')} {COLORS['SUCCESS']}{use_proxy}")
             if use_proxy:
                 print(f"  {self.i18n.t('proxy_url')} {COLORS['SUCCESS']}{proxy_url}")
@@ -99,36 +485,28 @@ class SettingsMenuHandler:
             
             # Ana API Ayarları
             print(f"\n{COLORS['SUBTITLE']}{self.i18n.t('main_api_settings')}")
-            new_base_url = input(f"Base URL [{base_url}]: ").strip() or base_url
+            new = {"API_BASE_URL": input(f"Base URL [{base_url}]: ").strip() or base_url}
             
-            # Performans Ayarları
+            # Performans Ayarları: tablo üzerinden sor, sayı olmayanları reddet
             print(f"\n{COLORS['SUBTITLE']}{self.i18n.t('performance_settings')}")
-            try:
-                new_request_timeout = input(f"{self.i18n.t('request_timeout')} [{request_timeout}]: ").strip()
-                new_request_timeout = new_request_timeout if new_request_timeout else request_timeout
-            except ValueError:
-                print(f"{COLORS['WARNING']}{self.i18n.t('warning_invalid_value_default')}{request_timeout}")  # TODO: Buna da key eklenebilir ama user onayiyla atliyorum
-                new_request_timeout = request_timeout
-
-            try:
-                new_max_retries = input(f"{self.i18n.t('max_retries')} [{max_retries}]: ").strip()
-                new_max_retries = new_max_retries if new_max_retries else max_retries
-            except ValueError:
-                print(f"{COLORS['WARNING']}{self.i18n.t('warning_invalid_value_default')}{max_retries}")
-                new_max_retries = max_retries
-                
-            try:
-                new_max_concurrent = input(f"{self.i18n.t('max_concurrent')} [{max_concurrent}]: ").strip() 
-                new_max_concurrent = new_max_concurrent if new_max_concurrent else max_concurrent
-            except ValueError:
-                print(f"{COLORS['WARNING']}{self.i18n.t('warning_invalid_value_default')}{max_concurrent}")
-                new_max_concurrent = max_concurrent
+            for env_key, label_key, _default, minimum in self.API_INT_PROMPTS:
+                answer = input(f"{self.i18n.t(label_key)} [{current[env_key]}]: ").strip()
+                new[env_key] = current[env_key]
+                if not answer:
+                    continue
+                try:
+                    value = int(answer)
+                    if value < minimum:
+                        raise ValueError(answer)
+                    new[env_key] = str(value)
+                except ValueError:
+                    print(f"{COLORS['WARNING']}{self.i18n.t('warning_invalid_value_default')}{current[env_key]}")
 
             # Proxy Ayarları
             print(f"\n{COLORS['SUBTITLE']}{self.i18n.t('proxy_settings')}")
             use_proxy_input = input(f"{self.i18n.t('use_proxy')} (e/h) [{use_proxy}]: ").strip().lower()
             if use_proxy_input:
-                new_use_proxy = use_proxy_input in ["e", "evet", "y", "yes", "true", "1"]
+                new_use_proxy = use_proxy_input in _YES
             else:
                 new_use_proxy = use_proxy
             
@@ -136,19 +514,18 @@ class SettingsMenuHandler:
             if new_use_proxy:
                 new_proxy_url = input(f"{self.i18n.t('proxy_url')} [{proxy_url}]: ").strip() or proxy_url
             
-            # Çevre değişkenlerini güncelle
-            success1 = self.config_manager.update_env_variable("API_BASE_URL", new_base_url)
-            success2 = self.config_manager.update_env_variable("REQUEST_TIMEOUT", new_request_timeout)
-            success3 = self.config_manager.update_env_variable("MAX_RETRIES", new_max_retries)
-            success4 = self.config_manager.update_env_variable("MAX_CONCURRENT", new_max_concurrent)
-            success5 = self.config_manager.update_env_variable("USE_PROXY", str(new_use_proxy).lower())
-            success6 = self.config_manager.update_env_variable("PROXY_URL", new_proxy_url if new_use_proxy else "")
-            
-            if success1 and success2 and success3 and success4 and success5 and success6:
-                print(f"\n{COLORS['SUCCESS']}✅ {self.i18n.t('api_config_updated')}")
-                print(f"{COLORS['INFO']}ℹ️ {self.i18n.t('settings_applied_runtime')}")
-            else:
-                print(f"\n{COLORS['WARNING']}{self.i18n.t('error_update_api_config')}")
+            new["USE_PROXY"] = "true" if new_use_proxy else "false"
+            new["PROXY_URL"] = new_proxy_url
+            
+            # Tüm istemler boş geçildiyse hiçbir şey yazma
+            if new == current:
+                print(f"\n{COLORS['INFO']}{self.i18n.t('settings_not_changed')}")
+                return
+            
+            # Değişiklikler hemen etkinleşir; .env menüden çıkarken yazılır
+            self._update_env(new)
+            print(f"\n{COLORS['SUCCESS']}✅ {self.i18n.t('api_config_updated')}")
+            print(f"{COLORS['INFO']}ℹ️ {self.i18n.t('settings_saved_on_menu_exit')}")
                 
         except Exception as e:
             logger.error(f"API yapılandırması düzenlenirken hata: {str(e)}")
@@ -169,40 +546,37 @@ class SettingsMenuHandler:
             # Yeni veri dizinini al
             new_data_dir = input(f"\n{self.i18n.t('new_data_dir_prompt')} [{current_data_dir}]: ").strip() or current_data_dir
             
-            # Aynı dizin ise işlem yapma
-            if new_data_dir == current_data_dir:
+            # Aynı dizin ise (farklı yazılmış olsa da) işlem yapma
+            if _same_path(new_data_dir, current_data_dir):
                 print(f"\n{COLORS['INFO']}{self.i18n.t('data_dir_not_changed')}")
                 return
             
+            # İç içe dizinlerde taşıma kaynağı ya da hedefi silebilir; hiçbir şey yapmadan reddet
+            if _is_nested_path(new_data_dir, current_data_dir):
+                print(f"\n{COLORS['WARNING']}{self.i18n.t('error_data_dir_nested')}")
+                return
+            
             # Yeni dizini oluştur
             os.makedirs(new_data_dir, exist_ok=True)
             
             # Verileri taşımak isteyip istemediğini sor
-            move_data = input(f"\n{self.i18n.t('move_data_prompt')} ").strip().lower()
-            
-            if move_data in ["e", "evet", "y", "yes", "true", "1"]:
+            if self._confirm(f"\n{self.i18n.t('move_data_prompt')} "):
                 print(f"\n{COLORS['INFO']}{self.i18n.t('moving_data')}")
                 
-                # Alt dizinleri oluştur
-                os.makedirs(os.path.join(new_data_dir, "seasons"), exist_ok=True)
-                os.makedirs(os.path.join(new_data_dir, "matches"), exist_ok=True)
-                os.makedirs(os.path.join(new_data_dir, "match_details"), exist_ok=True)
-                os.makedirs(os.path.join(new_data_dir, "datasets"), exist_ok=True)
-                os.makedirs(os.path.join(new_data_dir, "reports"), exist_ok=True)
-                
-                # Verileri taşı
-                self._move_directory_contents(os.path.join(current_data_dir, "seasons"), os.path.join(new_data_dir, "seasons"))
-                self._move_directory_contents(os.path.join(current_data_dir, "matches"), os.path.join(new_data_dir, "matches"))
-                self._move_directory_contents(os.path.join(current_data_dir, "match_details"), os.path.join(new_data_dir, "match_details"))
-                self._move_directory_contents(os.path.join(current_data_dir, "datasets"), os.path.join(new_data_dir, "datasets"))
-                self._move_directory_contents(os.path.join(current_data_dir, "reports"), os.path.join(new_data_dir, "reports"))
+                # Alt dizinleri taşı; aynı dosya sistemindeyse kopyalanmadan yeniden
+                # adlandırılır (bkz. _move_directory_contents)
+                for subdir in self.DATA_TYPES:
+                    src_dir = os.path.join(current_data_dir, subdir)
+                    dest_dir = os.path.join(new_data_dir, subdir)
+                    self._move_directory_contents(src_dir, dest_dir)
+                    os.makedirs(dest_dir, exist_ok=True)
                 
                 print(f"\n{COLORS['SUCCESS']}✅ {self.i18n.t('data_moved_success')}")
             
-            # Çevre değişkenini güncelle
-            success = self.config_manager.update_env_variable("DATA_DIR", new_data_dir)
+            # Veriler taşındığından yeni dizin beklemeden .env'e yazılır
+            self._update_env({"DATA_DIR": new_data_dir})
             
-            if success:
+            if self._write_pending_env():
                 print(f"\n{COLORS['SUCCESS']}✅ {self.i18n.t('data_dir_updated_success')}")
                 print(f"{COLORS['INFO']}ℹ️ {self.i18n.t('restart_required')}")
             else:
@@ -234,21 +608,24 @@ class SettingsMenuHandler:
             
             use_color_input = input(f"{self.i18n.t('use_color')} (e/h) [{use_color}]: ").strip().lower()
             if use_color_input:
-                new_use_color = use_color_input in ["e", "evet", "y", "yes", "true", "1"]
+                new_use_color = use_color_input in _YES
             else:
                 new_use_color = use_color
             
             new_date_format = input(f"{self.i18n.t('date_format')} [{date_format}]: ").strip() or date_format
             
-            # Çevre değişkenlerini güncelle
-            success1 = self.config_manager.update_env_variable("USE_COLOR", str(new_use_color).lower())
-            success2 = self.config_manager.update_env_variable("DATE_FORMAT", new_date_format)
+            # Tüm istemler boş geçildiyse hiçbir şey yazma
+            if new_use_color == use_color and new_date_format == date_format:
+                print(f"\n{COLORS['INFO']}{self.i18n.t('settings_not_changed')}")
+                return
             
-            if success1 and success2:
-                print(f"\n{COLORS['SUCCESS']}✅ {self.i18n.t('display_settings_updated')}")
-                print(f"{COLORS['INFO']}ℹ️ {self.i18n.t('settings_applied_runtime')}")
-            else:
-                print(f"\n{COLORS['WARNING']}{self.i18n.t('error_update_display_settings')}")
+            # Değişiklikler hemen etkinleşir; .env menüden çıkarken yazılır
+            self._update_env({
+                "USE_COLOR": "true" if new_use_color else "false",
+                "DATE_FORMAT": new_date_format,
+            })
+            print(f"\n{COLORS['SUCCESS']}✅ {self.i18n.t('display_settings_updated')}")
+            print(f"{COLORS['INFO']}ℹ️ {self.i18n.t('settings_saved_on_menu_exit')}")
                 
         except Exception as e:
             logger.error(f"Görüntüleme ayarları düzenlenirken hata: {str(e)}")
@@ -329,12 +706,9 @@ class SettingsMenuHandler:
             # Yedekleme dizinini al
             backup_dir = input(f"Yedekleme Dizini [backup]: ").strip() or "backup"
             
-            # Yedekleme dizinini oluştur
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            # Alt dizinleri oluştur
-            os.makedirs(os.path.join(backup_dir, "config"), exist_ok=True)
-            os.makedirs(os.path.join(backup_dir, "data"), exist_ok=True)
+            # Yedekleme dizinini alt dizinleriyle birlikte oluştur
+            for subdir in ("config", "data"):
+                os.makedirs(os.path.join(backup_dir, subdir), exist_ok=True)
             
             # Yapılandırma dosyalarını yedekle
             print(f"\n{COLORS['INFO']}{self.i18n.t('info_backing_up_config')}")
@@ -347,7 +721,7 @@ class SettingsMenuHandler:
                 print(f"{COLORS['SUCCESS']}{self.i18n.t('success_backup_league_config')}{league_backup}")
             
             # .env dosyasını yedekle
-            env_file = os.path.join(os.getcwd(), ".env")
+            env_file = self._env_path
             if os.path.exists(env_file):
                 env_backup = os.path.join(backup_dir, "config", ".env")
                 shutil.copy2(env_file, env_backup)
@@ -356,16 +730,15 @@ class SettingsMenuHandler:
             # Veri dizinini yedekle
             print(f"\n{COLORS['INFO']}Veri dizini yedekleniyor...")
             
-            # Alt dizinleri yedekle
-            for subdir in ["seasons", "matches", "match_details"]:
-                src_dir = os.path.join(self.data_dir, subdir)
-                if os.path.exists(src_dir) and os.path.isdir(src_dir):
+            # Alt dizinleri paralel yedekle
+            jobs = []
+            for subdir, _info_key, _success_key in self.BACKUP_STEPS.values():
+                src_dir = self._data_subdirs[subdir]
+                if os.path.isdir(src_dir):
                     dst_dir = os.path.join(backup_dir, "data", subdir)
-                    
-                    # Dizini kopyala
                     print(f"{COLORS['INFO']}'{subdir}' dizini yedekleniyor...")
-                    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
-                    print(f"{COLORS['SUCCESS']}✓ '{subdir}' dizini yedeklendi: {dst_dir}")
+                    jobs.append((src_dir, dst_dir, f"✓ '{subdir}' dizini yedeklendi: {dst_dir}"))
+            self._copy_trees_parallel(jobs)
             
             print(f"\n{COLORS['SUCCESS']}{self.i18n.t('success_backup_all')}{os.path.abspath(backup_dir)}")
             
@@ -415,7 +788,7 @@ class SettingsMenuHandler:
                     print(f"{COLORS['SUCCESS']}{self.i18n.t('success_backup_league_config')}{league_backup}")
                 
                 # .env dosyasını yedekle
-                env_file = os.path.join(os.getcwd(), ".env")
+                env_file = self._env_path
                 if os.path.exists(env_file):
                     env_backup = os.path.join(backup_dir, "config", ".env")
                     shutil.copy2(env_file, env_backup)
@@ -424,32 +797,13 @@ class SettingsMenuHandler:
             # Veri dizinini oluştur
             os.makedirs(os.path.join(backup_dir, "data"), exist_ok=True)
             
-            # Lig ve sezon verilerini yedekle
-            if 2 in selected:
-                print(f"\n{COLORS['INFO']}Lig ve sezon verileri yedekleniyor...")
-                src_dir = os.path.join(self.data_dir, "seasons")
-                if os.path.exists(src_dir) and os.path.isdir(src_dir):
-                    dst_dir = os.path.join(backup_dir, "data", "seasons")
-                    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
-                    print(f"{COLORS['SUCCESS']}✓ Sezon verileri yedeklendi: {dst_dir}")
-            
-            # Maç verilerini yedekle
-            if 3 in selected:
-                print(f"\n{COLORS['INFO']}{self.i18n.t('info_backing_up_match_data')}")
-                src_dir = os.path.join(self.data_dir, "matches")
-                if os.path.exists(src_dir) and os.path.isdir(src_dir):
-                    dst_dir = os.path.join(backup_dir, "data", "matches")
-                    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
-                    print(f"{COLORS['SUCCESS']}{self.i18n.t('success_backup_match_data')}{dst_dir}")
-            
-            # Maç detaylarını yedekle
-            if 4 in selected:
-                print(f"\n{COLORS['INFO']}{self.i18n.t('info_backing_up_match_details')}")
-                src_dir = os.path.join(self.data_dir, "match_details")
-                if os.path.exists(src_dir) and os.path.isdir(src_dir):
-                    dst_dir = os.path.join(backup_dir, "data", "match_details")
-                    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
-                    print(f"{COLORS['SUCCESS']}{self.i18n.t('success_backup_match_details')}{dst_dir}")
+            # Seçili veri dizinleri paralel yedeklenir
+            available = {subdir for subdir in self.DATA_TYPES if os.path.isdir(self._data_subdirs[subdir])}
+            jobs = self._data_copy_jobs(
+                selected, self.BACKUP_STEPS, available,
+                self.data_dir, os.path.join(backup_dir, "data"),
+            )
+            self._copy_trees_parallel(jobs)
             
             print(f"\n{COLORS['SUCCESS']}{self.i18n.t('success_backup_selected')}{os.path.abspath(backup_dir)}")
             
@@ -457,6 +811,100 @@ class SettingsMenuHandler:
             logger.error(f"Veri yedeklenirken hata: {str(e)}")
             print(f"\n{COLORS['WARNING']}Hata: {str(e)}")
     
+    def _data_copy_jobs(
+        self,
+        selected: List[int],
+        steps: Dict[int, Tuple[str, str, str]],
+        available: set,
+        src_root: str,
+        dst_root: str,
+    ) -> List[Tuple[str, str, str]]:
+        """
+        Seçilen veri türleri için bilgi mesajlarını yazar ve kopyalama işlerini hazırlar.
+        
+        Args:
+            selected: Menüde seçilen numaralar
+            steps: Seçim -> (alt dizin, bilgi anahtarı, başarı anahtarı) tablosu
+            available: Kaynakta bulunan alt dizin adları
+            src_root: Kaynak kök dizin
+            dst_root: Hedef kök dizin
+            
+        Returns:
+            List[Tuple[str, str, str]]: _copy_trees_parallel için iş listesi
+        """
+        info = self.colors['INFO']
+        jobs = []
+        for choice, (subdir, info_key, success_key) in steps.items():
+            if choice not in selected:
+                continue
+            print(f"\n{info}{self.i18n.t(info_key)}")
+            if subdir in available:
+                dst_dir = os.path.join(dst_root, subdir)
+                jobs.append((os.path.join(src_root, subdir), dst_dir, f"{self.i18n.t(success_key)}{dst_dir}"))
+        return jobs
+    
+    def _copy_trees_parallel(self, jobs: List[Tuple[str, str, str]], workers: Optional[int] = None) -> None:
+        """
+        Dizin ağaçlarını dosya düzeyinde paralel kopyalar.
+        
+        Ağaçlar gezilirken dosyalar ortak bir iş havuzuna gönderilir; küçük
+        dosyalarla dolu dizinlerde (matches, match_details) dosya başı
+        açma/kapama beklemeleri örtüşür.
+        
+        Args:
+            jobs: (kaynak dizin, hedef dizin, tamamlanınca yazılacak mesaj) listesi
+            workers: Eşzamanlı dosya kopyalama sayısı (None ise COPY_WORKERS)
+        """
+        if not jobs:
+            return
+        if workers is None:
+            workers = self.config_manager.get_copy_workers()
+        
+        remaining = [0] * len(jobs)
+        # Renkli tamamlanma mesajları döngüden önce bir kez hazırlanır
+        success = self.colors['SUCCESS']
+        done_messages = [f"{success}{done_message}" for _src, _dst, done_message in jobs]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for index, (src_dir, dst_dir, _done_message) in enumerate(jobs):
+                # Kaynak ve hedef aynı dizinse kopyalanacak bir şey yok
+                if os.path.exists(dst_dir) and os.path.samefile(src_dir, dst_dir):
+                    logger.info(f"Kaynak ve hedef aynı dizin, atlanıyor: {src_dir}")
+                    continue
+                for src_path, dst_path in _iter_copy_pairs(src_dir, dst_dir):
+                    futures[executor.submit(_copy_if_changed, src_path, dst_path)] = index
+                    remaining[index] += 1
+            
+            # Dosyası olmayan ağaçlar hemen tamamlanmış sayılır
+            for index, count in enumerate(remaining):
+                if count == 0:
+                    print(done_messages[index])
+            
+            for future in as_completed(futures):
+                # Hata varsa çağıranın except bloğuna iletilir
+                future.result()
+                index = futures[future]
+                remaining[index] -= 1
+                if remaining[index] == 0:
+                    print(done_messages[index])
+    
+    def _mark_restored_season_json(self, backup_seasons_dir: str) -> None:
+        """
+        Yedekten gelen *_seasons.json dosyalarının değişiklik zamanını şimdiye
+        çeker. Kopyalama yedekteki zamanı korur; bu olmadan dosyalar daha yeni
+        seasons.db karşısında eski sayılır ve yok sayılırdı.
+        
+        Args:
+            backup_seasons_dir: Yedekteki sezon dizini
+        """
+        seasons_dir = self._data_subdirs["seasons"]
+        for name in _scan_names(backup_seasons_dir)[1]:
+            if name.endswith("_seasons.json"):
+                try:
+                    os.utime(os.path.join(seasons_dir, name))
+                except OSError as e:
+                    logger.warning(f"Sezon dosyasının zamanı güncellenemedi: {name} - {str(e)}")
+    
     def restore_data(self) -> None:
         """Veri geri yükleme işlemleri."""
         COLORS = self.colors  # Kısa erişim için
@@ -469,10 +917,15 @@ class SettingsMenuHandler:
             backup_dir = input(f"Yedek Dizini [backup]: ").strip() or "backup"
             
             # Yedek dizini kontrol et
-            if not os.path.exists(backup_dir) or not os.path.isdir(backup_dir):
+            if not os.path.isdir(backup_dir):
                 print(f"\n{COLORS['WARNING']}{self.i18n.t('warning_backup_dir_not_found')}{backup_dir}")
                 return
             
+            # Yedekteki içerik tek seferde taranır; tek tek exists/isdir çağrılmaz
+            top_dirs, _ = _scan_names(backup_dir)
+            config_files = _scan_names(os.path.join(backup_dir, "config"))[1] if "config" in top_dirs else set()
+            data_dirs = _scan_names(os.path.join(backup_dir, "data"))[0] if "data" in top_dirs else set()
+            
             # Geri yüklenecek veri tiplerini seç
             print(f"\n{COLORS['INFO']}{self.i18n.t('prompt_select_restore_types')}")
             print(f"{self.i18n.t('menu_config_files')}")
@@ -493,46 +946,32 @@ class SettingsMenuHandler:
                 print(f"\n{COLORS['INFO']}{self.i18n.t('info_restoring_config_files')}")
                 
                 # leagues.txt dosyasını geri yükle
-                league_file = os.path.join(backup_dir, "config", os.path.basename(self.config_manager.league_config_path))
-                if os.path.exists(league_file):
+                league_name = os.path.basename(self.config_manager.league_config_path)
+                if league_name in config_files:
+                    league_file = os.path.join(backup_dir, "config", league_name)
                     shutil.copy2(league_file, self.config_manager.league_config_path)
                     print(f"{COLORS['SUCCESS']}{self.i18n.t('success_restore_league_config')}{self.config_manager.league_config_path}")
                 
                 # .env dosyasını geri yükle
-                env_file = os.path.join(backup_dir, "config", ".env")
-                if os.path.exists(env_file):
-                    shutil.copy2(env_file, os.path.join(os.getcwd(), ".env"))
+                if ".env" in config_files:
+                    env_file = os.path.join(backup_dir, "config", ".env")
+                    shutil.copy2(env_file, self._env_path)
+                    # Geri yüklenen .env geçerlidir; bekleyen değişiklikler üzerine yazılmaz
+                    self._env_cache = self._load_env()
+                    self._env_pending.clear()
                     print(f"{COLORS['SUCCESS']}{self.i18n.t('success_restore_env_vars')}")
             
-            # Lig ve sezon verilerini geri yükle
-            if 2 in selected:
-                print(f"\n{COLORS['INFO']}{self.i18n.t('info_restoring_league_season_data')}")
-                src_dir = os.path.join(backup_dir, "data", "seasons")
-                if os.path.exists(src_dir) and os.path.isdir(src_dir):
-                    dst_dir = os.path.join(self.data_dir, "seasons")
-                    os.makedirs(dst_dir, exist_ok=True)
-                    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
-                    print(f"{COLORS['SUCCESS']}{self.i18n.t('success_restore_season_data')}{dst_dir}")
-            
-            # Maç verilerini geri yükle
-            if 3 in selected:
-                print(f"\n{COLORS['INFO']}{self.i18n.t('info_restoring_match_data')}")
-                src_dir = os.path.join(backup_dir, "data", "matches")
-                if os.path.exists(src_dir) and os.path.isdir(src_dir):
-                    dst_dir = os.path.join(self.data_dir, "matches")
-                    os.makedirs(dst_dir, exist_ok=True)
-                    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
-                    print(f"{COLORS['SUCCESS']}{self.i18n.t('success_restore_match_data')}{dst_dir}")
-            
-            # Maç detaylarını geri yükle
-            if 4 in selected:
-                print(f"\n{COLORS['INFO']}{self.i18n.t('info_restoring_match_details')}")
-                src_dir = os.path.join(backup_dir, "data", "match_details")
-                if os.path.exists(src_dir) and os.path.isdir(src_dir):
-                    dst_dir = os.path.join(self.data_dir, "match_details")
-                    os.makedirs(dst_dir, exist_ok=True)
-                    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
-                    print(f"{COLORS['SUCCESS']}{self.i18n.t('success_restore_match_details')}{dst_dir}")
+            # Seçili veri dizinleri paralel geri yüklenir
+            jobs = self._data_copy_jobs(
+                selected, self.RESTORE_STEPS, data_dirs,
+                os.path.join(backup_dir, "data"), self.data_dir,
+            )
+            self._copy_trees_parallel(jobs)
+            
+            # Geri yüklenen sezon JSON'ları mevcut sezon veritabanından yeni
+            # işaretlenir; açılışta SeasonFetcher bunları yeniden içe aktarır
+            if 2 in selected and "seasons" in data_dirs:
+                self._mark_restored_season_json(os.path.join(backup_dir, "data", "seasons"))
             
             # Yapılandırmayı yeniden yükle
             if 1 in selected:
@@ -572,45 +1011,114 @@ class SettingsMenuHandler:
             logger.error(f"Veri temizleme işlemi sırasında hata: {str(e)}")
             print(f"\n{COLORS['WARNING']}Hata: {str(e)}")
     
+    @staticmethod
+    def _confirm(prompt: str) -> bool:
+        """Kullanıcıdan evet/hayır onayı alır."""
+        return input(prompt).strip().lower() in _YES
+    
+    def _confirm_clear(self, *prompt_keys: str) -> bool:
+        """
+        Temizleme işlemi için sırayla onay ister. Terminal etkileşimli değilse
+        istem gösterilmez; yalnızca SOFASCORE_FORCE_CLEAR=1 ise devam edilir.
+        
+        Args:
+            prompt_keys: Sırayla sorulacak onay mesajlarının çeviri anahtarları
+            
+        Returns:
+            bool: Temizlemeye devam edilecekse True
+        """
+        if not sys.stdin.isatty():
+            if os.environ.get("SOFASCORE_FORCE_CLEAR") == "1":
+                return True
+            print(self._msg('WARNING', 'warning_clear_requires_force'))
+            return False
+        
+        for key in prompt_keys:
+            if not self._confirm(self._msg('WARNING', key)):
+                print(self._msg('INFO', 'info_clear_cancelled'))
+                return False
+        return True
+    
     def _clear_all_data(self) -> None:
         """Tüm verileri temizler."""
         COLORS = self.colors  # Kısa erişim için
         
         try:
-            # Onay al
-            confirm = input(f"\n{COLORS['WARNING']}{self.i18n.t('warning_clear_all_confirm')}").strip().lower()
-            
-            if confirm not in ["e", "evet", "y", "yes", "true", "1"]:
-                print(f"\n{COLORS['INFO']}{self.i18n.t('info_clear_cancelled')}")
-                return
-            
-            # İkinci onay
-            confirm2 = input(f"\n{COLORS['WARNING']}{self.i18n.t('warning_clear_all_final')}").strip().lower()
-            
-            if confirm2 not in ["e", "evet", "y", "yes", "true", "1"]:
-                print(f"\n{COLORS['INFO']}{self.i18n.t('info_clear_cancelled')}")
+            # Onay al (iki aşamalı)
+            if not self._confirm_clear('warning_clear_all_confirm', 'warning_clear_all_final'):
                 return
             
-            # Veri dizinlerini temizle
-            data_dirs = ["seasons", "matches", "match_details", "datasets", "reports"]
-            
-            for dir_name in data_dirs:
-                dir_path = os.path.join(self.data_dir, dir_name)
-                if os.path.exists(dir_path):
-                    for item in os.listdir(dir_path):
-                        item_path = os.path.join(dir_path, item)
-                        if os.path.isdir(item_path):
-                            shutil.rmtree(item_path)
-                        else:
-                            os.remove(item_path)
-                    print(f"{COLORS['SUCCESS']}✓ {dir_name} dizini temizlendi.")
+            # Veri dizinlerini paralel temizle
+            self._wipe_data_dirs(self.DATA_TYPES)
             
-            print(f"\n{COLORS['SUCCESS']}{self.i18n.t('success_clear_all')}")
+            print(self._msg('SUCCESS', 'success_clear_all'))
             
         except Exception as e:
             logger.error(f"Tüm veriler temizlenirken hata: {str(e)}")
             print(f"\n{COLORS['WARNING']}Hata: {str(e)}")
     
+    def _wipe_data_dir(self, dir_name: str) -> bool:
+        """
+        Bir veri dizinini tek rmtree ile silip boş olarak yeniden oluşturur.
+        
+        Args:
+            dir_name: Veri dizini altındaki alt dizin adı
+            
+        Returns:
+            bool: Dizin vardı ve temizlendiyse True
+        """
+        dir_path = self._data_subdirs[dir_name]
+        # Varlık ve bağlantı kontrolü tek lstat ile yapılır
+        try:
+            mode = os.lstat(dir_path).st_mode
+        except FileNotFoundError:
+            return False
+        
+        if stat.S_ISLNK(mode):
+            # Sembolik bağlantının kendisi korunur, yalnızca hedefin içeriği silinir
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except FileNotFoundError:
+                # Hedefi olmayan bağlantı: temizlenecek bir şey yok
+                return False
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    _force_rmtree(entry.path)
+                else:
+                    os.remove(entry.path)
+            return True
+        
+        _force_rmtree(dir_path)
+        os.makedirs(dir_path, exist_ok=True)
+        return True
+    
+    def _wipe_data_dirs(self, dir_names) -> None:
+        """
+        Birbirinden bağımsız veri dizinlerini paralel temizler; temizlenen
+        dizinler sonunda tek seferde bildirilir.
+        
+        Args:
+            dir_names: Temizlenecek alt dizin adları
+        """
+        dir_names = list(dict.fromkeys(dir_names))
+        if not dir_names:
+            return
+        
+        success = self.colors['SUCCESS']
+        lines = []
+        try:
+            with ThreadPoolExecutor(max_workers=len(dir_names)) as executor:
+                futures = {executor.submit(self._wipe_data_dir, dir_name): dir_name for dir_name in dir_names}
+                for future in as_completed(futures):
+                    # Hata varsa çağıranın except bloğuna iletilir
+                    if future.result():
+                        lines.append(f"{success}✓ {futures[future]} dizini temizlendi.")
+        finally:
+            # Sonuçlar tek yazımla basılır; hata olsa da temizlenenler bildirilir
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+    
     def _clear_selected_data(self) -> None:
         """Seçili veri türlerini temizler."""
         COLORS = self.colors  # Kısa erişim için
@@ -627,43 +1135,24 @@ class SettingsMenuHandler:
             data_types = []
             selections = input(f"\n{self.i18n.t('prompt_selections_comma')}").strip()
             
-            dir_mapping = {
-                "1": "seasons",
-                "2": "matches",
-                "3": "match_details",
-                "4": "datasets",
-                "5": "reports"
-            }
-            
+            # Menü numaraları DATA_TYPES sırasıyla eşleşir (1 tabanlı)
             for selection in selections.split(","):
                 selection = selection.strip()
-                if selection in dir_mapping:
-                    data_types.append(dir_mapping[selection])
+                if selection.isdigit() and 1 <= int(selection) <= len(self.DATA_TYPES):
+                    data_types.append(self.DATA_TYPES[int(selection) - 1])
             
             if not data_types:
-                print(f"\n{COLORS['WARNING']}{self.i18n.t('error_no_data_type_selected')}")
+                print(self._msg('WARNING', 'error_no_data_type_selected'))
                 return
             
             # Onay al
-            confirm = input(f"\n{COLORS['WARNING']}{self.i18n.t('warning_clear_selected_confirm')}").strip().lower()
-            
-            if confirm not in ["e", "evet", "y", "yes", "true", "1"]:
-                print(f"\n{COLORS['INFO']}{self.i18n.t('info_clear_cancelled')}")
+            if not self._confirm_clear('warning_clear_selected_confirm'):
                 return
             
-            # Seçili dizinleri temizle
-            for dir_name in data_types:
-                dir_path = os.path.join(self.data_dir, dir_name)
-                if os.path.exists(dir_path):
-                    for item in os.listdir(dir_path):
-                        item_path = os.path.join(dir_path, item)
-                        if os.path.isdir(item_path):
-                            shutil.rmtree(item_path)
-                        else:
-                            os.remove(item_path)
-                    print(f"{COLORS['SUCCESS']}✓ {dir_name} dizini temizlendi.")
+            # Seçili dizinleri paralel temizle
+            self._wipe_data_dirs(data_types)
             
-            print(f"\n{COLORS['SUCCESS']}{self.i18n.t('success_clear_selected')}")
+            print(self._msg('SUCCESS', 'success_clear_selected'))
             
         except Exception as e:
             logger.error(f"Seçili veri türleri temizlenirken hata: {str(e)}")
@@ -674,17 +1163,26 @@ class SettingsMenuHandler:
         COLORS = self.colors  # Kısa erişim için
         
         try:
-            print(f"\n{COLORS['SUBTITLE']}{self.i18n.t('about_title')}")
-            print("-" * 50)
-            print(f"{COLORS['INFO']}{self.i18n.t('version')} {COLORS['SUCCESS']}1.0.0")
-            print(f"{COLORS['INFO']}{self.i18n.t('developer')} {COLORS['SUCCESS']}SofaScore Scraper Ekibi")
-            print(f"{COLORS['INFO']}{self.i18n.t('license')} {COLORS['SUCCESS']}MIT")
-            print(f"{COLORS['INFO']}{self.i18n.t('description')} {COLORS['SUCCESS']}{self.i18n.t('app_description')}")
-            
-            print(f"\n{COLORS['SUBTITLE']}{self.i18n.t('libraries')}")
-            print(f"{COLORS['INFO']}{self.i18n.t('dependency_requests')}")
-            print(f"{COLORS['INFO']}{self.i18n.t('dependency_colorama')}")
-            print(f"{COLORS['INFO']}{self.i18n.t('dependency_pandas')}")
+            # Metin sabit olduğundan dil başına bir kez oluşturulup tek yazımla basılır
+            lang = self.i18n.current_lang
+            about_text = self._about_cache.get(lang)
+            if about_text is None:
+                t = self.i18n.t
+                about_text = (
+                    f"\n{COLORS['SUBTITLE']}{t('about_title')}\n"
+                    f"{'-' * 50}\n"
+                    f"{COLORS['INFO']}{t('version')} {COLORS['SUCCESS']}1.0.0\n"
+                    f"{COLORS['INFO']}{t('developer')} {COLORS['SUCCESS']}SofaScore Scraper Ekibi\n"
+                    f"{COLORS['INFO']}{t('license')} {COLORS['SUCCESS']}MIT\n"
+                    f"{COLORS['INFO']}{t('description')} {COLORS['SUCCESS']}{t('app_description')}\n"
+                    f"\n{COLORS['SUBTITLE']}{t('libraries')}\n"
+                    f"{COLORS['INFO']}{t('dependency_requests')}\n"
+                    f"{COLORS['INFO']}{t('dependency_colorama')}\n"
+                    f"{COLORS['INFO']}{t('dependency_pandas')}\n"
+                )
+                self._about_cache[lang] = about_text
+            sys.stdout.write(about_text)
+            sys.stdout.flush()
             
         except Exception as e:
             logger.error(f"Hakkında bilgisi görüntülenirken hata: {str(e)}")
@@ -695,22 +1193,55 @@ class SettingsMenuHandler:
         if not os.path.exists(src_dir):
             return
         
-        # Hedef dizini oluştur
+        # Kaynak silinmeden önce aynı ya da iç içe dizinler reddedilir
+        if _is_nested_path(src_dir, dest_dir):
+            raise ValueError(f"Kaynak ve hedef dizin aynı ya da iç içe: {src_dir} -> {dest_dir}")
+        
+        # Hedef yoksa ya da boşsa tüm ağaç tek rename ile taşınır
+        try:
+            os.rename(src_dir, dest_dir)
+            return
+        except OSError:
+            # Hedef dolu, farklı dosya sistemi vb.: girdi bazında taşımaya dön
+            pass
+        
         os.makedirs(dest_dir, exist_ok=True)
         
-        # İçeriği taşı
-        for item in os.listdir(src_dir):
-            src_path = os.path.join(src_dir, item)
-            dest_path = os.path.join(dest_dir, item)
-            
-            if os.path.isdir(src_path):
-                # Dizin varsa, rekürsif olarak taşı
-                if os.path.exists(dest_path):
-                    # Hedef dizin varsa, içeriğini taşı
-                    self._move_directory_contents(src_path, dest_path)
-                else:
-                    # Dizin yoksa, direkt kopyala
-                    shutil.copytree(src_path, dest_path)
-            else:
-                # Dosyayı kopyala
-                shutil.copy2(src_path, dest_path) 
\ No newline at end of file
+        # Aynı dosya sistemindeyse girdiler kopyalanmadan yeniden adlandırılır
+        try:
+            same_device = os.stat(src_dir).st_dev == os.stat(dest_dir).st_dev
+        except OSError:
+            same_device = False
+        
+        if same_device:
+            try:
+                _rename_tree(src_dir, dest_dir)
+                # Yalnızca boş kalan dizinler silinir; taşınamamış bir girdi
+                # varsa rmdir hata verir ve kaynak korunur
+                _remove_empty_tree(src_dir)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Bağlama noktası aşıldı: kalan girdiler kopyalanır
+        
+        # Var olan hedefle birleştirerek kopyala; dosyalar birbirinden bağımsız
+        # olduğundan paralel kopyalanır. Yedeklemeyle aynı kural geçerlidir:
+        # sembolik bağlantılar izlenir, hedefe içerikleri kopyalanır
+        with ThreadPoolExecutor(max_workers=self.config_manager.get_copy_workers()) as executor:
+            futures = [
+                executor.submit(_fast_copy_file, src_path, dst_path)
+                for src_path, dst_path in _iter_copy_pairs(src_dir, dest_dir)
+            ]
+            for future in as_completed(futures):
+                # Hata varsa çağıranın except bloğuna iletilir
+                future.result()
+        
+        # Kaynak yalnızca her dosyanın hedefte aynı boyutla bulunduğu
+        # doğrulandıktan sonra silinir; aksi halde hata iletilir, kaynak kalır
+        _verify_copied_tree(src_dir, dest_dir)
+        if os.path.islink(src_dir):
+            # Bağlantının gösterdiği dış dizine dokunulmaz
+            os.unlink(src_dir)
+        else:
+            _force_rmtree(src_dir) 
\ No newline at end of file
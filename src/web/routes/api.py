@@ -320,7 +320,10 @@ def _refresh_league_seasons_sync(league_id: int) -> dict:
     from src.SofaScoreUi import SimpleSofaScoreUI
 
     ui = SimpleSofaScoreUI(config_manager=config_manager)
-    ui.season_fetcher.fetch_seasons_for_league(league_id)
+    try:
+        ui.season_fetcher.fetch_seasons_for_league(league_id)
+    finally:
+        ui.close()
     data_dir = config_manager.get_data_dir()
     seasons_file = _find_league_seasons_json(data_dir, league_id)
     if seasons_file:
@@ -914,6 +917,7 @@ async def trigger_fetch(background_tasks: BackgroundTasks, payload: FetchRequest
         update_state("Running", 0, f"Starting fetch for {summary}")
         logger.info(f"Background fetch started. Target: {summary}")
         
+        ui = None
         try:
             ui = SimpleSofaScoreUI(config_manager=config_manager)
             
@@ -1051,6 +1055,12 @@ async def trigger_fetch(background_tasks: BackgroundTasks, payload: FetchRequest
             print(f"--> Background Task FAILED: {e}")
             update_state("Failed", 0, f"Error: {error_msg}")
         finally:
+            # Her iş kendi HTTP oturumunu ve olay döngüsünü açar; işi biterken kapatılır
+            if ui is not None:
+                try:
+                    ui.close()
+                except Exception as e:
+                    logger.error(f"Failed to close scraper session: {e}")
             SCRAPER_STATE["is_running"] = False
 
     background_tasks.add_task(run_update)
@@ -1263,7 +1273,10 @@ def _export_csv_sync(league_id: Optional[int], data_dir: str):
 
         try:
             ui = SimpleSofaScoreUI(config_manager=config_manager)
-            ui.export_all_to_csv()
+            try:
+                ui.export_all_to_csv()
+            finally:
+                ui.close()
             files = glob.glob(os.path.join(csv_dir, "all_matches_*.csv"))
         except Exception as e:
             logger.error(f"CSV export failed: {e}")
@@ -0,0 +1,49 @@
+"""
+ConfigManager .env güncelleme testleri.
+"""
+
+import os
+
+import pytest
+
+from src.config_manager import ConfigManager
+
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch):
+    # .env ve config/ çalışma dizinine göre çözülür; singleton her testte yeniden kurulur
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(ConfigManager, "_instance", None)
+    for key in ("USE_COLOR", "MAX_RETRIES", "NEW_KEY"):
+        monkeypatch.delenv(key, raising=False)
+    return ConfigManager()
+
+
+def test_update_env_variables_rewrites_in_place(config_manager, tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text("# yorum\nUSE_COLOR=true\n\nMAX_RETRIES=3", encoding="utf-8")
+
+    assert config_manager.update_env_variables({"MAX_RETRIES": "5", "NEW_KEY": "x"})
+
+    assert env_path.read_text(encoding="utf-8") == (
+        "# yorum\nUSE_COLOR=true\n\nMAX_RETRIES=5\nNEW_KEY=x\n"
+    )
+
+
+def test_update_env_variables_sets_process_environment(config_manager):
+    assert config_manager.update_env_variable("USE_COLOR", "false")
+
+    assert os.environ["USE_COLOR"] == "false"
+
+
+def test_update_env_variables_creates_missing_file(config_manager, tmp_path):
+    assert config_manager.update_env_variables({"NEW_KEY": "1"})
+
+    assert (tmp_path / ".env").read_text(encoding="utf-8") == "NEW_KEY=1\n"
+
+
+def test_update_env_variables_reports_write_failure(config_manager, tmp_path):
+    # .env yerine bir dizin varsa yazma başarısız olmalı
+    (tmp_path / ".env").mkdir()
+
+    assert config_manager.update_env_variables({"NEW_KEY": "1"}) is False
@@ -0,0 +1,120 @@
+"""
+SeasonFetcher sezon veritabanı testleri: kayıt/okuma, silinen dizinden
+sonra şemanın yeniden oluşturulması ve JSON dosyalarının önceliği.
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from src import season_fetcher as season_fetcher_module
+from src.season_fetcher import SeasonFetcher
+
+
+LEAGUE_ID = 17
+SEASONS = [
+    {"id": 100, "name": "Premier League 22/23", "year": "22/23"},
+    {"id": 200, "name": "Premier League 24/25", "year": "24/25"},
+    {"id": 150, "name": "Premier League 23/24", "year": "23/24"},
+]
+
+
+class FakeConfigManager:
+    """SeasonFetcher'ın kullandığı ConfigManager yöntemlerinin küçük bir karşılığı."""
+
+    def __init__(self, save_json: bool = True):
+        self.leagues = {LEAGUE_ID: "Premier League"}
+        self.save_json = save_json
+
+    def get_leagues(self):
+        return self.leagues
+
+    def get_league_by_id(self, league_id):
+        return self.leagues.get(league_id)
+
+    def get_save_seasons_json(self):
+        return self.save_json
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    return SeasonFetcher(FakeConfigManager(), data_dir=str(tmp_path))
+
+
+def _ids(seasons):
+    return [season["id"] for season in seasons]
+
+
+def test_store_and_read_round_trip(fetcher, tmp_path):
+    fetcher._store_seasons_db({LEAGUE_ID: SEASONS})
+
+    # En yeni sezon en üstte döner
+    assert _ids(fetcher.get_seasons_for_league(LEAGUE_ID)) == [200, 150, 100]
+
+    # Yeni bir örnek veritabanından yükler
+    reloaded = SeasonFetcher(FakeConfigManager(), data_dir=str(tmp_path))
+    assert _ids(reloaded.league_seasons[LEAGUE_ID]) == [200, 150, 100]
+    assert reloaded.get_season_name(LEAGUE_ID, 150) == "Premier League 23/24"
+
+
+def test_store_replaces_previous_league_rows(fetcher):
+    fetcher._store_seasons_db({LEAGUE_ID: SEASONS})
+    fetcher._store_seasons_db({LEAGUE_ID: SEASONS[:1]})
+
+    assert _ids(fetcher.get_seasons_for_league(LEAGUE_ID)) == [100]
+
+
+def test_schema_recreated_after_seasons_dir_is_wiped(fetcher):
+    fetcher._store_seasons_db({LEAGUE_ID: SEASONS})
+    shutil.rmtree(fetcher.seasons_dir)
+
+    fetcher._store_seasons_db({LEAGUE_ID: SEASONS[:2]})
+
+    assert os.path.exists(fetcher.seasons_db_path)
+    assert _ids(fetcher.get_seasons_for_league(LEAGUE_ID)) == [200, 100]
+
+
+def test_fetch_after_wipe_writes_db_and_memory(fetcher, monkeypatch):
+    shutil.rmtree(fetcher.seasons_dir)
+    monkeypatch.setattr(
+        season_fetcher_module, "make_api_request", lambda url: {"seasons": SEASONS}
+    )
+
+    assert _ids(fetcher.fetch_seasons_for_league(LEAGUE_ID)) == [100, 200, 150]
+    assert fetcher.league_seasons[LEAGUE_ID] == SEASONS
+    assert _ids(fetcher.get_seasons_for_league(LEAGUE_ID)) == [200, 150, 100]
+
+
+def test_get_season_name_reads_memory_before_db(fetcher):
+    fetcher.league_seasons[LEAGUE_ID] = [{"id": 5, "name": "Only In Memory", "year": "2025"}]
+
+    assert fetcher.get_season_name(LEAGUE_ID, 5) == "Only In Memory"
+    assert fetcher.get_season_name(LEAGUE_ID, 6) == "Season_6"
+
+
+def test_newer_json_file_overrides_db(fetcher, tmp_path):
+    fetcher._store_seasons_db({LEAGUE_ID: SEASONS})
+
+    # Elle düzenlenmiş / geri yüklenmiş dosya veritabanından yeni
+    json_path = os.path.join(fetcher.seasons_dir, f"{LEAGUE_ID}_Premier_League_seasons.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"seasons": SEASONS[1:2]}, f)
+    newer = fetcher._seasons_db_mtime() + 10
+    os.utime(json_path, (newer, newer))
+
+    reloaded = SeasonFetcher(FakeConfigManager(), data_dir=str(tmp_path))
+    assert _ids(reloaded.league_seasons[LEAGUE_ID]) == [200]
+    assert _ids(reloaded.get_seasons_for_league(LEAGUE_ID)) == [200]
+
+
+def test_older_json_file_does_not_override_db(fetcher, tmp_path):
+    json_path = os.path.join(fetcher.seasons_dir, f"{LEAGUE_ID}_Premier_League_seasons.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"seasons": SEASONS[1:2]}, f)
+    os.utime(json_path, (1, 1))
+    fetcher._store_seasons_db({LEAGUE_ID: SEASONS})
+
+    reloaded = SeasonFetcher(FakeConfigManager(), data_dir=str(tmp_path))
+    assert _ids(reloaded.get_seasons_for_league(LEAGUE_ID)) == [200, 150, 100]
@@ -0,0 +1,138 @@
+"""
+SettingsMenuHandler._move_directory_contents testleri: kaynak yalnızca
+her şey hedefe ulaştıktan sonra silinmeli, hata halinde korunmalı.
+"""
+
+import errno
+import os
+
+import pytest
+
+from src.ui import settings_ui
+from src.ui.settings_ui import SettingsMenuHandler
+
+
+class FakeConfigManager:
+    """Taşıma işleminin kullandığı ConfigManager yöntemi."""
+
+    def get_copy_workers(self):
+        return 2
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    # SettingsMenuHandler .env dosyasını çalışma dizininde arar
+    monkeypatch.chdir(tmp_path)
+    return SettingsMenuHandler(FakeConfigManager(), str(tmp_path / "data"), {})
+
+
+@pytest.fixture
+def src_tree(tmp_path):
+    src = tmp_path / "src"
+    (src / "seasons").mkdir(parents=True)
+    (src / "seasons" / "17_seasons.json").write_text('{"seasons": []}', encoding="utf-8")
+    (src / "matches" / "17" / "2024").mkdir(parents=True)
+    (src / "matches" / "17" / "2024" / "round_1.json").write_text("[1, 2, 3]", encoding="utf-8")
+    return src
+
+
+def _files(root):
+    return sorted(
+        os.path.relpath(os.path.join(dirpath, name), root)
+        for dirpath, _dirnames, filenames in os.walk(root)
+        for name in filenames
+    )
+
+
+def _force_copy_path(monkeypatch):
+    """Farklı dosya sistemine taşımayı taklit eder: yeniden adlandırma EXDEV verir."""
+    def cross_device(*_args, **_kwargs):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(settings_ui.os, "rename", cross_device)
+    monkeypatch.setattr(settings_ui, "_rename_tree", cross_device)
+
+
+def test_move_to_new_directory(handler, src_tree, tmp_path):
+    expected = _files(src_tree)
+    dest = tmp_path / "dest"
+
+    handler._move_directory_contents(str(src_tree), str(dest))
+
+    assert not src_tree.exists()
+    assert _files(dest) == expected
+
+
+def test_move_merges_into_existing_directory(handler, src_tree, tmp_path):
+    dest = tmp_path / "dest"
+    (dest / "matches" / "17").mkdir(parents=True)
+    (dest / "matches" / "17" / "old.json").write_text("{}", encoding="utf-8")
+
+    handler._move_directory_contents(str(src_tree), str(dest))
+
+    assert not src_tree.exists()
+    assert _files(dest) == sorted([
+        os.path.join("matches", "17", "2024", "round_1.json"),
+        os.path.join("matches", "17", "old.json"),
+        os.path.join("seasons", "17_seasons.json"),
+    ])
+
+
+def test_move_across_devices_copies_then_removes_source(handler, src_tree, tmp_path, monkeypatch):
+    expected = _files(src_tree)
+    dest = tmp_path / "dest"
+    _force_copy_path(monkeypatch)
+
+    handler._move_directory_contents(str(src_tree), str(dest))
+
+    assert not src_tree.exists()
+    assert _files(dest) == expected
+    assert (dest / "matches" / "17" / "2024" / "round_1.json").read_text(encoding="utf-8") == "[1, 2, 3]"
+
+
+def test_copy_failure_keeps_source(handler, src_tree, tmp_path, monkeypatch):
+    expected = _files(src_tree)
+    _force_copy_path(monkeypatch)
+
+    def failing_copy(src, dst):
+        raise OSError(errno.ENOSPC, "No space left on device", dst)
+
+    monkeypatch.setattr(settings_ui, "_fast_copy_file", failing_copy)
+
+    with pytest.raises(OSError):
+        handler._move_directory_contents(str(src_tree), str(tmp_path / "dest"))
+
+    assert _files(src_tree) == expected
+
+
+def test_incomplete_copy_keeps_source(handler, src_tree, tmp_path, monkeypatch):
+    expected = _files(src_tree)
+    _force_copy_path(monkeypatch)
+
+    def truncating_copy(src, dst):
+        with open(dst, "wb"):
+            pass
+        return dst
+
+    monkeypatch.setattr(settings_ui, "_fast_copy_file", truncating_copy)
+
+    with pytest.raises(OSError):
+        handler._move_directory_contents(str(src_tree), str(tmp_path / "dest"))
+
+    assert _files(src_tree) == expected
+
+
+@pytest.mark.parametrize("dest_name", ["src", os.path.join("src", "inner")])
+def test_nested_or_same_directory_is_refused(handler, src_tree, tmp_path, dest_name):
+    expected = _files(src_tree)
+
+    with pytest.raises(ValueError):
+        handler._move_directory_contents(str(src_tree), str(tmp_path / dest_name))
+
+    assert _files(src_tree) == expected
+
+
+def test_missing_source_is_ignored(handler, tmp_path):
+    handler._move_directory_contents(str(tmp_path / "missing"), str(tmp_path / "dest"))
+
+    assert not (tmp_path / "dest").exists()